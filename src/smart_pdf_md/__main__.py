@@ -3,7 +3,11 @@
 Use absolute imports so freezing (PyInstaller) works without package context.
 """
 
+import multiprocessing
+
 from smart_pdf_md.cli import main
 
 if __name__ == "__main__":  # pragma: no cover
+    # Required for spawn-based worker pools in frozen (PyInstaller) binaries
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -6,11 +6,23 @@ Invoked via the console script `smart-pdf-md` or as a module with
 
 from __future__ import annotations
 
+import functools
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import argparse
 
-from .core import iter_input_files, process_one, log, set_config
+from . import core
+from .core import (
+    iter_input_files,
+    log,
+    probe_pdf,
+    process_many,
+    process_one,
+    resume_hit,
+    set_config,
+    uses_marker_subprocess,
+)
 from . import __version__
 
 
@@ -335,10 +347,28 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "-x", "--retries", type=int, dest="retries", help="Retries for marker subprocess"
     )
+    p.add_argument(
+        "-W",
+        "--marker-worker",
+        action="store_true",
+        dest="marker_worker",
+        help="Keep one Marker process with models loaded for all slices/files",
+    )
     # Resume/skip existing
     p.add_argument(
         "-R", "--resume", action="store_true", help="Skip PDFs whose outputs already exist"
     )
+    # Batch parallelism
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        dest="jobs",
+        help=(
+            "Worker processes for multi-file batches (0 = CPUs, max 6; default 1 when "
+            "Marker may run, i.e. auto/marker mode; marker mode forces 1)"
+        ),
+    )
     # First-run checklist
     p.add_argument(
         "-D",
@@ -355,6 +385,50 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+def _run_sequential(files: list[Path], slice_pages: int) -> dict[int, int]:
+    """Process files in order, prefetching the next textual probe during Marker runs.
+
+    In auto mode the probe (PyMuPDF, in-process) and Marker (child process) are
+    independent, so the next file's probe runs in a helper thread while the current
+    file is converted by Marker.
+    """
+    results: dict[int, int] = {}
+    prefetch = core.MODE == "auto" and not core.ENGINE and not core.DRY_RUN and len(files) > 1
+    with ThreadPoolExecutor(max_workers=1) as probe_pool:
+        pending: Future[tuple[bool, int | None]] | None = None
+
+        def schedule_next(i: int, probe: tuple[bool, int | None]) -> None:
+            # Probe file i+1 while file i runs in a Marker child process
+            nonlocal pending
+            if i < len(files) and uses_marker_subprocess(probe[0]) and not resume_hit(files[i]):
+                pending = probe_pool.submit(probe_pdf, str(files[i]))
+
+        for i, f in enumerate(files, 1):
+            probe: tuple[bool, int | None] | None = None
+            on_probe = None
+            if prefetch and not resume_hit(f):
+                if pending is not None:
+                    try:
+                        probe = pending.result()
+                    except Exception:  # pragma: no cover - probe crash falls back to inline
+                        probe = None
+                    pending = None
+                if probe is not None:
+                    schedule_next(i, probe)
+                else:
+                    # process_one probes inline (sharing the open document with the
+                    # fast path) and reports back so the next probe can start
+                    on_probe = functools.partial(schedule_next, i)
+            try:
+                results[i] = process_one(
+                    f, i, len(files), slice_pages, probe=probe, on_probe=on_probe
+                )
+            except Exception as e:  # pragma: no cover - safety
+                log(f"[CRASH] {f}: {e!r}")
+                results[i] = 10
+    return results
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entry point; returns a conventional exit code."""
     parser = build_parser()
@@ -380,21 +454,38 @@ def main(argv: list[str] | None = None) -> int:
         "SMART_PDF_MD_OUTPUT_DIR",
         "SMART_PDF_MD_TEXT_MIN_CHARS",
         "SMART_PDF_MD_TEXT_MIN_RATIO",
+        "SMART_PDF_MD_TEXT_SAMPLE_PAGES",
+        "SMART_PDF_MD_TEXT_WORKERS",
+        "SMART_PDF_MD_DOCTR_BATCH",
+        "SMART_PDF_MD_EASYOCR_BATCH",
+        "SMART_PDF_MD_OCR_WORKERS",
+        "SMART_PDF_MD_OCR_DPI",
+        "SMART_PDF_MD_HTML2MD",
+        "SMART_PDF_MD_LAYOUT_PAGES",
+        "SMART_PDF_MD_CACHE",
+        "SMART_PDF_MD_TABLES_WORKERS",
         "SMART_PDF_MD_MOCK_FAIL_IF_SLICE_GT",
         "SMART_PDF_MD_DRY_RUN",
         "SMART_PDF_MD_LOG_LEVEL",
         "SMART_PDF_MD_PROGRESS",
+        "SMART_PDF_MD_RESUME",
         "SMART_PDF_MD_PYTHON",
         "SMART_PDF_MD_COVERAGE",
         "SMART_PDF_MD_ENGINE",
         "SMART_PDF_MD_ENGINE_TEXTUAL",
         "SMART_PDF_MD_ENGINE_NON_TEXTUAL",
         "SMART_PDF_MD_TABLES",
+        "SMART_PDF_MD_MARKER_WORKER",
+        "SMART_PDF_MD_MARKER_TIMEOUT",
+        "SMART_PDF_MD_MARKER_PAR",
         # Marker/Torch common envs
         "TORCH_DEVICE",
         "OCR_ENGINE",
         "PYTORCH_CUDA_ALLOC_CONF",
         "CUDA_VISIBLE_DEVICES",
+        "OMP_NUM_THREADS",
+        "MKL_NUM_THREADS",
+        "TOKENIZERS_PARALLELISM",
     }
 
     # Determine whether to warn on unknown env keys: default True, can be disabled
@@ -533,6 +624,13 @@ def main(argv: list[str] | None = None) -> int:
             if cfg.get("progress") is not None
             else None
         ),
+        resume=(
+            True
+            if ns.resume
+            else bool(cfg.get("resume"))
+            if cfg.get("resume") is not None
+            else None
+        ),
         output_format=(
             ns.output_format
             if ns.output_format
@@ -584,6 +682,14 @@ def main(argv: list[str] | None = None) -> int:
             if cfg.get("tables") is not None
             else None
         ),
+        marker_worker=(
+            True
+            if ns.marker_worker
+            else bool(cfg.get("marker_worker"))
+            if cfg.get("marker_worker") is not None
+            else None
+        ),
+        marker_timeout=ns.timeout if ns.timeout is not None else cfg.get("timeout"),
         tables_flavor=(
             ns.tables_mode.lower()
             if getattr(ns, "tables_mode", None)
@@ -597,15 +703,31 @@ def main(argv: list[str] | None = None) -> int:
     if not files:
         return 1
 
+    jobs_val = ns.jobs if ns.jobs is not None else cfg.get("jobs")
+    try:
+        jobs = int(str(jobs_val)) if jobs_val is not None else 0
+    except Exception:
+        log("[ERROR] invalid jobs value", level="ERROR")
+        return 2
+    # Marker owns the GPU and loads its models per process; running several Marker
+    # pipelines at once only contends for it, so batches that may reach Marker (auto
+    # mode routes scans there) default to one job, and marker mode always uses one
+    if jobs <= 0:
+        jobs = 1 if core.marker_reachable() else core.default_workers()
+    if core.MODE == "marker" or (core.ENGINE or "").lower() == "marker":
+        jobs = 1
+    jobs = min(jobs, len(files))
+
     t0 = time.perf_counter()
+    if jobs == 1:
+        results = _run_sequential(files, slice_pages)
+    else:
+        results = process_many(files, slice_pages, jobs)
+    # Aggregate in input order so the exit code does not depend on completion order
     fails = 0
     exit_code = 0
-    for i, f in enumerate(files, 1):
-        try:
-            rc = process_one(f, i, len(files), slice_pages)
-        except Exception as e:  # pragma: no cover - safety
-            log(f"[CRASH] {f}: {e!r}")
-            rc = 10
+    for i in sorted(results):
+        rc = results[i]
         if rc != 0:
             fails += 1
             if exit_code == 0:
@@ -50,7 +50,12 @@ def load_config_file(path: str | Path) -> Dict[str, Any]:
             raise ValueError("YAML config must be a mapping at the top level")
         return _normalize(data)
     if suf == ".json":
-        data = json.loads(p.read_text(encoding="utf-8"))
+        try:
+            import orjson  # optional: parses bytes directly, skipping the text decode
+        except ImportError:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        else:
+            data = orjson.loads(p.read_bytes())
         if not isinstance(data, dict):
             raise ValueError("JSON config must be an object at the top level")
         return _normalize(data)
@@ -7,13 +7,22 @@ docstrings and typed parameters for clarity.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import logging.handlers
 import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator
 
 FITZ_IMPORT_ERROR: Exception | None = None
 fitz: Any | None
@@ -28,6 +37,16 @@ except Exception as e:  # pragma: no cover - best effort
 
 LOWRES = 96
 HIGHRES = 120
+SLICE_GROW_AFTER = 3  # consecutive successful slices before doubling the slice again
+WRITE_BUFFER = 1 << 20  # bytes; output file buffer for streamed page text
+MAX_DEFAULT_WORKERS = 6  # PyMuPDF-bound pools stop scaling (and regress) beyond ~4-6
+TEXT_PARALLEL_MIN_PAGES = 50  # smallest document convert_text spreads over TEXT_WORKERS
+# The probe only counts glyphs: keep page clipping, skip ligature/whitespace preservation
+PROBE_TEXT_FLAGS = (fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_INHIBIT_SPACES) if fitz else 0
+# Same flags get_text("text") applies by default (no images, clipped to the mediabox)
+TEXT_FLAGS = fitz.TEXTFLAGS_TEXT if fitz else 0
+# Serializes PyMuPDF document access between the main thread and the probe prefetcher
+_FITZ_LOCK = threading.Lock()
 # Configurable globals (overridable via set_config)
 MODE = os.environ.get("SMART_PDF_MD_MODE", "auto").lower()
 ENGINE = os.environ.get("SMART_PDF_MD_ENGINE")
@@ -35,12 +54,15 @@ ENGINE_TEXTUAL = os.environ.get("SMART_PDF_MD_ENGINE_TEXTUAL")
 ENGINE_NON_TEXTUAL = os.environ.get("SMART_PDF_MD_ENGINE_NON_TEXTUAL")
 TABLES = os.environ.get("SMART_PDF_MD_TABLES", "0") == "1"
 TABLES_FLAVOR = os.environ.get("SMART_PDF_MD_TABLES_FLAVOR", "stream").lower()
+TABLES_WORKERS = int(os.environ.get("SMART_PDF_MD_TABLES_WORKERS", "0"))
 MOCK = os.environ.get("SMART_PDF_MD_MARKER_MOCK", "0") == "1"
 MOCK_FAIL = os.environ.get("SMART_PDF_MD_MARKER_MOCK_FAIL", "0") == "1"
 IMAGES = os.environ.get("SMART_PDF_MD_IMAGES", "0") == "1"
 OUTDIR = os.environ.get("SMART_PDF_MD_OUTPUT_DIR")
 MIN_CHARS = int(os.environ.get("SMART_PDF_MD_TEXT_MIN_CHARS", "10"))
 MIN_RATIO = float(os.environ.get("SMART_PDF_MD_TEXT_MIN_RATIO", "0.2"))
+TEXT_SAMPLE_PAGES = int(os.environ.get("SMART_PDF_MD_TEXT_SAMPLE_PAGES", "16"))
+TEXT_WORKERS = int(os.environ.get("SMART_PDF_MD_TEXT_WORKERS", "0"))
 MOCK_FAIL_IF_SLICE_GT = int(os.environ.get("SMART_PDF_MD_MOCK_FAIL_IF_SLICE_GT", "0"))
 DRY_RUN = os.environ.get("SMART_PDF_MD_DRY_RUN", "0") == "1"
 PROGRESS = os.environ.get("SMART_PDF_MD_PROGRESS", "0") == "1"
@@ -55,6 +77,17 @@ _LOG_LEVEL_NAME = os.environ.get("SMART_PDF_MD_LOG_LEVEL", "INFO").upper()
 LOG_LEVEL = _LEVELS.get(_LOG_LEVEL_NAME, 20)
 MARKER_TIMEOUT = int(os.environ.get("SMART_PDF_MD_MARKER_TIMEOUT", "0"))
 MARKER_RETRIES = int(os.environ.get("SMART_PDF_MD_MARKER_RETRIES", "0"))
+MARKER_WORKER = os.environ.get("SMART_PDF_MD_MARKER_WORKER", "0") == "1"
+DOCTR_BATCH = int(os.environ.get("SMART_PDF_MD_DOCTR_BATCH", "8"))
+LAYOUT_PAGES = os.environ.get("SMART_PDF_MD_LAYOUT_PAGES", "")
+CACHE_DIR = os.environ.get("SMART_PDF_MD_CACHE")
+EASYOCR_BATCH = int(os.environ.get("SMART_PDF_MD_EASYOCR_BATCH", "4"))
+# Concurrent OCR pages; each gets CPUs/workers Torch threads (easyocr) or a single
+# OpenMP thread (kraken), so the cores are split rather than oversubscribed
+OCR_WORKERS = int(os.environ.get("SMART_PDF_MD_OCR_WORKERS", "0"))
+MARKER_PAR = int(os.environ.get("SMART_PDF_MD_MARKER_PAR", "1"))
+OCR_DPI = int(os.environ.get("SMART_PDF_MD_OCR_DPI", "150"))
+HTML2MD = os.environ.get("SMART_PDF_MD_HTML2MD", "markdownify").lower()
 
 
 def set_config(
@@ -64,12 +97,14 @@ def set_config(
     outdir: str | None = None,
     min_chars: int | None = None,
     min_ratio: float | None = None,
+    text_workers: int | None = None,
     mock: bool | None = None,
     mock_fail: bool | None = None,
     mock_fail_if_slice_gt: int | None = None,
     log_level: str | None = None,
     dry_run: bool | None = None,
     progress: bool | None = None,
+    resume: bool | None = None,
     output_format: str | None = None,
     engine: str | None = None,
     engine_textual: str | None = None,
@@ -80,6 +115,8 @@ def set_config(
     exclude: list[str] | None = None,
     log_json: bool | None = None,
     log_file: str | None = None,
+    marker_worker: bool | None = None,
+    marker_timeout: int | None = None,
 ) -> None:
     """Override runtime configuration values in memory.
 
@@ -91,12 +128,14 @@ def set_config(
         OUTDIR, \
         MIN_CHARS, \
         MIN_RATIO, \
+        TEXT_WORKERS, \
         MOCK, \
         MOCK_FAIL, \
         MOCK_FAIL_IF_SLICE_GT, \
         LOG_LEVEL, \
         DRY_RUN, \
         PROGRESS, \
+        RESUME, \
         OUTPUT_FORMAT, \
         INCLUDE, \
         EXCLUDE, \
@@ -106,9 +145,11 @@ def set_config(
         ENGINE_TEXTUAL, \
         ENGINE_NON_TEXTUAL, \
         TABLES, \
-        TABLES_FLAVOR
+        TABLES_FLAVOR, \
+        MARKER_WORKER, \
+        MARKER_TIMEOUT
     if mode is not None:
-        MODE = mode
+        MODE = str(mode).lower()
     if images is not None:
         IMAGES = images
     if outdir is not None:
@@ -117,6 +158,8 @@ def set_config(
         MIN_CHARS = int(min_chars)
     if min_ratio is not None:
         MIN_RATIO = float(min_ratio)
+    if text_workers is not None:
+        TEXT_WORKERS = int(text_workers)
     if mock is not None:
         MOCK = mock
     if mock_fail is not None:
@@ -131,6 +174,8 @@ def set_config(
         DRY_RUN = bool(dry_run)
     if progress is not None:
         PROGRESS = bool(progress)
+    if resume is not None:
+        RESUME = bool(resume)
     if output_format is not None:
         OUTPUT_FORMAT = str(output_format).lower()
     if engine is not None:
@@ -151,67 +196,262 @@ def set_config(
         LOG_JSON = bool(log_json)
     if log_file is not None:
         LOG_FILE = log_file
+    if marker_worker is not None:
+        MARKER_WORKER = bool(marker_worker)
+    if marker_timeout is not None:
+        MARKER_TIMEOUT = int(marker_timeout)
+
+
+# Module globals that make up the runtime configuration shipped to worker processes
+_CONFIG_KEYS = (
+    "MODE",
+    "IMAGES",
+    "OUTDIR",
+    "MIN_CHARS",
+    "MIN_RATIO",
+    "TEXT_SAMPLE_PAGES",
+    "TEXT_WORKERS",
+    "MOCK",
+    "MOCK_FAIL",
+    "MOCK_FAIL_IF_SLICE_GT",
+    "LOG_LEVEL",
+    "DRY_RUN",
+    "PROGRESS",
+    "RESUME",
+    "OUTPUT_FORMAT",
+    "INCLUDE",
+    "EXCLUDE",
+    "LOG_JSON",
+    "LOG_FILE",
+    "ENGINE",
+    "ENGINE_TEXTUAL",
+    "ENGINE_NON_TEXTUAL",
+    "TABLES",
+    "TABLES_FLAVOR",
+    "TABLES_WORKERS",
+    "MARKER_TIMEOUT",
+    "MARKER_RETRIES",
+    "MARKER_WORKER",
+    "LAYOUT_PAGES",
+    "CACHE_DIR",
+    "OCR_WORKERS",
+    "MARKER_PAR",
+    "OCR_DPI",
+    "HTML2MD",
+)
+
+
+def config_snapshot() -> dict[str, Any]:
+    """Return the current runtime configuration as a picklable mapping."""
+    g = globals()
+    return {k: g[k] for k in _CONFIG_KEYS}
+
+
+def restore_config(snapshot: dict[str, Any]) -> None:
+    """Apply a mapping produced by `config_snapshot` (e.g., in a pool worker).
+
+    Worker processes started with the `spawn` method (Windows/macOS) re-import this
+    module and would otherwise only see environment defaults, not CLI overrides.
+    """
+    g = globals()
+    for k, v in snapshot.items():
+        if k in _CONFIG_KEYS:
+            g[k] = v
 
 
-def _maybe_rotate_log_file(path: Path, max_bytes: int = 1_000_000) -> None:
-    try:
-        if path.exists() and path.stat().st_size > max_bytes:
-            backup = path.with_suffix(path.suffix + ".1")
-            try:
-                backup.unlink()
-            except Exception:
-                pass
-            path.replace(backup)
-    except Exception:
+LOG_FILE_MAX_BYTES = 1_000_000  # LOG_FILE rolls over to "<name>.1" past this size
+LOG_FILE_BUFFER = 1 << 16  # bytes; LOG_FILE is flushed on WARNING+ or when full
+LOG_FILE_ROLLOVER_CHECK = 256  # records between LOG_FILE size checks
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that always writes to the current `sys.stdout`.
+
+    Resolving the stream at emit time keeps redirection (tests, frozen consoles)
+    working; the handler flushes once per record, i.e. line buffering.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(sys.stdout)
+
+    @property  # type: ignore[override]
+    def stream(self) -> Any:
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value: Any) -> None:
         pass
 
 
-def log(msg: str, level: str = "INFO") -> None:
-    """Print a single-line message at a given level if above threshold.
+class _LogFileHandler(logging.handlers.RotatingFileHandler):
+    """Buffered, size-rotated LOG_FILE mirror; write errors are ignored like before.
 
-    Emits plain text by default; when LOG_JSON is enabled, emits a JSON line and
-    mirrors output to LOG_FILE if configured.
+    Records are written through a `LOG_FILE_BUFFER` sized buffer and flushed only on
+    WARNING and above, so routine progress lines do not cost a write each. The size
+    check (which seeks, and therefore flushes) runs every `LOG_FILE_ROLLOVER_CHECK`
+    records, starting with the first.
     """
-    lv = _LEVELS.get(str(level).upper(), 20)
-    if lv < LOG_LEVEL:
-        return
-    out = msg
-    if LOG_JSON:
-        import json as _json
-        from datetime import datetime, timezone
 
-        out = _json.dumps(
-            {
-                "ts": datetime.now(timezone.utc).isoformat(),
-                "level": level.upper(),
-                "message": msg,
-            },
-            ensure_ascii=False,
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._until_check = 0
+
+    def _open(self) -> Any:
+        return open(  # noqa: SIM115
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_FILE_BUFFER,
+            encoding=self.encoding,
+            errors=self.errors,
         )
-    print(out, flush=True)
-    if LOG_FILE:
-        p = Path(LOG_FILE)
-        _maybe_rotate_log_file(p)
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:  # noqa: N802
+        if self._until_check > 0:
+            self._until_check -= 1
+            return 0
+        self._until_check = LOG_FILE_ROLLOVER_CHECK - 1
+        return super().shouldRollover(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
         try:
-            with p.open("a", encoding="utf-8") as fh:
-                fh.write(out + "\n")
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
         except Exception:
-            pass
+            self.handleError(record)
+
+    def handleError(self, record: logging.LogRecord) -> None:  # noqa: N802
+        pass
+
+
+# json.dumps(..., ensure_ascii=False) builds a new JSONEncoder per call; bind one once
+_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+
+
+class _JsonFormatter(logging.Formatter):
+    """Format records as `{"ts", "level", "message"}` JSON lines."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return _JSON_ENCODE(
+            {
+                "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+                "level": record.levelname,
+                "message": record.getMessage(),
+            }
+        )
+
+
+_LOGGER = logging.getLogger("smart_pdf_md")
+_LOGGER.setLevel(logging.DEBUG)  # threshold is applied in log() via LOG_LEVEL
+_LOGGER.propagate = False
+# (LOG_JSON, LOG_FILE) the handlers were last built for
+_LOG_STATE: tuple[bool, str | None] | None = None
+# In pool workers: queue to the parent, which alone writes LOG_FILE (see process_many)
+_LOG_QUEUE: Any | None = None
+
+
+def _configure_log_handlers() -> None:
+    """(Re)build the stdout and LOG_FILE handlers for the current LOG_JSON/LOG_FILE."""
+    global _LOG_STATE
+    for h in list(_LOGGER.handlers):
+        _LOGGER.removeHandler(h)
+        h.close()
+    fmt = _JsonFormatter() if LOG_JSON else logging.Formatter("%(message)s")
+    _LOGGER.addHandler(_StdoutHandler())
+    if LOG_FILE and _LOG_QUEUE is not None:
+        # Unformatted: the parent's file handler applies the formatter
+        _LOGGER.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+    elif LOG_FILE:
+        _LOGGER.addHandler(
+            _LogFileHandler(
+                LOG_FILE,
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=1,
+                encoding="utf-8",
+                delay=True,
+            )
+        )
+    for h in _LOGGER.handlers:
+        if not isinstance(h, logging.handlers.QueueHandler):
+            h.setFormatter(fmt)
+    _LOG_STATE = (LOG_JSON, LOG_FILE)
+
+
+def _flush_log() -> None:
+    """Flush buffered log output (pool workers exit without running `atexit`)."""
+    for h in _LOGGER.handlers:
+        h.flush()
+
+
+def _init_pool_worker(snapshot: dict[str, Any], log_queue: Any | None) -> None:
+    """`process_many` worker initializer: apply the parent's config and log queue."""
+    global _LOG_QUEUE
+    restore_config(snapshot)
+    _LOG_QUEUE = log_queue
+
+
+def _log_file_handler() -> logging.Handler | None:
+    """The parent's LOG_FILE handler (built on demand), or None without LOG_FILE."""
+    if (LOG_JSON, LOG_FILE) != _LOG_STATE:
+        _configure_log_handlers()
+    return next((h for h in _LOGGER.handlers if isinstance(h, _LogFileHandler)), None)
+
+
+def log(msg: str, level: str = "INFO", *, args: tuple[Any, ...] = ()) -> None:
+    """Print a single-line message at a given level if above threshold.
+
+    `args` are %-interpolated into `msg` only when the message is emitted, so hot
+    paths can skip formatting for filtered levels. Emits plain text by default; when
+    LOG_JSON is enabled, emits a JSON line. Output is mirrored to LOG_FILE
+    (size-rotated) if configured.
+    """
+    # Callers pass upper-case names; only normalize the odd one that does not match
+    lv = _LEVELS.get(level) or _LEVELS.get(str(level).upper(), 20)
+    if lv < LOG_LEVEL:
+        return
+    if (LOG_JSON, LOG_FILE) != _LOG_STATE:
+        _configure_log_handlers()
+    if args:
+        msg = msg % args
+    _LOGGER.log(lv, msg)
+
+
+def _log_cmd(cmd: list[str]) -> None:
+    """Log a command line at INFO, joining argv only when the line will be emitted."""
+    if LOG_LEVEL <= _LEVELS["INFO"]:
+        log("[RUN  ] %s", args=(" ".join(cmd),))
+
+
+def _output_ext() -> str:
+    """Return the file extension for text outputs under the current OUTPUT_FORMAT."""
+    return ".txt" if OUTPUT_FORMAT == "txt" else ".md"
 
 
 def mock_write_markdown(pdf: str, outdir: str | Path, note: str) -> int:
     """Write a small mock Markdown file for test/mocked runs and return 0."""
     out_path = Path(outdir) / (Path(pdf).stem + ".md")
-    prev = out_path.read_text(encoding="utf-8") if out_path.exists() else ""
     text = f"# MOCK MARKER OUTPUT\n{note}\nSource: {pdf}\n"
-    out_path.write_text(prev + ("\n\n" if prev else "") + text, encoding="utf-8")
+    # One O_APPEND write per call: linear in output size, and concurrent writers never
+    # interleave; the separator depends on the size seen through the same descriptor
+    fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        sep = "\n\n" if os.fstat(fd).st_size > 0 else ""
+        os.write(fd, (sep + text).encode("utf-8"))
+    finally:
+        os.close(fd)
     return 0
 
 
+@functools.lru_cache(maxsize=1)
 def which_marker_single() -> list[str]:
     """Return command to invoke marker's single-file converter.
 
     Prefers the `marker_single` executable; falls back to `python -m marker...`.
+    The lookup is cached for the process lifetime; callers must not mutate the list.
     """
     p = shutil.which("marker_single")
     if p:
@@ -237,6 +477,20 @@ def which_marker_single() -> list[str]:
     return [sys.executable, "-m", "marker.scripts.convert_single"]
 
 
+def _release_fitz_store() -> None:
+    """Empty MuPDF's global resource store (fonts, images) between documents.
+
+    The store is shared process-wide and otherwise keeps growing over long batches.
+    """
+    if not fitz:
+        return
+    with _FITZ_LOCK:
+        try:
+            fitz.TOOLS.store_shrink(100)
+        except Exception:  # pragma: no cover - best effort
+            pass
+
+
 def try_open(pdf: str):
     """Best-effort open of a PDF via PyMuPDF; returns None on failure."""
     if not fitz:
@@ -249,68 +503,429 @@ def try_open(pdf: str):
         return None
 
 
+# str.translate table deleting every whitespace code point (all lie at or below U+3000)
+_WS_DELETE = {c: None for c in range(0x3001) if chr(c).isspace()}
+
+# Page counts keyed by (path, mtime_ns) so a file is not re-parsed just to count pages
+_PAGE_COUNTS: dict[tuple[str, int], int] = {}
+
+
+def _page_count_key(pdf: str) -> tuple[str, int] | None:
+    try:
+        return (os.path.abspath(pdf), os.stat(pdf).st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _remember_page_count(pdf: str, count: int) -> None:
+    key = _page_count_key(pdf)
+    if key is not None:
+        _PAGE_COUNTS[key] = count
+
+
+def _page_count(pdf: str) -> int | None:
+    """Page count from the probe cache, else from a (locked) PyMuPDF open; None if unknown."""
+    key = _page_count_key(pdf)
+    total = _PAGE_COUNTS.get(key) if key else None
+    if total is None:
+        with _FITZ_LOCK:
+            doc = try_open(pdf)
+            total = len(doc) if doc else None
+            if doc:
+                doc.close()
+        if total is not None:
+            _remember_page_count(pdf, total)
+    return total
+
+
+# SHA-256 digests keyed like _PAGE_COUNTS, so each PDF is read for hashing at most once
+_FINGERPRINTS: dict[tuple[str, int], str] = {}
+
+
+def _fingerprint(pdf: str) -> str | None:
+    """Hex SHA-256 of the PDF bytes (streamed), memoized per path and mtime."""
+    key = _page_count_key(pdf)
+    if key is None:
+        return None
+    digest = _FINGERPRINTS.get(key)
+    if digest is None:
+        try:
+            with open(pdf, "rb") as fh:
+                digest = hashlib.file_digest(fh, "sha256").hexdigest()
+        except OSError:
+            return None
+        _FINGERPRINTS[key] = digest
+    return digest
+
+
+def _sample_page_indices(total: int, sample: int) -> list[int]:
+    """Return up to `sample` evenly spaced page indices covering first and last page."""
+    if sample <= 0 or total <= sample:
+        return list(range(total))
+    if sample == 1:
+        return [0]
+    step = (total - 1) / (sample - 1)
+    return [round(i * step) for i in range(sample)]
+
+
+def _has_pdf_header(pdf: str) -> bool:
+    """Return True if `%PDF-` occurs in the first 1 KiB (where readers accept it)."""
+    try:
+        with open(pdf, "rb") as fh:
+            return b"%PDF-" in fh.read(1024)
+    except OSError:
+        return False
+
+
+def _page_text_chars(page: Any, limit: int) -> int:
+    """Count non-whitespace characters in a page's text blocks, stopping at `limit`."""
+    n = 0
+    # Blocks are (x0, y0, x1, y1, text, block_no, block_type); type 1 is an image
+    for block in page.get_text("blocks", flags=PROBE_TEXT_FLAGS):
+        if block[6] == 0:
+            n += len(block[4].translate(_WS_DELETE))
+            if n >= limit:
+                break
+    return n
+
+
+def _probe_doc(doc: Any, pdf: str, min_chars_per_page: int, min_ratio: float, sample: int) -> bool:
+    """Textual verdict for an open document (caller holds `_FITZ_LOCK`)."""
+    total = len(doc)
+    _remember_page_count(pdf, total)
+    if total == 0:
+        return False
+    indices = _sample_page_indices(total, sample)
+    need = min_ratio * len(indices)
+    text_pages = 0
+    remaining = len(indices)
+    for i in indices:
+        if text_pages >= need:
+            return True
+        if text_pages + remaining < need:
+            return False
+        remaining -= 1
+        if _page_text_chars(doc[i], min_chars_per_page) >= min_chars_per_page:
+            text_pages += 1
+    return text_pages >= need
+
+
+def _probe_cache_path(
+    pdf: str, min_chars_per_page: int, min_ratio: float, sample: int
+) -> Path | None:
+    """Verdict file for `pdf` under `CACHE_DIR` and the given thresholds (None if disabled)."""
+    if not CACHE_DIR:
+        return None
+    digest = _fingerprint(pdf)
+    if digest is None:
+        return None
+    return Path(CACHE_DIR) / "probe" / f"{digest}-{min_chars_per_page}-{min_ratio}-{sample}"
+
+
+def _read_cached_probe(path: Path, pdf: str) -> tuple[bool, int] | None:
+    try:
+        flag, count = path.read_text(encoding="ascii").split()
+        probe = (flag == "1", int(count))
+    except (OSError, ValueError):
+        return None
+    _remember_page_count(pdf, probe[1])
+    return probe
+
+
+def _store_probe(path: Path, probe: tuple[bool, int | None]) -> None:
+    if probe[1] is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(f"{path.name}.{os.getpid()}.part")
+        part.write_text(f"{int(probe[0])} {probe[1]}", encoding="ascii")
+        os.replace(part, path)
+    except OSError as e:
+        log(f"[WARN ] probe cache write failed: {e!r}", level="WARNING")
+
+
+def _probe_open(
+    pdf: str, min_chars_per_page: int, min_ratio: float, sample: int
+) -> tuple[tuple[bool, int | None], Any | None]:
+    """Probe `pdf` and return `(probe, doc)` with the document left open (or None).
+
+    Lets `process_one` reuse the document for extraction; the caller closes it
+    under `_FITZ_LOCK`, since a prefetch thread may be using PyMuPDF meanwhile.
+    With `CACHE_DIR` set, verdicts are kept per content hash and thresholds, and a
+    hit returns without opening the PDF (doc is then None).
+    """
+    if not _has_pdf_header(pdf):
+        # Skip MuPDF's open/repair attempt on files that are not PDFs at all
+        log(f"[WARN ] not a PDF (no %PDF- header): {pdf}", level="WARNING")
+        return (False, None), None
+    cached = _probe_cache_path(pdf, min_chars_per_page, min_ratio, sample)
+    if cached is not None:
+        probe = _read_cached_probe(cached, pdf)
+        if probe is not None:
+            log(
+                "[cache] probe hit %s -> textual=%s",
+                args=(cached.name[:12], probe[0]),
+                level="DEBUG",
+            )
+            return probe, None
+        probe, doc = _probe_open_doc(pdf, min_chars_per_page, min_ratio, sample)
+        _store_probe(cached, probe)
+        return probe, doc
+    return _probe_open_doc(pdf, min_chars_per_page, min_ratio, sample)
+
+
+def _probe_open_doc(
+    pdf: str, min_chars_per_page: int, min_ratio: float, sample: int
+) -> tuple[tuple[bool, int | None], Any | None]:
+    # PyMuPDF is not thread-safe; the probe may run in a prefetch thread
+    with _FITZ_LOCK:
+        doc = try_open(pdf)
+        if not doc:
+            return (False, None), None
+        try:
+            textual = _probe_doc(doc, pdf, min_chars_per_page, min_ratio, sample)
+        except Exception:
+            doc.close()
+            raise
+        return (textual, len(doc)), doc
+
+
+def _close_doc(doc: Any) -> None:
+    with _FITZ_LOCK:
+        doc.close()
+
+
+def probe_pdf(
+    pdf: str,
+    min_chars_per_page: int | None = None,
+    min_ratio: float | None = None,
+    sample: int | None = None,
+) -> tuple[bool, int | None]:
+    """Return `(is_textual, page_count)` from a single open of the PDF.
+
+    Probes at most `sample` evenly spaced pages (0 = all pages) and stops as soon
+    as the textual ratio is guaranteed to pass or can no longer be reached. The page
+    count is None when the document cannot be opened.
+    """
+    probe, doc = _probe_open(
+        pdf,
+        MIN_CHARS if min_chars_per_page is None else min_chars_per_page,
+        MIN_RATIO if min_ratio is None else min_ratio,
+        TEXT_SAMPLE_PAGES if sample is None else sample,
+    )
+    if doc is not None:
+        _close_doc(doc)
+    return probe
+
+
 def is_textual(
-    pdf: str, min_chars_per_page: int | None = None, min_ratio: float | None = None
+    pdf: str,
+    min_chars_per_page: int | None = None,
+    min_ratio: float | None = None,
+    sample: int | None = None,
 ) -> bool:
-    """Heuristic to decide if a PDF likely contains real text pages."""
-    if min_chars_per_page is None:
-        min_chars_per_page = MIN_CHARS
-    if min_ratio is None:
-        min_ratio = MIN_RATIO
-    doc = try_open(pdf)
-    if not doc:
-        return False
+    """Heuristic to decide if a PDF likely contains real text pages (see `probe_pdf`)."""
+    return probe_pdf(pdf, min_chars_per_page, min_ratio, sample)[0]
+
+
+def _page_text(page: Any) -> str:
+    """Extract a page's plain text via a TextPage built with `TEXT_FLAGS`.
+
+    Equivalent to `page.get_text("text")` without the generic dispatch wrapper; the
+    TextPage is dropped as soon as the text is returned.
+    """
+    return page.get_textpage(flags=TEXT_FLAGS).extractText()
+
+
+def _extract_text_range(pdf: str, start: int, end: int) -> list[bytes]:
+    """Return UTF-8 text of pages `start..end-1` (runs in a `convert_text` worker)."""
+    doc = fitz.open(pdf)
     try:
-        total = len(doc)
-        if total == 0:
-            return False
-        text_pages = 0
-        for page in doc:
-            t = page.get_text("text")
-            if t and len("".join(t.split())) >= min_chars_per_page:
-                text_pages += 1
-        return (text_pages / total) >= min_ratio
+        return [_page_text(doc[i]).encode("utf-8") for i in range(start, end)]
     finally:
         doc.close()
 
 
-def convert_text(pdf: str, outdir: str | Path) -> int:
-    """Extract plain text from each page using PyMuPDF and write Markdown."""
+def _use_text_workers(total: int) -> bool:
+    """Return True when a `total`-page document should be spread over TEXT_WORKERS."""
+    return TEXT_WORKERS > 1 and total >= TEXT_PARALLEL_MIN_PAGES
+
+
+def _iter_page_text_parallel(
+    pdf: str, total: int, extract: Callable[[str, int, int], list[Any]]
+) -> Iterator[Any]:
+    """Yield page texts in order, extracted by TEXT_WORKERS spawned processes.
+
+    `extract(pdf, start, end)` must be a module-level function returning the texts of
+    pages `start..end-1`; each worker opens the PDF itself. Several ranges per worker
+    keep the pool busy when some pages are much heavier than others.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = TEXT_WORKERS
+    chunk = max(1, -(-total // (workers * 4)))
+    starts = list(range(0, total, chunk))
+    ends = [min(start + chunk, total) for start in starts]
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        for texts in pool.map(extract, [pdf] * len(starts), starts, ends):
+            yield from texts
+
+
+def convert_text(pdf: str, outdir: str | Path, *, doc: Any | None = None) -> int:
+    """Extract plain text from each page using PyMuPDF and write Markdown.
+
+    An already open `doc` (e.g., from the routing probe) is used as is and left open.
+    """
+    out_path = Path(outdir) / (Path(pdf).stem + _output_ext())
     if DRY_RUN:
-        out = Path(outdir) / (Path(pdf).stem + ".md")
-        log(f"[DRY  ] would write text to {out}")
+        log(f"[DRY  ] would write text to {out_path}")
         return 0
     if not fitz:
         log(f"[ERROR] PyMuPDF not installed: {FITZ_IMPORT_ERROR!r}", level="ERROR")
         return 1
     t0 = time.perf_counter()
-    doc = try_open(pdf)
-    if not doc:
-        return 1
+    owned = doc is None
+    if owned:
+        doc = try_open(pdf)
+        if not doc:
+            return 1
+    # Written via a '.part' file: a failure mid-document never leaves a truncated output
+    tmp = out_path.with_name(out_path.name + ".part")
     try:
         total = len(doc)
         last_pct = -1
-        stem = Path(pdf).stem
-        ext = ".txt" if OUTPUT_FORMAT == "txt" else ".md"
-        out_path = Path(outdir) / (stem + ext)
-        with out_path.open("w", encoding="utf-8") as fh:
-            for idx, p in enumerate(doc, 1):
-                text = p.get_text("text")
-                if idx > 1:
-                    fh.write("\n\n")
-                fh.write(text)
-                if PROGRESS and total > 0:
-                    pct = int((idx * 100) / total)
-                    if pct // 5 != last_pct // 5:
-                        log(f"[PROG ] text {idx}/{total} pages ({pct}%)")
-                        last_pct = pct
+        if total == 1:
+            # Single-page PDFs (forms, invoices) are common: one extraction, one write
+            tmp.write_bytes(_page_text(doc[0]).encode("utf-8"))
+        else:
+            # Stream pages as UTF-8 bytes (no TextIOWrapper newline translation); the
+            # large buffer keeps write() calls rare
+            if _use_text_workers(total):
+                pages = _iter_page_text_parallel(pdf, total, _extract_text_range)
+            else:
+                pages = (_page_text(p).encode("utf-8") for p in doc)
+            with tmp.open("wb", buffering=WRITE_BUFFER) as fh:
+                for idx, data in enumerate(pages, 1):
+                    if idx > 1:
+                        fh.write(b"\n\n")
+                    fh.write(data)
+                    if PROGRESS and total > 0:
+                        pct = int((idx * 100) / total)
+                        if pct // 5 != last_pct // 5:
+                            log("[PROG ] text %d/%d pages (%d%%)", args=(idx, total, pct))
+                            last_pct = pct
+        tmp.replace(out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
     finally:
-        doc.close()
-    out = Path(outdir) / (Path(pdf).stem + (".txt" if OUTPUT_FORMAT == "txt" else ".md"))
-    log(f"[TEXT ] {pdf} -> {out}  ({time.perf_counter() - t0:.2f}s)")
+        if owned:
+            doc.close()
+    log("[TEXT ] %s -> %s  (%.2fs)", args=(pdf, out_path, time.perf_counter() - t0))
+    return 0
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (affinity/cgroup-aware where the OS exposes it)."""
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:  # pragma: no cover - platform specific
+            pass
+    return os.cpu_count() or 1
+
+
+def default_workers() -> int:
+    """Default worker count for process pools: available CPUs, capped at 6."""
+    return min(available_cpus(), MAX_DEFAULT_WORKERS)
+
+
+def _marker_env() -> dict[str, str]:
+    """Environment for Marker child processes with thread pools sized to this machine.
+
+    Torch/MKL otherwise pick conservative defaults on CPU-only hosts; values already
+    set by the user (shell, config [env], or --env) take precedence.
+    """
+    env = os.environ.copy()
+    threads = str(max(1, available_cpus() // 2))
+    env.setdefault("OMP_NUM_THREADS", threads)
+    env.setdefault("MKL_NUM_THREADS", threads)
+    env.setdefault("TOKENIZERS_PARALLELISM", "true")
+    return env
+
+
+_MARKER_WORKER_PROC: Any | None = None
+_MARKER_WORKER_FAILED = False
+
+
+def _marker_via_worker(pdf: str, outdir: str | Path, page_range: str | None) -> int | None:
+    """Convert on the persistent Marker worker; None means use `marker_single` instead.
+
+    `page_range` None converts every page.
+    """
+    global _MARKER_WORKER_PROC, _MARKER_WORKER_FAILED
+    if not MARKER_WORKER or _MARKER_WORKER_FAILED or getattr(sys, "frozen", False):
+        return None
+    if _MARKER_WORKER_PROC is None:
+        from .marker_worker import MarkerWorker
+
+        try:
+            _MARKER_WORKER_PROC = MarkerWorker(env=_marker_env())
+        except Exception as e:
+            _MARKER_WORKER_FAILED = True
+            log(f"[WARN ] marker worker unavailable, using marker_single: {e!r}", level="WARNING")
+            return None
+        atexit.register(_MARKER_WORKER_PROC.close)
+    log("[RUN  ] marker worker %s pages=%s -> %s", args=(pdf, page_range or "all", outdir))
+    try:
+        ok, err = _MARKER_WORKER_PROC.convert(
+            pdf,
+            outdir,
+            page_range,
+            images=IMAGES,
+            lowres=LOWRES,
+            highres=HIGHRES,
+            timeout=MARKER_TIMEOUT or None,
+        )
+    except TimeoutError:
+        # The worker was killed mid-request; the next request starts a fresh one
+        _MARKER_WORKER_PROC.close()
+        _MARKER_WORKER_PROC = None
+        log("[WARN ] marker timed out after %ds", args=(MARKER_TIMEOUT,), level="WARNING")
+        return 124
+    except Exception as e:
+        # The worker died (e.g., out of memory); the next request starts a fresh one
+        _MARKER_WORKER_PROC.close()
+        _MARKER_WORKER_PROC = None
+        log(f"[WARN ] marker worker crashed: {e!r}", level="WARNING")
+        return 1
+    if not ok:
+        log(f"[WARN ] marker worker failed: {err}", level="WARNING")
+        return 1
     return 0
 
 
+def _marker_cmd(pdf: str, outdir: str | Path, page_range: str | None) -> list[str]:
+    """Build the `marker_single` argv for `page_range` of `pdf` (None = all pages)."""
+    return [
+        *which_marker_single(),
+        str(pdf),
+        "--output_format",
+        "markdown",
+        *(() if IMAGES else ("--disable_image_extraction",)),
+        *(("--page_range", page_range) if page_range else ()),
+        "--output_dir",
+        str(outdir),
+        "--lowres_image_dpi",
+        str(LOWRES),
+        "--highres_image_dpi",
+        str(HIGHRES),
+    ]
+
+
 def marker_single_pass(pdf: str, outdir: str | Path) -> int:
     """Execute marker once for all pages, or mock when enabled."""
     if DRY_RUN:
@@ -320,78 +935,262 @@ def marker_single_pass(pdf: str, outdir: str | Path) -> int:
         if MOCK_FAIL:
             return 1
         return mock_write_markdown(pdf, outdir, "mock marker single-pass")
-    ms = which_marker_single()
-    cmd = ms + [str(pdf), "--output_format", "markdown"]
-    if not IMAGES:
-        cmd += ["--disable_image_extraction"]
-    cmd += [
-        "--page_range",
-        "0-999999",
-        "--output_dir",
-        str(outdir),
-        "--lowres_image_dpi",
-        str(LOWRES),
-        "--highres_image_dpi",
-        str(HIGHRES),
-    ]
-    log(f"[RUN  ] {' '.join(cmd)}")
-    return subprocess.run(cmd).returncode  # noqa: S603
+    # Only reached when the page count is unknown: let Marker take every page
+    rc = _marker_via_worker(pdf, outdir, None)
+    if rc is not None:
+        return rc
+    cmd = _marker_cmd(pdf, outdir, None)
+    _log_cmd(cmd)
+    return _run_marker(cmd)
+
+
+def _run_marker(cmd: list[str]) -> int:
+    """Run a `marker_single` command, relaying its output into the log.
+
+    Output is piped and drained on a helper thread, so the parent never blocks on
+    console writes. A non-zero MARKER_TIMEOUT (seconds) kills a stuck run (rc 124)
+    together with any processes it started, which could otherwise keep the pipe open.
+    """
+    # Own process group/session, so a timeout can take the whole tree down
+    group: dict[str, Any] = (
+        {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        if sys.platform == "win32"
+        else {"start_new_session": True}
+    )
+    proc = subprocess.Popen(  # noqa: S603
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=_marker_env(),
+        bufsize=1 << 16,
+        **group,
+    )
+
+    def drain() -> None:
+        assert proc.stdout is not None
+        for raw in proc.stdout:
+            # Progress bars redraw with carriage returns; keep the final state
+            line = raw.rstrip().rsplit(b"\r", 1)[-1].decode("utf-8", "replace")
+            if line:
+                log("[mark ] %s", args=(line,))
+
+    reader = threading.Thread(target=drain, name="marker-output", daemon=True)
+    reader.start()
+    try:
+        rc = proc.wait(timeout=MARKER_TIMEOUT or None)
+    except subprocess.TimeoutExpired:
+        _kill_process_tree(proc)
+        log("[WARN ] marker timed out after %ds", args=(MARKER_TIMEOUT,), level="WARNING")
+        # The reader is a daemon; do not wait on a pipe some survivor may hold open
+        reader.join(timeout=5)
+        return 124
+    reader.join(timeout=MARKER_TIMEOUT or None)
+    return rc
+
+
+def _kill_process_tree(proc: subprocess.Popen[Any]) -> None:
+    """Kill `proc` and everything in its process group (started by `_run_marker`)."""
+    if sys.platform == "win32":
+        subprocess.run(  # noqa: S603
+            ["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True
+        )
+    else:
+        import signal
+
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+    proc.kill()
+    proc.wait()
 
 
+@functools.cache
 def _ensure_exec(name: str) -> str | None:
-    """Return executable path if found in PATH, else None."""
+    """Return executable path if found in PATH, else None (resolved once per name).
+
+    "Not found" is cached too: a tool installed while the process runs is only seen
+    after `_ensure_exec.cache_clear()`.
+    """
     from shutil import which
 
     return which(name)
 
 
+_MD_INLINE = {"b": "**", "strong": "**", "i": "*", "em": "*", "code": "`"}
+_MD_BLOCKS = frozenset({"p", "div", "blockquote", "pre", "table", "ul", "ol"})
+_MD_SKIP = frozenset({"head", "title", "style", "script"})
+_WS_RUN = re.compile(r"[ \t\r\n\f]+")
+
+
+def _html_to_markdown(html: str) -> str:
+    """Convert (pdftohtml-style) HTML to Markdown with a single lxml tree walk.
+
+    Handles headings, paragraphs/blocks, line breaks, rules, list items, emphasis and
+    links; head/style/script subtrees are skipped. Text is accumulated into a list
+    and joined once. Simpler than markdownify: no escaping of Markdown characters,
+    no tables, images or nested lists, and `<pre>` whitespace is collapsed, so it is
+    only used on request (`SMART_PDF_MD_HTML2MD=lxml`) or without markdownify.
+    """
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    root = lxml_html.fromstring(html)
+    parts: list[str] = []
+    walker = etree.iterwalk(root, events=("start", "end"))
+    for event, el in walker:
+        tag = el.tag if isinstance(el.tag, str) else ""
+        if event == "start":
+            if tag in _MD_SKIP:
+                walker.skip_subtree()  # its "end" event still follows (emits the tail)
+                continue
+            if len(tag) == 2 and tag[0] == "h" and tag[1] in "123456":
+                parts.append("\n\n" + "#" * int(tag[1]) + " ")
+            elif tag in _MD_BLOCKS:
+                parts.append("\n\n")
+            elif tag == "br":
+                parts.append("  \n")  # hard line break
+            elif tag == "hr":
+                parts.append("\n\n---\n\n")
+            elif tag == "li":
+                parts.append("\n- ")
+            elif tag in _MD_INLINE:
+                parts.append(_MD_INLINE[tag])
+            elif tag == "a" and el.get("href"):
+                parts.append("[")
+            if el.text and tag:
+                parts.append(_WS_RUN.sub(" ", el.text))
+            continue
+        if (len(tag) == 2 and tag[0] == "h" and tag[1] in "123456") or tag in _MD_BLOCKS:
+            parts.append("\n\n")
+        elif tag in _MD_INLINE:
+            parts.append(_MD_INLINE[tag])
+        elif tag == "a" and el.get("href"):
+            parts.append(f"]({el.get('href')})")
+        if el.tail and el is not root:
+            parts.append(_WS_RUN.sub(" ", el.tail))
+    md = re.sub(r"\n[ \t]+", "\n", "".join(parts))
+    return re.sub(r"\n{3,}", "\n\n", md).strip() + "\n"
+
+
+def _html2md_converter() -> Any | None:
+    """HTML -> Markdown function per HTML2MD: markdownify unless 'lxml' is requested."""
+    if HTML2MD != "lxml":
+        try:
+            import markdownify
+
+            return functools.partial(markdownify.markdownify, heading_style="ATX")
+        except ImportError:
+            pass
+    try:
+        from lxml import html as lxml_html  # noqa: F401
+    except ImportError:
+        return None
+    if HTML2MD != "lxml":
+        log(
+            "[WARN ] markdownify not installed; using the simplified lxml converter",
+            level="WARNING",
+        )
+    return _html_to_markdown
+
+
 def convert_via_poppler(pdf: str, outdir: str | Path) -> int:
-    """Convert using Poppler's pdftohtml and markdownify.
+    """Convert using Poppler's pdftohtml, then HTML -> Markdown.
 
-    Requires `pdftohtml` to be available on PATH and the Python package
-    `markdownify` (optional extra). Falls back with an error if missing.
+    Requires `pdftohtml` to be available on PATH and `markdownify` (optional extras).
+    `SMART_PDF_MD_HTML2MD=lxml` selects the faster, simpler `_html_to_markdown`
+    instead, which is also the fallback when only `lxml` is installed.
     """
     exe = _ensure_exec("pdftohtml")
     if not exe:
         log("[ERROR] pdftohtml not found in PATH (install Poppler)", level="ERROR")
         return 4
-    try:
-        import markdownify
-    except Exception:
-        log("[ERROR] python package 'markdownify' not installed", level="ERROR")
+    to_md = _html2md_converter()
+    if to_md is None:
+        log("[ERROR] python package 'markdownify' (or 'lxml') not installed", level="ERROR")
         return 4
     import tempfile
 
     with tempfile.TemporaryDirectory() as td:
         html_path = Path(td) / "out.html"
         cmd = [exe, "-s", "-i", "-q", "-noframes", str(pdf), str(html_path)]
-        log(f"[RUN  ] {' '.join(cmd)}")
+        _log_cmd(cmd)
         rc = subprocess.run(cmd).returncode  # noqa: S603
         if rc != 0:
             log(f"[ERROR] pdftohtml rc={rc}", level="ERROR")
             return 4
         html = html_path.read_text(encoding="utf-8", errors="ignore")
-        md = markdownify.markdownify(html, heading_style="ATX")
+        md = to_md(html)
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text(md, encoding="utf-8")
-    log(f"[OK   ] poppler-html2md {pdf} -> {out}")
+    _write_text(out, md)
+    log("[OK   ] poppler-html2md %s -> %s", args=(pdf, out))
     return 0
 
 
 def convert_via_pdfminer(pdf: str, outdir: str | Path) -> int:
     """Convert using pdfminer.six high-level text extraction."""
     try:
-        from pdfminer.high_level import extract_text
+        import pdfminer.high_level  # noqa: F401
     except Exception:
         log("[ERROR] python package 'pdfminer.six' not installed", level="ERROR")
         return 4
-    text = extract_text(pdf) or ""
-    out = Path(outdir) / (Path(pdf).stem + (".txt" if OUTPUT_FORMAT == "txt" else ".md"))
-    out.write_text(text, encoding="utf-8")
-    log(f"[OK   ] pdfminer {pdf} -> {out}")
+    out = Path(outdir) / (Path(pdf).stem + _output_ext())
+    _pdfminer_to_file(pdf, out)
+    log("[OK   ] pdfminer %s -> %s", args=(pdf, out))
     return 0
 
 
+def _write_text(out: Path, text: str) -> None:
+    """Write a whole-document string to `out` like `_write_pages` (via a '.part' file)."""
+    _write_pages(out, (text,))
+
+
+def _pdfminer_to_file(pdf: str, out: Path) -> None:
+    """Stream pdfminer's text output for `pdf` straight into `out` (UTF-8).
+
+    Same output as `extract_text` (default LAParams), without holding the document
+    text in memory; written via a '.part' file like `_write_pages`.
+    """
+    from pdfminer.high_level import extract_text_to_fp
+    from pdfminer.layout import LAParams
+
+    tmp = out.with_name(out.name + ".part")
+    try:
+        with open(pdf, "rb") as src, tmp.open("wb", buffering=WRITE_BUFFER) as fh:
+            extract_text_to_fp(src, fh, output_type="text", codec="utf-8", laparams=LAParams())
+        tmp.replace(out)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _write_pages(out: Path, pages: Iterable[str], sep: bytes = b"\n\n") -> None:
+    """Stream page texts to `out` as UTF-8, separated by `sep` (a blank line).
+
+    Pages are written as they are produced instead of being joined in memory. The file
+    is written under a '.part' name and renamed at the end, so an extraction error
+    never leaves a truncated output that --resume would treat as done.
+    """
+    tmp = out.with_name(out.name + ".part")
+    try:
+        with tmp.open("wb", buffering=WRITE_BUFFER) as fh:
+            for idx, text in enumerate(pages):
+                if idx and sep:
+                    fh.write(sep)
+                fh.write(text.encode("utf-8"))
+        tmp.replace(out)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _pdfplumber_text_range(pdf: str, start: int, end: int) -> list[str]:
+    import pdfplumber
+
+    with pdfplumber.open(pdf, pages=list(range(start + 1, end + 1))) as doc:
+        return [page.extract_text() or "" for page in doc.pages]
+
+
 def convert_via_pdfplumber(pdf: str, outdir: str | Path) -> int:
     """Convert using pdfplumber page-wise text extraction."""
     try:
@@ -399,15 +1198,15 @@ def convert_via_pdfplumber(pdf: str, outdir: str | Path) -> int:
     except Exception:
         log("[ERROR] python package 'pdfplumber' not installed", level="ERROR")
         return 4
-    parts: list[str] = []
+    out = Path(outdir) / (Path(pdf).stem + _output_ext())
     with pdfplumber.open(pdf) as doc:
-        for page in doc.pages:
-            txt = page.extract_text() or ""
-            parts.append(txt)
-    text = "\n\n".join(parts)
-    out = Path(outdir) / (Path(pdf).stem + (".txt" if OUTPUT_FORMAT == "txt" else ".md"))
-    out.write_text(text, encoding="utf-8")
-    log(f"[OK   ] pdfplumber {pdf} -> {out}")
+        total = len(doc.pages)
+        if _use_text_workers(total):
+            pages = _iter_page_text_parallel(pdf, total, _pdfplumber_text_range)
+        else:
+            pages = (page.extract_text() or "" for page in doc.pages)
+        _write_pages(out, pages)
+    log("[OK   ] pdfplumber %s -> %s", args=(pdf, out))
     return 0
 
 
@@ -426,14 +1225,14 @@ def convert_via_ocrmypdf(pdf: str, outdir: str | Path) -> int:
     with tempfile.TemporaryDirectory() as td:
         ocr_pdf = Path(td) / "ocr.pdf"
         cmd = [exe, "--skip-text", "--quiet", str(pdf), str(ocr_pdf)]
-        log(f"[RUN  ] {' '.join(cmd)}")
+        _log_cmd(cmd)
         rc = subprocess.run(cmd).returncode  # noqa: S603
         if rc != 0 or not ocr_pdf.exists():
             log(f"[ERROR] ocrmypdf rc={rc}", level="ERROR")
             return 4
         rc = convert_text(str(ocr_pdf), str(outdir))
         if rc == 0:
-            ext = ".txt" if OUTPUT_FORMAT == "txt" else ".md"
+            ext = _output_ext()
             src = Path(outdir) / (ocr_pdf.stem + ext)
             dst = Path(outdir) / (Path(pdf).stem + ext)
             if src != dst:
@@ -444,6 +1243,25 @@ def convert_via_ocrmypdf(pdf: str, outdir: str | Path) -> int:
         return rc
 
 
+def _parse_page_spec(spec: str, total: int) -> list[int]:
+    """Sorted 0-based page indices for a 1-based spec like "1-10,20,30-" in a `total`-page
+    document; open-ended ranges run to the first/last page and indices past the end are
+    dropped. Raises ValueError on malformed parts.
+    """
+    pages: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, dash, last = part.partition("-")
+        start = int(first) if first.strip() else 1
+        end = (int(last) if last.strip() else total) if dash else start
+        if start < 1 or end < start:
+            raise ValueError(part)
+        pages.update(range(start - 1, min(end, total)))
+    return sorted(pages)
+
+
 def convert_via_layout(pdf: str, outdir: str | Path) -> int:
     """Convert using PyMuPDF4LLM to Markdown (layout-aware)."""
     try:
@@ -458,18 +1276,55 @@ def convert_via_layout(pdf: str, outdir: str | Path) -> int:
     if not doc:
         return 4
     try:
-        md = to_markdown(doc)
+        pages: list[int] | None = None
+        if LAYOUT_PAGES:
+            try:
+                pages = _parse_page_spec(LAYOUT_PAGES, len(doc))
+            except ValueError:
+                log(
+                    "[ERROR] invalid SMART_PDF_MD_LAYOUT_PAGES: %s",
+                    args=(LAYOUT_PAGES,),
+                    level="ERROR",
+                )
+                return 2
+            if not pages:
+                log("[SKIP ] no pages of %s selected by %s", args=(pdf, LAYOUT_PAGES))
+                return 0
+        # Layout analysis is per page: only the selected pages pay for it
+        md = to_markdown(doc) if pages is None else to_markdown(doc, pages=pages)
     finally:
         try:
             doc.close()
         except Exception:
             pass
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text(md, encoding="utf-8")
-    log(f"[OK   ] layout(PyMuPDF4LLM) {pdf} -> {out}")
+    _write_text(out, md)
+    log("[OK   ] layout(PyMuPDF4LLM) %s -> %s", args=(pdf, out))
     return 0
 
 
+def _camelot_frames(pdf: str, pages: str, flavor: str) -> list[Any]:
+    """DataFrames of the tables camelot finds on `pages` (runs in a table worker)."""
+    import camelot
+
+    return [t.df for t in camelot.read_pdf(pdf, pages=pages, flavor=flavor)]
+
+
+def _camelot_frames_parallel(pdf: str, total: int, flavor: str) -> list[Any]:
+    """Run camelot over contiguous page ranges in TABLES_WORKERS processes, in page order."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(TABLES_WORKERS, total)
+    chunk = -(-total // workers)
+    ranges = [f"{a}-{min(a + chunk - 1, total)}" for a in range(1, total + 1, chunk)]
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        results = pool.map(_camelot_frames, [pdf] * len(ranges), ranges, [flavor] * len(ranges))
+        return [df for frames in results for df in frames]
+
+
 def extract_tables_to_md(pdf: str, outdir: str | Path, *, flavor: str | None = None) -> None:
     """Best-effort table extraction to Markdown using camelot (stream).
 
@@ -485,9 +1340,12 @@ def extract_tables_to_md(pdf: str, outdir: str | Path, *, flavor: str | None = N
         return
     mode = (flavor or TABLES_FLAVOR or "stream").lower()
     tables = None
+    total = _page_count(pdf) if TABLES_WORKERS > 1 else None
 
-    def _read(fl: str):
-        return camelot.read_pdf(pdf, pages="all", flavor=fl)
+    def _read(fl: str) -> list[Any]:
+        if total and total > 1:
+            return _camelot_frames_parallel(pdf, total, fl)
+        return [t.df for t in camelot.read_pdf(pdf, pages="all", flavor=fl)]
 
     try:
         if mode == "auto":
@@ -503,22 +1361,34 @@ def extract_tables_to_md(pdf: str, outdir: str | Path, *, flavor: str | None = N
     except Exception as e:  # pragma: no cover - environment-dependent
         log(f"[WARN ] camelot.read_pdf({mode}) failed: {e!r}", level="WARNING")
         tables = None
-    if not tables or getattr(tables, "n", 0) == 0:
+    if not tables:
         log("[info ] no tables detected by camelot")
         return
     parts: list[str] = [f"# Tables extracted from {Path(pdf).name}"]
-    for i in range(getattr(tables, "n", 0)):
+    for i, df in enumerate(tables):  # pandas DataFrames
         try:
-            t = tables[i]
-            df = t.df  # pandas DataFrame
             md = df.to_markdown(index=False)
             parts.append(f"\n\n## Table {i + 1}\n\n{md}")
         except Exception:
             continue
     if len(parts) > 1:
         out = Path(outdir) / (Path(pdf).stem + ".tables.md")
-        out.write_text("".join(parts), encoding="utf-8")
-        log(f"[OK   ] tables -> {out}")
+        _write_pages(out, parts, sep=b"")
+        log("[OK   ] tables -> %s", args=(out,))
+
+
+def _pypdf_page_texts(reader: Any, indices: Iterable[int]) -> Iterator[str]:
+    for i in indices:
+        try:
+            yield reader.pages[i].extract_text() or ""
+        except Exception:
+            yield ""
+
+
+def _pypdf_text_range(pdf: str, start: int, end: int) -> list[str]:
+    from pypdf import PdfReader
+
+    return list(_pypdf_page_texts(PdfReader(pdf), range(start, end)))
 
 
 def convert_via_pypdf(pdf: str, outdir: str | Path) -> int:
@@ -532,17 +1402,15 @@ def convert_via_pypdf(pdf: str, outdir: str | Path) -> int:
     except Exception as e:
         log(f"[ERROR] pypdf cannot open: {e!r}", level="ERROR")
         return 4
-    texts: list[str] = []
-    for page in reader.pages:
-        try:
-            t = page.extract_text() or ""
-        except Exception:
-            t = ""
-        texts.append(t)
-    text = "\n\n".join(texts)
-    out = Path(outdir) / (Path(pdf).stem + (".txt" if OUTPUT_FORMAT == "txt" else ".md"))
-    out.write_text(text, encoding="utf-8")
-    log(f"[OK   ] pypdf {pdf} -> {out}")
+
+    total = len(reader.pages)
+    if _use_text_workers(total):
+        pages: Iterable[str] = _iter_page_text_parallel(pdf, total, _pypdf_text_range)
+    else:
+        pages = _pypdf_page_texts(reader, range(total))
+    out = Path(outdir) / (Path(pdf).stem + _output_ext())
+    _write_pages(out, pages)
+    log("[OK   ] pypdf %s -> %s", args=(pdf, out))
     return 0
 
 
@@ -557,24 +1425,24 @@ def convert_via_pypdfium2(pdf: str, outdir: str | Path) -> int:
     except Exception as e:
         log(f"[ERROR] pypdfium2 cannot open: {e!r}", level="ERROR")
         return 4
-    parts: list[str] = []
-    try:
+
+    def _texts() -> Iterator[str]:
         for i in range(len(doc)):
-            page = doc[i]
-            textpage = page.get_textpage()
+            textpage = doc[i].get_textpage()
             try:
-                txt = textpage.get_text_range(0, textpage.count_chars()) or ""
+                yield textpage.get_text_range(0, textpage.count_chars()) or ""
             except Exception:
-                txt = textpage.get_text_bounded() or ""  # fallback
-            parts.append(txt)
+                yield textpage.get_text_bounded() or ""  # fallback
+
+    out = Path(outdir) / (Path(pdf).stem + _output_ext())
+    try:
+        _write_pages(out, _texts())
     finally:
         try:
             doc.close()
         except Exception:
             pass
-    out = Path(outdir) / (Path(pdf).stem + (".txt" if OUTPUT_FORMAT == "txt" else ".md"))
-    out.write_text("\n\n".join(parts), encoding="utf-8")
-    log(f"[OK   ] pypdfium2 {pdf} -> {out}")
+    log("[OK   ] pypdfium2 %s -> %s", args=(pdf, out))
     return 0
 
 
@@ -591,18 +1459,30 @@ def convert_via_pytesseract(pdf: str, outdir: str | Path) -> int:
     except Exception as e:
         log(f"[ERROR] pdf2image failed: {e!r}", level="ERROR")
         return 4
-    parts: list[str] = []
-    for img in images:
-        try:
-            parts.append(pytesseract.image_to_string(img))
-        except Exception:
-            parts.append("")
+
+    def _texts() -> Iterator[str]:
+        for img in images:
+            try:
+                yield pytesseract.image_to_string(img)
+            except Exception:
+                yield ""
+
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text("\n\n".join(parts), encoding="utf-8")
-    log(f"[OK   ] pytesseract {pdf} -> {out}")
+    _write_pages(out, _texts())
+    log("[OK   ] pytesseract %s -> %s", args=(pdf, out))
     return 0
 
 
+def _doctr_lines(export: dict[str, Any]) -> list[str]:
+    """Flatten a doctr `Document.export()` dict into one string per text line."""
+    return [
+        " ".join(w.get("value", "") for w in (line.get("words", []) or []))
+        for page in export.get("pages", []) or []
+        for block in page.get("blocks", []) or []
+        for line in block.get("lines", []) or []
+    ]
+
+
 def convert_via_doctr(pdf: str, outdir: str | Path) -> int:
     try:
         from doctr.io import DocumentFile
@@ -610,25 +1490,27 @@ def convert_via_doctr(pdf: str, outdir: str | Path) -> int:
     except Exception:
         log("[ERROR] python package 'python-doctr' not installed", level="ERROR")
         return 4
+    from concurrent.futures import ThreadPoolExecutor
+
     try:
-        doc = DocumentFile.from_pdf(pdf)
+        pages = DocumentFile.from_pdf(pdf)
         model = ocr_predictor(pretrained=True)
-        result = model(doc)
-        # Export to Markdown-like text from dict
-        export = result.export()
-        blocks: list[str] = []
-        for page in export.get("pages", []) or []:
-            for block in page.get("blocks", []) or []:
-                for line in block.get("lines", []) or []:
-                    words = [w.get("value", "") for w in (line.get("words", []) or [])]
-                    blocks.append(" ".join(words))
-        text = "\n".join(blocks)
+        size = max(1, DOCTR_BATCH)
+        batches = [pages[i : i + size] for i in range(0, len(pages), size)]
+        lines: list[str] = []
+        # One inference in flight while this thread flattens the previous batch
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(model, batches[0]) if batches else None
+            for nxt in batches[1:] + [None]:
+                result = pending.result()
+                pending = pool.submit(model, nxt) if nxt is not None else None
+                lines.extend(_doctr_lines(result.export()))
     except Exception as e:  # pragma: no cover - heavy model
         log(f"[ERROR] doctr OCR failed: {e!r}", level="ERROR")
         return 4
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text(text, encoding="utf-8")
-    log(f"[OK   ] doctr {pdf} -> {out}")
+    _write_pages(out, lines, sep=b"\n")
+    log("[OK   ] doctr %s -> %s", args=(pdf, out))
     return 0
 
 
@@ -643,10 +1525,9 @@ def convert_via_unstructured(pdf: str, outdir: str | Path) -> int:
     except Exception as e:
         log(f"[ERROR] unstructured failed: {e!r}", level="ERROR")
         return 4
-    text = "\n\n".join([getattr(el, "text", "") or "" for el in elements])
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text(text, encoding="utf-8")
-    log(f"[OK   ] unstructured {pdf} -> {out}")
+    _write_pages(out, (getattr(el, "text", "") or "" for el in elements))
+    log("[OK   ] unstructured %s -> %s", args=(pdf, out))
     return 0
 
 
@@ -669,50 +1550,114 @@ def convert_via_tabula(pdf: str, outdir: str | Path) -> int:
         except Exception:
             continue
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text("".join(parts), encoding="utf-8")
-    log(f"[OK   ] tabula {pdf} -> {out}")
+    _write_pages(out, parts, sep=b"")
+    log("[OK   ] tabula %s -> %s", args=(pdf, out))
     return 0
 
 
+def _tei_paragraphs(events: Iterable[tuple[str, Any]]) -> list[str]:
+    """Collect `<p>` texts from ElementTree `iterparse` start/end events.
+
+    Elements are cleared once they end outside a paragraph, so memory stays bounded
+    by the largest paragraph rather than the whole TEI tree. Paragraphs use the root
+    element's namespace (TEI), or no namespace.
+    """
+    p_tag = None
+    depth = 0
+    paras: list[str] = []
+    for event, elem in events:
+        if p_tag is None:
+            p_tag = elem.tag.split("}")[0] + "}p" if "}" in elem.tag else "p"
+        if elem.tag == p_tag:
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            paras.append("".join(elem.itertext()).strip())
+            if depth:
+                continue
+        elif event == "start" or depth:
+            continue
+        elem.clear()
+    return paras
+
+
+_GROBID_SESSION: Any | None = None
+_GROBID_LOCK = threading.Lock()
+
+
+def _grobid_session() -> Any:
+    """Return the shared grobid HTTP session, keeping connections alive across PDFs.
+
+    Retries cover connection errors and the 502/503/504 grobid returns when busy.
+    """
+    global _GROBID_SESSION
+    with _GROBID_LOCK:
+        if _GROBID_SESSION is None:
+            _GROBID_SESSION = _new_grobid_session()
+    return _GROBID_SESSION
+
+
+def _new_grobid_session() -> Any:
+    import requests  # type: ignore[import-untyped]
+    from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    atexit.register(session.close)
+    return session
+
+
 def convert_via_grobid(pdf: str, outdir: str | Path) -> int:
     url = os.environ.get("GROBID_URL")
     if not url:
         log("[ERROR] set GROBID_URL to your grobid server base URL", level="ERROR")
         return 4
     try:
-        import requests  # type: ignore[import-untyped]
+        import requests  # type: ignore[import-untyped]  # noqa: F401
         import xml.etree.ElementTree as ET
     except Exception:
         log("[ERROR] python package 'requests' required for grobid engine", level="ERROR")
         return 4
+    # Stream the TEI to disk alongside the output, then parse it incrementally
+    tei_path = Path(outdir) / (Path(pdf).stem + ".tei.xml")
     try:
         with open(pdf, "rb") as fh:
             files = {"input": (Path(pdf).name, fh, "application/pdf")}
-            resp = requests.post(
-                url.rstrip("/") + "/api/processFulltextDocument", files=files, timeout=120
+            resp = _grobid_session().post(
+                url.rstrip("/") + "/api/processFulltextDocument",
+                files=files,
+                timeout=120,
+                stream=True,
             )
-        if resp.status_code != 200:
-            log(f"[ERROR] grobid http {resp.status_code}", level="ERROR")
-            return 4
-        tei = resp.text
+        with resp:
+            if resp.status_code != 200:
+                log(f"[ERROR] grobid http {resp.status_code}", level="ERROR")
+                return 4
+            with tei_path.open("wb") as out_fh:
+                for chunk in resp.iter_content(chunk_size=1 << 16):
+                    out_fh.write(chunk)
     except Exception as e:
         log(f"[ERROR] grobid request failed: {e!r}", level="ERROR")
         return 4
-    # Write TEI alongside and produce a minimal markdown from paragraphs
-    tei_path = Path(outdir) / (Path(pdf).stem + ".tei.xml")
-    tei_path.write_text(tei, encoding="utf-8")
+    # Minimal markdown from the TEI paragraphs
     try:
-        root = ET.fromstring(tei)
-        ns = {"tei": root.tag.split("}")[0].strip("{") if "}" in root.tag else ""}
-        paras = []
-        for p in root.findall(".//tei:p", ns) if ns.get("tei") else root.findall(".//p"):
-            paras.append("".join(p.itertext()).strip())
+        paras = _tei_paragraphs(ET.iterparse(tei_path, events=("start", "end")))
         md = "\n\n".join(paras) if paras else f"(See {tei_path.name})"
     except Exception:
         md = f"(See {tei_path.name})"
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text(md, encoding="utf-8")
-    log(f"[OK   ] grobid {pdf} -> {out}")
+    _write_text(out, md)
+    log("[OK   ] grobid %s -> %s", args=(pdf, out))
     return 0
 
 
@@ -743,8 +1688,8 @@ def convert_via_pdfx(pdf: str, outdir: str | Path) -> int:
             # Fallback to pdfminer text extraction when no refs gathered
             return convert_via_pdfminer(pdf, outdir)
         out = Path(outdir) / (Path(pdf).stem + ".md")
-        out.write_text("".join(parts), encoding="utf-8")
-        log(f"[OK   ] pdfx {pdf} -> {out}")
+        _write_pages(out, parts, sep=b"")
+        log("[OK   ] pdfx %s -> %s", args=(pdf, out))
         return 0
     except Exception as e:
         log(f"[ERROR] pdfx failed: {e!r}", level="ERROR")
@@ -766,22 +1711,23 @@ def convert_via_ghostscript(pdf: str, outdir: str | Path) -> int:
         "-sOutputFile=-",
         str(pdf),
     ]
-    log(f"[RUN  ] {' '.join(cmd)}")
+    _log_cmd(cmd)
+    out = Path(outdir) / (Path(pdf).stem + _output_ext())
+    tmp = out.with_name(out.name + ".part")
     try:
-        proc = subprocess.run(cmd, capture_output=True)  # noqa: S603
-        if proc.returncode != 0:
-            log(f"[ERROR] ghostscript rc={proc.returncode}", level="ERROR")
+        # txtwrite emits UTF-8; let gs write straight into the file instead of
+        # buffering the whole dump in this process
+        with tmp.open("wb") as fh:
+            rc = subprocess.run(cmd, stdout=fh, stderr=subprocess.DEVNULL).returncode  # noqa: S603
+        if rc != 0:
+            tmp.unlink(missing_ok=True)
+            log(f"[ERROR] ghostscript rc={rc}", level="ERROR")
             return 4
-        data = proc.stdout
-        try:
-            text = data.decode("utf-8")
-        except Exception:
-            text = data.decode("latin-1", errors="ignore")
-        out = Path(outdir) / (Path(pdf).stem + (".txt" if OUTPUT_FORMAT == "txt" else ".md"))
-        out.write_text(text, encoding="utf-8")
-        log(f"[OK   ] ghostscript {pdf} -> {out}")
+        tmp.replace(out)
+        log("[OK   ] ghostscript %s -> %s", args=(pdf, out))
         return 0
     except Exception as e:
+        tmp.unlink(missing_ok=True)
         log(f"[ERROR] ghostscript failed: {e!r}", level="ERROR")
         return 4
 
@@ -800,17 +1746,19 @@ def convert_via_borb(pdf: str, outdir: str | Path) -> int:
         with open(pdf, "rb") as fh:
             doc = PDF.loads(fh)
         ste = SimpleTextExtraction()
-        texts: list[str] = []
-        for page in doc.get_pages():
-            try:
-                ste.reset()
-                ste.extract(page)
-                texts.append(ste.get_text())
-            except Exception:
-                texts.append("")
-        out = Path(outdir) / (Path(pdf).stem + (".txt" if OUTPUT_FORMAT == "txt" else ".md"))
-        out.write_text("\n\n".join(texts), encoding="utf-8")
-        log(f"[OK   ] borb {pdf} -> {out}")
+
+        def _texts() -> Iterator[str]:
+            for page in doc.get_pages():
+                try:
+                    ste.reset()
+                    ste.extract(page)
+                    yield ste.get_text()
+                except Exception:
+                    yield ""
+
+        out = Path(outdir) / (Path(pdf).stem + _output_ext())
+        _write_pages(out, _texts())
+        log("[OK   ] borb %s -> %s", args=(pdf, out))
         return 0
     except Exception as e:
         log(f"[ERROR] borb extraction failed: {e!r}", level="ERROR")
@@ -830,21 +1778,123 @@ def convert_via_pdfrw(pdf: str, outdir: str | Path) -> int:
 def convert_via_pdfquery(pdf: str, outdir: str | Path) -> int:
     # pdfquery builds on pdfminer; use pdfminer extraction for plain text
     try:
-        from pdfminer.high_level import extract_text
+        import pdfminer.high_level  # noqa: F401
     except Exception:
         log("[ERROR] 'pdfminer.six' not installed for pdfquery engine", level="ERROR")
         return 4
+    out = Path(outdir) / (Path(pdf).stem + _output_ext())
     try:
-        text = extract_text(pdf) or ""
+        _pdfminer_to_file(pdf, out)
     except Exception as e:
         log(f"[ERROR] pdfquery/pdfminer failed: {e!r}", level="ERROR")
         return 4
-    out = Path(outdir) / (Path(pdf).stem + (".txt" if OUTPUT_FORMAT == "txt" else ".md"))
-    out.write_text(text, encoding="utf-8")
-    log(f"[OK   ] pdfquery {pdf} -> {out}")
+    log("[OK   ] pdfquery %s -> %s", args=(pdf, out))
     return 0
 
 
+def _render_pages(pdf: str, convert_from_path: Callable[[str], list[Any]]) -> list[Any]:
+    """Page images for the OCR engines, rasterized once per PDF when CACHE_DIR is set.
+
+    Pages render at OCR_DPI with poppler's own threads. Returns PIL images from
+    pdf2image, or PNG paths from `CACHE_DIR/pages/<sha256>/<dpi>/` on later runs
+    (shared by easyocr and kraken; a changed PDF gets a new digest).
+    """
+    render = functools.partial(
+        convert_from_path, dpi=OCR_DPI, thread_count=max(1, available_cpus() // 2)
+    )
+    digest = _fingerprint(pdf) if CACHE_DIR else None
+    if digest is None:
+        return render(pdf)
+    slot = Path(CACHE_DIR) / "pages" / digest / str(OCR_DPI)
+    complete = slot / "count"
+    try:
+        n = int(complete.read_text(encoding="utf-8"))
+        log("[cache] page images %s (%d)", args=(pdf, n))
+        return [slot / f"p{i}.png" for i in range(n)]
+    except (OSError, ValueError):
+        pass
+    images = render(pdf)
+    try:
+        slot.mkdir(parents=True, exist_ok=True)
+        for i, img in enumerate(images):
+            img.save(slot / f"p{i}.png")
+        # Written last: a slot without it is incomplete and gets re-rendered
+        complete.write_text(str(len(images)), encoding="utf-8")
+    except OSError as e:
+        log(f"[WARN ] page image cache store failed: {e!r}", level="WARNING")
+    return images
+
+
+def _ocr_workers(pages: int) -> int:
+    """Threads for per-page OCR: OCR_WORKERS, or the default pool size when 0."""
+    return max(1, min(pages, OCR_WORKERS or default_workers()))
+
+
+_EASYOCR_READER: Any | None = None
+_EASYOCR_LOCK = threading.Lock()
+# Torch intra-op threads last set by `_split_torch_threads` (None = Torch's default)
+_EASYOCR_TORCH_THREADS: int | None = None
+
+
+def _easyocr_reader(easyocr: Any) -> Any:
+    """Return the process-wide EasyOCR reader, loading its models on first use.
+
+    Building a Reader costs seconds; pool workers each build one on their first file.
+    A tiny warm-up inference runs right after loading, so lazy graph setup happens
+    here (overlapped with page rendering) rather than on the first real page.
+    """
+    global _EASYOCR_READER
+    with _EASYOCR_LOCK:
+        if _EASYOCR_READER is None:
+            reader = easyocr.Reader(["en"], gpu=False)
+            try:
+                import numpy as np
+
+                reader.readtext(np.zeros((32, 32, 3), dtype=np.uint8))
+            except Exception:
+                pass
+            _EASYOCR_READER = reader
+    return _EASYOCR_READER
+
+
+def _easyocr_input(img: Any) -> Any:
+    """Hand a page to `readtext` in a form it accepts without re-decoding.
+
+    Cached pages are passed as file paths. pdf2image's PIL images become one RGB
+    numpy array each; easyocr only takes paths, bytes or arrays (plus JPEG images).
+    """
+    if isinstance(img, Path):
+        return str(img)
+    if hasattr(img, "mode"):
+        import numpy as np
+
+        return np.asarray(img if img.mode == "RGB" else img.convert("RGB"))
+    return img
+
+
+def _split_torch_threads(workers: int) -> None:
+    """Share the CPUs between `workers` concurrent EasyOCR calls.
+
+    Every `readtext` call otherwise uses Torch's full intra-op pool, so concurrent
+    pages would oversubscribe the cores roughly `workers` times (the kraken path caps
+    its processes with OMP_THREAD_LIMIT=1 for the same reason).
+    """
+    global _EASYOCR_TORCH_THREADS
+    if workers <= 1 and _EASYOCR_TORCH_THREADS is None:
+        return
+    threads = max(1, available_cpus() // workers)
+    with _EASYOCR_LOCK:
+        if threads == _EASYOCR_TORCH_THREADS:
+            return
+        try:
+            import torch
+
+            torch.set_num_threads(threads)
+        except Exception:
+            return
+        _EASYOCR_TORCH_THREADS = threads
+
+
 def convert_via_easyocr(pdf: str, outdir: str | Path) -> int:
     try:
         from pdf2image import convert_from_path
@@ -853,31 +1903,100 @@ def convert_via_easyocr(pdf: str, outdir: str | Path) -> int:
     except Exception:
         log("[ERROR] packages 'easyocr', 'pdf2image', and 'Pillow' required", level="ERROR")
         return 4
-    try:
-        images = convert_from_path(pdf)
-    except Exception as e:
-        log(f"[ERROR] pdf2image failed: {e!r}", level="ERROR")
-        return 4
-    reader = None
-    try:
-        reader = easyocr.Reader(["en"], gpu=False)
-    except Exception as e:
-        log(f"[ERROR] easyocr init failed: {e!r}", level="ERROR")
-        return 4
-    lines: list[str] = []
-    for img in images:
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Load (and warm) the models while poppler renders the pages
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        pending = loader.submit(_easyocr_reader, easyocr)
+        try:
+            images = _render_pages(pdf, convert_from_path)
+        except Exception as e:
+            log(f"[ERROR] pdf2image failed: {e!r}", level="ERROR")
+            return 4
         try:
-            result = reader.readtext(img)
-            for _bbox, text, _conf in result:
-                lines.append(text)
+            reader = pending.result()
+        except Exception as e:
+            log(f"[ERROR] easyocr init failed: {e!r}", level="ERROR")
+            return 4
+
+    def read_page(img: Any) -> list[str]:
+        try:
+            arr = _easyocr_input(img)
+            return [text for _bbox, text, _conf in reader.readtext(arr, batch_size=EASYOCR_BATCH)]
         except Exception:
-            continue
+            return []
+
+    # Torch releases the GIL during inference, so pages overlap on threads (in order)
+    workers = _ocr_workers(len(images))
+    _split_torch_threads(workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        lines = [text for page in pool.map(read_page, images) for text in page]
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text("\n".join(lines), encoding="utf-8")
-    log(f"[OK   ] easyocr {pdf} -> {out}")
+    _write_pages(out, lines, sep=b"\n")
+    log("[OK   ] easyocr %s -> %s", args=(pdf, out))
     return 0
 
 
+@functools.cache
+def _kraken_batch_input(exe: str) -> bool:
+    """Return True if this kraken CLI accepts `-I <glob>` batch input (checked via --help)."""
+    try:
+        res = subprocess.run(  # noqa: S603
+            [exe, "--help"], capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return res.returncode == 0 and "--batch-input" in res.stdout
+
+
+def _kraken_warn(what: str, res: subprocess.CompletedProcess) -> None:
+    err = res.stderr.decode("utf-8", "replace").strip().splitlines()
+    log(
+        "[WARN ] kraken %s rc=%d %s",
+        args=(what, res.returncode, err[-1] if err else ""),
+        level="WARNING",
+    )
+
+
+def _kraken_batch(
+    exe: str, folder: Path, pages: list[tuple[int, Any]], env: dict[str, str]
+) -> list[str | None]:
+    """OCR `pages` with one `kraken -I` call over `folder`; None for pages without output.
+
+    Failures (writing the images, starting kraken) drop the chunk's pages like the
+    per-page path drops a page, instead of failing the whole document.
+    """
+    try:
+        folder.mkdir()
+        for i, img in pages:
+            dst = folder / f"p{i}.png"
+            if isinstance(img, Path):
+                # Cached page images: link (or copy) them next to their outputs
+                try:
+                    os.link(img, dst)
+                except OSError:
+                    shutil.copyfile(img, dst)
+            else:
+                img.save(dst)
+        # kraken expands the glob itself and writes p{i}.txt beside each p{i}.png
+        cmd = [exe, "-I", str(folder / "*.png"), "-o", ".txt"]
+        res = subprocess.run(cmd, env=env, capture_output=True)  # noqa: S603
+    except Exception as e:
+        log(
+            "[WARN ] kraken pages %d-%d failed: %r",
+            args=(pages[0][0], pages[-1][0], e),
+            level="WARNING",
+        )
+        return [None] * len(pages)
+    texts: list[str | None] = []
+    for i, _img in pages:
+        txt = folder / f"p{i}.txt"
+        texts.append(txt.read_text(encoding="utf-8", errors="ignore") if txt.exists() else None)
+    if res.returncode != 0 or None in texts:
+        _kraken_warn(f"pages {pages[0][0]}-{pages[-1][0]}", res)
+    return texts
+
+
 def convert_via_kraken(pdf: str, outdir: str | Path) -> int:
     try:
         from pdf2image import convert_from_path
@@ -892,26 +2011,59 @@ def convert_via_kraken(pdf: str, outdir: str | Path) -> int:
     import tempfile
 
     try:
-        images = convert_from_path(pdf)
+        images = _render_pages(pdf, convert_from_path)
     except Exception as e:
         log(f"[ERROR] pdf2image failed: {e!r}", level="ERROR")
         return 4
-    texts: list[str] = []
+    workers = _ocr_workers(len(images))
+    env = os.environ.copy()
+    if workers > 1:
+        # N single-threaded kraken processes beat N processes contending for every core
+        env.setdefault("OMP_THREAD_LIMIT", "1")
+        env.setdefault("OMP_NUM_THREADS", "1")
+    from concurrent.futures import ThreadPoolExecutor
+
     with tempfile.TemporaryDirectory() as td:
-        for i, img in enumerate(images):
-            img_path = Path(td) / f"p{i}.png"
-            txt_path = Path(td) / f"p{i}.txt"
-            try:
-                img.save(img_path)
-                # kraken -i image.png image.txt (default segmentation + recognition)
-                rc = subprocess.run([exe, "-i", str(img_path), str(txt_path)]).returncode  # noqa: S603
-                if rc == 0 and txt_path.exists():
-                    texts.append(txt_path.read_text(encoding="utf-8", errors="ignore"))
-            except Exception:
-                continue
+        if _kraken_batch_input(exe):
+            # One process per worker OCRs a contiguous run of pages, loading the model once
+            step = -(-len(images) // workers) if images else 1
+            chunks = [
+                (Path(td) / f"b{k}", list(enumerate(images))[k : k + step])
+                for k in range(0, len(images), step)
+            ]
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = [
+                    t
+                    for batch in pool.map(lambda c: _kraken_batch(exe, *c, env), chunks)
+                    for t in batch
+                ]
+        else:
+
+            def ocr_page(item: tuple[int, Any]) -> str | None:
+                i, img = item
+                # Cached pages are already PNG files
+                img_path = img if isinstance(img, Path) else Path(td) / f"p{i}.png"
+                txt_path = Path(td) / f"p{i}.txt"
+                try:
+                    if img_path is not img:
+                        img.save(img_path)
+                    # kraken -i image.png image.txt (default segmentation + recognition)
+                    cmd = [exe, "-i", str(img_path), str(txt_path)]
+                    # Captured so concurrent pages do not contend for the console
+                    res = subprocess.run(cmd, env=env, capture_output=True)  # noqa: S603
+                    if res.returncode == 0 and txt_path.exists():
+                        return txt_path.read_text(encoding="utf-8", errors="ignore")
+                    _kraken_warn(f"page {i}", res)
+                except Exception:
+                    pass
+                return None
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(ocr_page, enumerate(images)))
+        texts = [t for t in results if t is not None]
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text("\n\n".join(texts), encoding="utf-8")
-    log(f"[OK   ] kraken {pdf} -> {out}")
+    _write_pages(out, texts)
+    log("[OK   ] kraken %s -> %s", args=(pdf, out))
     return 0
 
 
@@ -944,64 +2096,134 @@ def convert_via_docling(pdf: str, outdir: str | Path) -> int:
         log(f"[ERROR] docling conversion failed: {e!r}", level="ERROR")
         return 4
     out = Path(outdir) / (Path(pdf).stem + ".md")
-    out.write_text(md, encoding="utf-8")
-    log(f"[OK   ] docling {pdf} -> {out}")
+    _write_text(out, md)
+    log("[OK   ] docling %s -> %s", args=(pdf, out))
     return 0
 
 
+# Engine name (and aliases) -> converter run through `_run_with_tables`; built once so
+# dispatch is a dict lookup. Marker and the camelot lattice flavor are special-cased.
+_ENGINES: dict[str, Callable[[str, str | Path], int]] = {
+    "pymupdf": convert_text,
+    "fast": convert_text,
+    "poppler": convert_via_poppler,
+    "poppler-html2md": convert_via_poppler,
+    "html2md": convert_via_poppler,
+    "pdfminer": convert_via_pdfminer,
+    "pdfminer.six": convert_via_pdfminer,
+    "pdfplumber": convert_via_pdfplumber,
+    "ocrmypdf": convert_via_ocrmypdf,
+    "ocr": convert_via_ocrmypdf,
+    "docling": convert_via_docling,
+    "layout": convert_via_layout,
+    "pymupdf4llm": convert_via_layout,
+    "pypdf": convert_via_pypdf,
+    "pypdfium2": convert_via_pypdfium2,
+    "pytesseract": convert_via_pytesseract,
+    "tesseract": convert_via_pytesseract,
+    "unstructured": convert_via_unstructured,
+    # pdftotree engine removed
+    "tabula": convert_via_tabula,
+    "tabula-py": convert_via_tabula,
+    "grobid": convert_via_grobid,
+    "pdfx": convert_via_pdfx,
+    "ghostscript": convert_via_ghostscript,
+    "gs": convert_via_ghostscript,
+    "borb": convert_via_borb,
+    "pdfrw": convert_via_pdfrw,
+    "pdfquery": convert_via_pdfquery,
+    "easyocr": convert_via_easyocr,
+    "kraken": convert_via_kraken,
+}
+
+
+# Output files an engine run may produce, by suffix after the PDF stem
+_CACHED_SUFFIXES = (".md", ".txt", ".tables.md")
+
+
+def _cache_slot(pdf: str, eng: str) -> Path | None:
+    """Cache directory for `pdf` converted by `eng` under the current options.
+
+    Keyed by the SHA-256 of the PDF bytes plus a digest of every option that changes
+    the output; None when caching is off or the run writes images (not cached).
+    """
+    if not CACHE_DIR or IMAGES:
+        return None
+    opts = [
+        eng,
+        OUTPUT_FORMAT,
+        LOWRES,
+        HIGHRES,
+        TABLES,
+        TABLES_FLAVOR,
+        LAYOUT_PAGES,
+        MOCK,
+        # Page render resolution for the pdf2image-based OCR engines
+        OCR_DPI,
+        # The poppler engine's HTML -> Markdown converter
+        HTML2MD,
+        # Marker's OCR backend and the GROBID server both change what comes back
+        os.environ.get("OCR_ENGINE"),
+        os.environ.get("GROBID_URL"),
+    ]
+    opts_key = hashlib.blake2b(_JSON_ENCODE(opts).encode(), digest_size=16).hexdigest()
+    pdf_key = _fingerprint(pdf)
+    if pdf_key is None:
+        return None
+    log("[cache] %s sha256=%s", args=(pdf, pdf_key), level="DEBUG")
+    return Path(CACHE_DIR) / pdf_key / opts_key
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def _run_engine_by_name(eng: str, pdf: str, outdir: str | Path, slice_pages: int) -> int:
+    """Run engine `eng`, serving its outputs from CACHE_DIR when it has them."""
+    slot = _cache_slot(pdf, eng.lower())
+    if slot is None:
+        return _dispatch_engine(eng, pdf, outdir, slice_pages)
+    cached = [slot / ("out" + sfx) for sfx in _CACHED_SUFFIXES]
+    outs = [Path(outdir) / (Path(pdf).stem + sfx) for sfx in _CACHED_SUFFIXES]
+    if any(c.exists() for c in cached):
+        for c, out in zip(cached, outs):
+            if c.exists():
+                shutil.copyfile(c, out)
+        log("[cache] hit %s (%s)", args=(pdf, eng))
+        return 0
+    before = [_stat_key(out) for out in outs]
+    rc = _dispatch_engine(eng, pdf, outdir, slice_pages)
+    if rc == 0:
+        try:
+            slot.mkdir(parents=True, exist_ok=True)
+            for c, out, prev in zip(cached, outs, before):
+                # Only files this run wrote; untouched siblings may come from another engine
+                now = _stat_key(out)
+                if now is not None and now != prev:
+                    tmp = c.with_name(c.name + ".part")
+                    shutil.copyfile(out, tmp)
+                    tmp.replace(c)
+        except OSError as e:
+            log(f"[WARN ] cache store failed: {e!r}", level="WARNING")
+    return rc
+
+
+def _dispatch_engine(eng: str, pdf: str, outdir: str | Path, slice_pages: int) -> int:
     e = eng.lower()
-    if e in ("pymupdf", "fast"):
-        return _run_with_tables(pdf, outdir, convert_text)
-    if e in ("marker",):
+    fn = _ENGINES.get(e)
+    if fn is not None:
+        return _run_with_tables(pdf, outdir, fn)
+    if e == "marker":
         rc = marker_convert(str(pdf), str(outdir), slice_pages)
         if rc == 0 and TABLES:
             extract_tables_to_md(str(pdf), str(outdir))
         return rc
-    if e in ("poppler", "poppler-html2md", "html2md"):
-        return _run_with_tables(pdf, outdir, convert_via_poppler)
-    if e in ("pdfminer", "pdfminer.six"):
-        return _run_with_tables(pdf, outdir, convert_via_pdfminer)
-    if e in ("pdfplumber",):
-        return _run_with_tables(pdf, outdir, convert_via_pdfplumber)
-    if e in ("ocrmypdf", "ocr"):
-        rc = convert_via_ocrmypdf(str(pdf), str(outdir))
-        if rc == 0 and TABLES:
-            extract_tables_to_md(str(pdf), str(outdir))
-        return rc
-    if e in ("docling",):
-        return _run_with_tables(pdf, outdir, convert_via_docling)
-    if e in ("layout", "pymupdf4llm"):
-        return _run_with_tables(pdf, outdir, convert_via_layout)
     if e in ("lattice", "camelot-lattice"):
         return _run_with_tables(pdf, outdir, convert_text, flavor="lattice")
-    if e in ("pypdf",):
-        return _run_with_tables(pdf, outdir, convert_via_pypdf)
-    if e in ("pypdfium2",):
-        return _run_with_tables(pdf, outdir, convert_via_pypdfium2)
-    if e in ("pytesseract", "tesseract"):
-        return _run_with_tables(pdf, outdir, convert_via_pytesseract)
-    if e in ("unstructured",):
-        return _run_with_tables(pdf, outdir, convert_via_unstructured)
-    # pdftotree engine removed
-    if e in ("tabula", "tabula-py"):
-        return _run_with_tables(pdf, outdir, convert_via_tabula)
-    if e in ("grobid",):
-        return _run_with_tables(pdf, outdir, convert_via_grobid)
-    if e in ("pdfx",):
-        return _run_with_tables(pdf, outdir, convert_via_pdfx)
-    if e in ("ghostscript", "gs"):
-        return _run_with_tables(pdf, outdir, convert_via_ghostscript)
-    if e in ("borb",):
-        return _run_with_tables(pdf, outdir, convert_via_borb)
-    if e in ("pdfrw",):
-        return _run_with_tables(pdf, outdir, convert_via_pdfrw)
-    if e in ("pdfquery",):
-        return _run_with_tables(pdf, outdir, convert_via_pdfquery)
-    if e in ("easyocr",):
-        return _run_with_tables(pdf, outdir, convert_via_easyocr)
-    if e in ("kraken",):
-        return _run_with_tables(pdf, outdir, convert_via_kraken)
     log(f"[ERROR] unknown engine: {eng}", level="ERROR")
     return 9
 
@@ -1015,87 +2237,272 @@ def marker_slice(pdf: str, outdir: str | Path, start: int, end: int) -> int:
         if MOCK_FAIL or (MOCK_FAIL_IF_SLICE_GT and (end - start + 1) > MOCK_FAIL_IF_SLICE_GT):
             return 1
         return mock_write_markdown(pdf, outdir, f"mock marker slice {start}-{end}")
-    ms = which_marker_single()
-    cmd = ms + [str(pdf), "--output_format", "markdown"]
-    if not IMAGES:
-        cmd += ["--disable_image_extraction"]
-    cmd += [
-        "--page_range",
-        f"{start}-{end}",
-        "--output_dir",
-        str(outdir),
-        "--lowres_image_dpi",
-        str(LOWRES),
-        "--highres_image_dpi",
-        str(HIGHRES),
-    ]
-    log(f"[RUN  ] {' '.join(cmd)}")
-    return subprocess.run(cmd).returncode  # noqa: S603
+    rc = _marker_via_worker(pdf, outdir, f"{start}-{end}")
+    if rc is not None:
+        return rc
+    cmd = _marker_cmd(pdf, outdir, f"{start}-{end}")
+    _log_cmd(cmd)
+    return _run_marker(cmd)
+
 
+def marker_convert(
+    pdf: str, outdir: str | Path, slice_pages: int, *, total: int | None = None
+) -> int:
+    """Convert using slice-based backoff; falls back to single-pass on open failure.
 
-def marker_convert(pdf: str, outdir: str | Path, slice_pages: int) -> int:
-    """Convert using slice-based backoff; falls back to single-pass on open failure."""
+    `total` is the page count when already known (e.g., from `probe_pdf`), which
+    skips reopening the document just to count pages.
+    """
     if DRY_RUN:
         log(f"[DRY  ] would run marker convert (slice={slice_pages}) for {pdf} -> {outdir}")
         return 0
-    doc = try_open(pdf)
-    if not doc:
+    if total is None:
+        total = _page_count(pdf)
+    if total is None:
         rc = marker_single_pass(pdf, outdir)
         if rc != 0:
             log(f"[ERROR] marker_single rc={rc}", level="ERROR")
             return 3
         log("[OK   ] single-pass done")
         return 0
-    total = len(doc)
-    doc.close()
-    start = 0
+    log(
+        "[MRK_S] total_pages=%d slice=%d dpi=%d/%d", args=(total, int(slice_pages), LOWRES, HIGHRES)
+    )
+    ranges = -(-total // max(1, int(slice_pages)))
+    par = min(MARKER_PAR, ranges)
+    if par > 1 and not MARKER_WORKER:
+        return _marker_convert_parallel(pdf, outdir, slice_pages, total, par)
+    work = _slice_workdir(pdf, outdir)
+    started: set[Path] = set()
+    try:
+        return _marker_backoff(
+            pdf,
+            work,
+            0,
+            total,
+            slice_pages,
+            total,
+            _PageCounter(),
+            merge=lambda part: _merge_slice_output(part, Path(outdir), started),
+        )
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def _slice_workdir(pdf: str, outdir: str | Path) -> Path:
+    """Private folder under `outdir` that Marker slices of `pdf` are converted into."""
+    work = Path(outdir) / f".{Path(pdf).stem}.slices"
+    # Leftovers of an interrupted run would otherwise be merged as slices of this one
+    shutil.rmtree(work, ignore_errors=True)
+    return work
+
+
+class _PageCounter:
+    """Converted-page count shared by concurrent `_marker_backoff` calls for progress."""
+
+    def __init__(self) -> None:
+        self.pages = 0
+        self._lock = threading.Lock()
+
+    def add(self, n: int) -> int:
+        """Add `n` pages and return the new total."""
+        with self._lock:
+            self.pages += n
+            return self.pages
+
+
+def _marker_backoff(
+    pdf: str,
+    work: Path,
+    first: int,
+    stop: int,
+    slice_pages: int,
+    total: int,
+    done: _PageCounter,
+    *,
+    merge: Callable[[Path], None] | None = None,
+) -> int:
+    """Convert pages [first, stop) slice by slice with halve-on-failure backoff.
+
+    Each slice is converted into its own folder under `work`, named so that sorting
+    folder names gives page order; `merge` (if given) is called with each folder as
+    soon as its slice succeeds. `done` is the page counter shared by concurrent
+    callers for progress.
+    """
+    start = first
     cur = int(slice_pages)
-    log(f"[MRK_S] total_pages={total} slice={cur} dpi={LOWRES}/{HIGHRES}")
-    done = 0
-    while start < total:
-        end = min(start + cur - 1, total - 1)
+    # Halve the slice on failure; after a streak of successes grow it back toward the
+    # requested size so one bad region does not slow down the rest of the document
+    good_streak = 0
+    while start < stop:
+        end = min(start + cur - 1, stop - 1)
+        part = work / f"{start:08d}"
+        part.mkdir(parents=True, exist_ok=True)
         t0 = time.perf_counter()
-        rc = marker_slice(pdf, outdir, start, end)
+        rc = marker_slice(pdf, part, start, end)
         dt = time.perf_counter() - t0
         if rc != 0:
+            # Drop whatever the failed attempt wrote before retrying these pages
+            shutil.rmtree(part, ignore_errors=True)
             if cur <= 5:
                 log(f"[ERROR] slice {start}-{end} failed rc={rc} (min slice)", level="ERROR")
                 return 2
             cur = max(5, cur // 2)
+            good_streak = 0
             log(f"[WARN ] retry with slice={cur}", level="WARNING")
             continue
-        done += end - start + 1
+        if merge is not None:
+            merge(part)
+        pages_done = done.add(end - start + 1)
+        good_streak += 1
         if PROGRESS and total > 0:
-            pct = int((done * 100) / total)
-            log(f"[PROG ] slice {start}-{end} ok; {done}/{total} pages ({pct}%) in {dt:.2f}s")
+            pct = int((pages_done * 100) / total)
+            log(
+                "[PROG ] slice %d-%d ok; %d/%d pages (%d%%) in %.2fs",
+                args=(start, end, pages_done, total, pct, dt),
+            )
         else:
-            log(f"[OK   ] pages {start}-{end} in {dt:.2f}s")
+            log("[OK   ] pages %d-%d in %.2fs", args=(start, end, dt))
         start = end + 1
+        if good_streak >= SLICE_GROW_AFTER and cur < slice_pages:
+            cur = min(int(slice_pages), cur * 2)
+            good_streak = 0
+            log("[info ] growing slice to %d", args=(cur,))
     return 0
 
 
-def _pattern_match(path: Path, patterns: list[str]) -> bool:
-    from fnmatch import fnmatch
-    import os as _os
+def _marker_convert_parallel(
+    pdf: str, outdir: str | Path, slice_pages: int, total: int, par: int
+) -> int:
+    """Run `par` Marker processes over consecutive page ranges, then merge in order.
+
+    Each range converts (with its own backoff) into a private folder; its slices are
+    merged into `outdir` exactly like the serial path does, in range order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    size = int(slice_pages)
+    bounds = [(a, min(a + size, total)) for a in range(0, total, size)]
+    work = _slice_workdir(pdf, outdir)
+    log("[MRK_P] %d ranges on %d concurrent marker runs", args=(len(bounds), par))
+    done = _PageCounter()
+    started: set[Path] = set()
+
+    def run(item: tuple[int, tuple[int, int]]) -> int:
+        i, (a, b) = item
+        return _marker_backoff(pdf, work / str(i), a, b, size, total, done)
+
+    try:
+        with ThreadPoolExecutor(max_workers=par, thread_name_prefix="marker") as pool:
+            # map yields in range order: merge each range as soon as it and all earlier
+            # ones are done, so finished slice output does not pile up on disk
+            for i, rc in enumerate(pool.map(run, enumerate(bounds))):
+                if rc != 0:
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    return rc
+                for part in sorted((work / str(i)).iterdir()):
+                    _merge_slice_output(part, Path(outdir), started)
+        return 0
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
 
+
+def _merge_slice_output(part: Path, outdir: Path, started: set[Path]) -> None:
+    """Move one slice's output under `outdir`, in page order across calls.
+
+    Markdown files not yet in `started` are created fresh (replacing any output of
+    an earlier run); later slices are appended after a blank line. Markdown is
+    streamed with copyfileobj (1 MiB chunks) and each merged file is deleted right
+    away, so memory stays flat however large the document is.
+    """
+    for f in sorted(part.rglob("*")):
+        if not f.is_file():
+            continue
+        dest = outdir / f.relative_to(part)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if f.suffix != ".md":
+            f.replace(dest)
+            continue
+        with f.open("rb") as src, dest.open("ab" if dest in started else "wb") as out:
+            if dest in started:
+                out.write(b"\n\n")
+            shutil.copyfileobj(src, out, 1 << 20)
+        started.add(dest)
+        f.unlink()
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Translate fnmatch-style globs into one compiled regex (built once per pattern set)."""
+    from fnmatch import translate
+
+    # fnmatch folds case where the OS does (Windows); keep that behavior
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("|".join(translate(p.replace("\\", "/")) for p in patterns), flags)
+
+
+def _pattern_match(path: Path, patterns: list[str]) -> bool:
+    if not patterns:
+        return False
+    rx = _compile_patterns(tuple(patterns))
     # Normalize to forward slashes for cross-platform consistency with docs/examples
-    s_full = str(path).replace(_os.sep, "/")
-    s_name = path.name
-    for pat in patterns:
-        p = pat.replace("\\", "/").replace(_os.sep, "/")
-        if fnmatch(s_full, p) or fnmatch(s_name, p):
-            return True
-    return False
+    s_full = str(path).replace(os.sep, "/")
+    return bool(rx.match(s_full) or rx.match(path.name))
+
+
+def _prune_regex(patterns: list[str]) -> re.Pattern[str] | None:
+    """Regex for directories whose whole subtree EXCLUDE patterns reject.
+
+    Only patterns of the form `<dir-glob>/*` qualify: when a directory's relative path
+    matches `<dir-glob>`, every path below it matches the pattern (`*` spans `/`).
+    """
+    dirs = tuple(p.replace("\\", "/")[:-2] for p in patterns if p.replace("\\", "/").endswith("/*"))
+    return _compile_patterns(dirs) if dirs else None
+
+
+def _scan_pdfs(root: Path, prune: re.Pattern[str] | None = None) -> Iterator[Path]:
+    """Walk `root` with os.scandir, yielding PDF paths (case-insensitive extension).
+
+    Only matching entries are turned into Path objects; symlinked directories are not
+    followed and unreadable directories are skipped, mirroring `Path.rglob`. Directories
+    whose relative path (forward slashes) matches `prune` are not descended into.
+    """
+    stack = [(str(root), "")]
+    while stack:
+        d, rel = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            sub = rel + entry.name
+                            if prune is None or not prune.match(sub):
+                                stack.append((entry.path, sub + "/"))
+                            continue
+                    except OSError:
+                        continue
+                    if entry.name.lower().endswith(".pdf"):
+                        yield Path(entry.path)
+        except OSError:
+            continue
 
 
 def iter_input_files(inp: Path) -> Iterable[Path]:
     """Yield one or many PDF paths depending on input being a file or directory."""
     if inp.exists() and inp.is_dir():
-        files = sorted(p for p in inp.rglob("*.pdf"))
-        if INCLUDE:
-            files = [p for p in files if _pattern_match(p.relative_to(inp), INCLUDE)]
-        if EXCLUDE:
-            files = [p for p in files if not _pattern_match(p.relative_to(inp), EXCLUDE)]
+        if INCLUDE or EXCLUDE:
+            # Filter while walking: one relative path per file, and only kept files get sorted
+            files = []
+            for p in _scan_pdfs(inp, _prune_regex(EXCLUDE)):
+                rel = p.relative_to(inp)
+                if INCLUDE and not _pattern_match(rel, INCLUDE):
+                    continue
+                if EXCLUDE and _pattern_match(rel, EXCLUDE):
+                    continue
+                files.append(p)
+            files.sort()
+        else:
+            files = sorted(_scan_pdfs(inp))
         log(f"[scan ] folder: {inp}  files={len(files)}")
         return files
     if inp.exists():
@@ -1105,12 +2512,69 @@ def iter_input_files(inp: Path) -> Iterable[Path]:
     return []
 
 
-def process_one(pdf: Path, idx: int, total: int, slice_pages: int) -> int:
-    """Process a single PDF and return an exit code reflecting the outcome."""
+def marker_reachable() -> bool:
+    """Return True when the current configuration may convert some PDF via Marker."""
+    if ENGINE:
+        return ENGINE.lower() == "marker"
+    if MODE != "auto":
+        return MODE == "marker"
+    return "marker" in ((ENGINE_NON_TEXTUAL or "marker").lower(), (ENGINE_TEXTUAL or "").lower())
+
+
+def uses_marker_subprocess(textual: bool) -> bool:
+    """Return True when auto mode converts a PDF with this verdict via Marker."""
+    if ENGINE or MODE != "auto" or textual:
+        return False
+    return (ENGINE_NON_TEXTUAL or "marker").lower() == "marker"
+
+
+def resume_hit(pdf: Path) -> bool:
+    """Return True when RESUME is on and `pdf` already has an up-to-date output.
+
+    An output counts when it is non-empty and not older than the PDF, so files edited
+    since the last run (or left empty by a crash) are converted again.
+    """
+    if not RESUME:
+        return False
+    try:
+        src_mtime = pdf.stat().st_mtime_ns
+    except OSError:
+        return False
+    outdir = Path(OUTDIR) if OUTDIR else pdf.parent
+    exts = (".md", ".txt") if OUTPUT_FORMAT == "txt" else (".md",)
+    for ext in exts:
+        try:
+            st = (outdir / (pdf.stem + ext)).stat()
+        except OSError:
+            continue
+        if st.st_size > 0 and st.st_mtime_ns >= src_mtime:
+            return True
+    return False
+
+
+def process_one(
+    pdf: Path,
+    idx: int,
+    total: int,
+    slice_pages: int,
+    *,
+    probe: tuple[bool, int | None] | None = None,
+    on_probe: Callable[[tuple[bool, int | None]], None] | None = None,
+) -> int:
+    """Process a single PDF and return an exit code reflecting the outcome.
+
+    `probe` may carry a `probe_pdf` result computed ahead of time (e.g., prefetched
+    while the previous file was converting) to skip opening the document again.
+    Otherwise the auto path probes here, reuses the open document for fast-path
+    extraction, and reports the result to `on_probe` before converting.
+    """
     outdir = Path(OUTDIR) if OUTDIR else pdf.parent
     outdir.mkdir(parents=True, exist_ok=True)
     log("=" * 64)
-    log(f"[file ] ({idx}/{total}) {pdf}")
+    log("[file ] (%d/%d) %s", args=(idx, total, pdf))
+    if resume_hit(pdf):
+        log("[SKIP ] output exists (resume): %s", args=(pdf,))
+        return 0
     if DRY_RUN:
         if MODE == "fast":
             log("[DRY  ] mode=fast -> would use PyMuPDF fast path")
@@ -1119,11 +2583,12 @@ def process_one(pdf: Path, idx: int, total: int, slice_pages: int) -> int:
         else:
             log("[DRY  ] mode=auto -> would route based on heuristics (not evaluated in dry-run)")
         return 0
+    doc = None
     try:
         # Forced engine overrides mode/heuristics when provided
         if ENGINE:
             eng = ENGINE.lower()
-            log(f"[eng  ] FORCED ENGINE -> {eng}")
+            log("[eng  ] FORCED ENGINE -> %s", args=(eng,))
             return _run_engine_by_name(eng, str(pdf), str(outdir), slice_pages)
         if MODE == "fast":
             log("[path ] FORCED FAST -> PyMuPDF")
@@ -1134,22 +2599,106 @@ def process_one(pdf: Path, idx: int, total: int, slice_pages: int) -> int:
             if rc == 0 and TABLES:
                 extract_tables_to_md(str(pdf), str(outdir))
             return rc
-        if is_textual(str(pdf)):
+        if probe is None:
+            probe, doc = _probe_open(str(pdf), MIN_CHARS, MIN_RATIO, TEXT_SAMPLE_PAGES)
+            if doc is not None and (not probe[0] or ENGINE_TEXTUAL):
+                # Only the fast path extracts from the probed document
+                _close_doc(doc)
+                doc = None
+            if on_probe is not None:
+                on_probe(probe)
+        textual, page_count = probe
+        if textual:
             # Auto textual routing; allow override engine for textual category
             if ENGINE_TEXTUAL:
-                log(f"[path ] TEXTUAL -> engine={ENGINE_TEXTUAL}")
+                log("[path ] TEXTUAL -> engine=%s", args=(ENGINE_TEXTUAL,))
                 return _run_engine_by_name(ENGINE_TEXTUAL, str(pdf), str(outdir), slice_pages)
             log("[path ] TEXTUAL -> fast PyMuPDF")
-            return _run_with_tables(str(pdf), str(outdir), convert_text)
+            return _run_with_tables(str(pdf), str(outdir), functools.partial(convert_text, doc=doc))
         # Non-textual
         if ENGINE_NON_TEXTUAL:
-            log(f"[path ] NON-TEXTUAL -> engine={ENGINE_NON_TEXTUAL}")
+            log("[path ] NON-TEXTUAL -> engine=%s", args=(ENGINE_NON_TEXTUAL,))
             return _run_engine_by_name(ENGINE_NON_TEXTUAL, str(pdf), str(outdir), slice_pages)
         log("[path ] NON-TEXTUAL -> marker_single")
-        rc = marker_convert(str(pdf), str(outdir), slice_pages)
+        rc = marker_convert(str(pdf), str(outdir), slice_pages, total=page_count)
         if rc == 0 and TABLES:
             extract_tables_to_md(str(pdf), str(outdir))
         return rc
     except Exception as e:  # pragma: no cover - safety
         log(f"[FALL ] unhandled error: {e!r}", level="ERROR")
         return 9
+    finally:
+        if doc is not None:
+            _close_doc(doc)
+        _release_fitz_store()
+        _flush_log()
+
+
+# Engines whose Python side only waits on a child process or an HTTP server (ocrmypdf
+# is excluded: it reads its output through convert_text, and PyMuPDF is not thread-safe)
+_IO_BOUND_ENGINES = frozenset(
+    {"poppler", "poppler-html2md", "html2md", "ghostscript", "gs", "grobid"}
+)
+
+
+def _io_bound_batch() -> bool:
+    """True when files can overlap on threads: a forced I/O-bound engine, no tables."""
+    return (ENGINE or "").lower() in _IO_BOUND_ENGINES and not TABLES
+
+
+def process_many(files: list[Path], slice_pages: int, jobs: int) -> dict[int, int]:
+    """Process files across `jobs` worker processes; return exit codes by 1-based index.
+
+    Workers use the `spawn` start method on every platform (forking a process that has
+    PyMuPDF state or helper threads is unsafe) and receive the parent's runtime
+    configuration through `restore_config`. Their LOG_FILE records are sent back
+    over a queue, so only this process writes (and rotates) the file. Forced engines
+    that only wait on an external program or server run on threads instead (see
+    `_io_bound_batch`).
+    """
+    import multiprocessing
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+    threaded = _io_bound_batch()
+    log("[pool ] jobs=%d%s", args=(jobs, " (threads)" if threaded else ""))
+    results: dict[int, int] = {}
+    pool: Executor
+    listener: logging.handlers.QueueListener | None = None
+    if threaded:
+        pool = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="smart-pdf-md")
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        file_handler = _log_file_handler()
+        log_queue = None
+        if file_handler is not None:
+            log_queue = ctx.Queue()
+            listener = logging.handlers.QueueListener(log_queue, file_handler)
+            listener.start()
+        pool = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=ctx,
+            initializer=_init_pool_worker,
+            # Files are already spread over processes; no nested per-page pools
+            initargs=(
+                {**config_snapshot(), "TEXT_WORKERS": 0, "TABLES_WORKERS": 0, "OCR_WORKERS": 1},
+                log_queue,
+            ),
+        )
+    try:
+        with pool:
+            futures = {
+                pool.submit(process_one, f, i, len(files), slice_pages): (i, f)
+                for i, f in enumerate(files, 1)
+            }
+            for fut in as_completed(futures):
+                i, f = futures[fut]
+                try:
+                    results[i] = fut.result()
+                except Exception as e:  # pragma: no cover - safety
+                    log(f"[CRASH] {f}: {e!r}")
+                    results[i] = 10
+    finally:
+        if listener is not None:
+            # Drains the records of the (now exited) workers before returning
+            listener.stop()
+    return results
@@ -0,0 +1,177 @@
+"""Long-lived Marker worker process.
+
+Spawning `marker_single` per slice reloads PyTorch and the Surya models every time.
+This module keeps one Python process alive with Marker's models loaded and serves
+conversion requests over a JSON-lines protocol on stdin/stdout:
+
+- worker -> parent, once on startup: {"ok": true} or {"ok": false, "error": "..."}
+- parent -> worker, per request: {"pdf", "output_dir", "page_range", "images",
+  "lowres_image_dpi", "highres_image_dpi"}
+- worker -> parent, per request: {"ok": true} or {"ok": false, "error": "..."}
+
+Run the server side with `python -m smart_pdf_md.marker_worker`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, TextIO
+
+
+def _reply(out: TextIO, **payload: Any) -> None:
+    out.write(json.dumps(payload) + "\n")
+    out.flush()
+
+
+def serve() -> int:
+    """Load Marker models once, then convert requests read from stdin until EOF."""
+    # Keep Marker/Torch chatter off the protocol channel: replies go to a private copy
+    # of fd 1, and fd 1 itself (used by C extensions and child processes) becomes stderr
+    sys.stdout.flush()
+    out = open(os.dup(1), "w", encoding="utf-8")  # noqa: SIM115
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    try:
+        from marker.config.parser import ConfigParser
+        from marker.models import create_model_dict
+        from marker.output import save_output
+
+        models = create_model_dict()
+    except Exception as e:
+        _reply(out, ok=False, error=repr(e))
+        return 1
+    _reply(out, ok=True)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            req = json.loads(line)
+            parser = ConfigParser(
+                {
+                    "output_format": "markdown",
+                    "output_dir": req["output_dir"],
+                    "page_range": req["page_range"],
+                    "disable_image_extraction": not req.get("images", False),
+                    "lowres_image_dpi": req.get("lowres_image_dpi"),
+                    "highres_image_dpi": req.get("highres_image_dpi"),
+                }
+            )
+            converter_cls = parser.get_converter_cls()
+            converter = converter_cls(
+                config=parser.generate_config_dict(),
+                artifact_dict=models,
+                processor_list=parser.get_processors(),
+                renderer=parser.get_renderer(),
+                llm_service=parser.get_llm_service(),
+            )
+            pdf = req["pdf"]
+            rendered = converter(pdf)
+            save_output(rendered, parser.get_output_folder(pdf), parser.get_base_filename(pdf))
+            _reply(out, ok=True)
+        except Exception as e:
+            _reply(out, ok=False, error=repr(e))
+    return 0
+
+
+class MarkerWorker:
+    """Client handle for a `serve()` child process that keeps Marker models warm."""
+
+    def __init__(self, python: str | None = None, env: dict[str, str] | None = None) -> None:
+        env = dict(env) if env is not None else os.environ.copy()
+        # Make this package importable in the child even when running from a checkout
+        pkg_root = str(Path(__file__).resolve().parents[1])
+        env["PYTHONPATH"] = pkg_root + (
+            os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else ""
+        )
+        self.proc = subprocess.Popen(  # noqa: S603
+            [python or sys.executable, "-m", "smart_pdf_md.marker_worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            env=env,
+        )
+        # Replies are read on a helper thread so `convert` can wait with a deadline
+        self._lines: queue.Queue[str] = queue.Queue()
+        threading.Thread(target=self._pump, name="marker-worker-reader", daemon=True).start()
+        ready = self._read()
+        if not ready.get("ok"):
+            self.close()
+            raise RuntimeError(ready.get("error") or "marker worker failed to start")
+
+    def _pump(self) -> None:
+        assert self.proc.stdout is not None
+        for line in self.proc.stdout:
+            self._lines.put(line)
+        self._lines.put("")
+
+    def _read(self, timeout: float | None = None) -> dict[str, Any]:
+        """Next protocol reply; stray non-JSON output lines are passed on to stderr."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+                line = self._lines.get(timeout=wait)
+            except queue.Empty:
+                self.proc.kill()
+                self.proc.wait()
+                raise TimeoutError(f"marker worker timed out after {timeout:g}s") from None
+            if not line:
+                raise RuntimeError(f"marker worker exited (rc={self.proc.poll()})")
+            try:
+                resp = json.loads(line)
+            except ValueError:
+                resp = None
+            if isinstance(resp, dict):
+                return resp
+            sys.stderr.write(line)
+
+    def convert(
+        self,
+        pdf: str,
+        outdir: str | Path,
+        page_range: str | None,
+        *,
+        images: bool,
+        lowres: int,
+        highres: int,
+        timeout: float | None = None,
+    ) -> tuple[bool, str | None]:
+        """Convert `page_range` of `pdf` (None = all pages); return `(ok, error)`.
+
+        A `timeout` (seconds) kills the worker and raises TimeoutError when no reply
+        arrives in time; the handle is unusable afterwards.
+        """
+        assert self.proc.stdin is not None
+        req = {
+            "pdf": str(pdf),
+            "output_dir": str(outdir),
+            "page_range": page_range,
+            "images": images,
+            "lowres_image_dpi": lowres,
+            "highres_image_dpi": highres,
+        }
+        self.proc.stdin.write(json.dumps(req) + "\n")
+        self.proc.stdin.flush()
+        resp = self._read(timeout)
+        return bool(resp.get("ok")), resp.get("error")
+
+    def close(self) -> None:
+        """Stop the worker (EOF on stdin), killing it if it does not exit promptly."""
+        try:
+            if self.proc.stdin:
+                self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+        except Exception:
+            self.proc.kill()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(serve())
@@ -0,0 +1,149 @@
+import os
+import shutil
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from smart_pdf_md import core
+from smart_pdf_md.cli import main
+
+
+@pytest.fixture
+def run_cli(capsys: pytest.CaptureFixture[str]) -> Callable[..., subprocess.CompletedProcess]:
+    """Run `python -m smart_pdf_md ARGS` and return a `CompletedProcess`.
+
+    Calls are served in-process by `cli.main` (restoring config and environment
+    afterwards), which skips an interpreter start and re-import per test. Calls that
+    pass `env` (read by `core` at import) and runs with SMART_PDF_MD_TEST_INPROC=0
+    spawn a real subprocess instead.
+    """
+
+    def run(args: list[str], *, env: dict | None = None) -> subprocess.CompletedProcess:
+        cmd = [sys.executable, "-m", "smart_pdf_md"] + args
+        if env or os.environ.get("SMART_PDF_MD_TEST_INPROC", "1") == "0":
+            proc_env = os.environ.copy()
+            if env:
+                proc_env.update(env)
+            return subprocess.run(cmd, env=proc_env, capture_output=True, text=True)
+        snapshot = core.config_snapshot()
+        environ = os.environ.copy()
+        capsys.readouterr()
+        try:
+            rc = main(list(args))
+        except SystemExit as e:
+            rc = e.code if isinstance(e.code, int) else 1
+        finally:
+            core.restore_config(snapshot)
+            os.environ.clear()
+            os.environ.update(environ)
+        out, err = capsys.readouterr()
+        return subprocess.CompletedProcess(cmd, rc, out, err)
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def on_path() -> Callable[..., bool]:
+    """Return `on_path(*names)`: True if any name (or `name.exe`) is in a PATH directory.
+
+    PATH is listed once per session instead of `shutil.which` stat-probing every
+    directory (and PATHEXT variant) for each name in each test.
+    """
+    names: set[str] = set()
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            names.update(os.listdir(d or "."))
+        except OSError:
+            pass
+    if sys.platform == "win32":
+        names = {n.lower() for n in names}
+
+    def check(*exes: str) -> bool:
+        if sys.platform == "win32":
+            exes = tuple(x.lower() for x in exes)
+        return any(x in names or x + ".exe" in names for x in exes)
+
+    return check
+
+
+def _place(template: Path, dst: Path) -> Path:
+    # Inputs are never modified by conversions, so a hard link is as good as a copy
+    try:
+        os.link(template, dst)
+    except OSError:
+        shutil.copyfile(template, dst)
+    return dst
+
+
+@pytest.fixture(scope="session")
+def text_pdf_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One-page text PDF built once per session (skips when PyMuPDF is missing)."""
+    fitz = pytest.importorskip("fitz")
+    path = tmp_path_factory.mktemp("tpl") / "text.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Hello Engines", fontsize=12)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def lattice_pdf_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One-page PDF with a ruled 2x2 grid for camelot's lattice mode."""
+    fitz = pytest.importorskip("fitz")
+    path = tmp_path_factory.mktemp("tpl") / "lattice.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.draw_line((72, 120), (300, 120))
+    page.draw_line((72, 160), (300, 160))
+    page.draw_line((72, 200), (300, 200))
+    page.draw_line((72, 120), (72, 200))
+    page.draw_line((186, 120), (186, 200))
+    page.draw_line((300, 120), (300, 200))
+    page.insert_text((80, 110), "H1  H2", fontsize=12)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def blank_pdf_template(tmp_path_factory: pytest.TempPathFactory) -> Callable[[int], Path]:
+    """Return `template(pages)`: a blank PDF with that many pages, built once per count."""
+    fitz = pytest.importorskip("fitz")
+    root = tmp_path_factory.mktemp("tpl")
+    built: dict[int, Path] = {}
+
+    def template(pages: int) -> Path:
+        if pages not in built:
+            path = root / f"blank{pages}.pdf"
+            doc = fitz.open()
+            for _ in range(pages):
+                doc.new_page()
+            doc.save(path)
+            doc.close()
+            built[pages] = path
+        return built[pages]
+
+    return template
+
+
+@pytest.fixture
+def text_pdf(tmp_path: Path, text_pdf_template: Path) -> Callable[[str], Path]:
+    """Place the session text PDF in `tmp_path` under the given file name."""
+    return lambda name: _place(text_pdf_template, tmp_path / name)
+
+
+@pytest.fixture
+def lattice_pdf(tmp_path: Path, lattice_pdf_template: Path) -> Callable[[str], Path]:
+    """Place the session lattice PDF in `tmp_path` under the given file name."""
+    return lambda name: _place(lattice_pdf_template, tmp_path / name)
+
+
+@pytest.fixture
+def blank_pdf(tmp_path: Path, blank_pdf_template: Callable[[int], Path]) -> Callable[..., Path]:
+    """Place a session blank PDF of `pages` pages in `tmp_path` under the given name."""
+    return lambda name, pages=1: _place(blank_pdf_template(pages), tmp_path / name)
@@ -4,26 +4,6 @@ import sys
 from pathlib import Path
 
 
-def ensure_pymupdf():
-    try:
-        import importlib.util  # noqa: F401
-
-        if importlib.util.find_spec("fitz") is None:
-            raise ImportError
-    except Exception:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "pymupdf"])  # noqa: S603,S607
-
-
-def make_blank_pdf(path: Path) -> None:
-    ensure_pymupdf()
-    import fitz  # type: ignore
-
-    doc = fitz.open()
-    doc.new_page()
-    doc.save(path)
-    doc.close()
-
-
 def run_batch_args(args: list[str], *, env: dict | None = None) -> subprocess.CompletedProcess:
     cmd = [sys.executable, "-m", "smart_pdf_md"] + args
     proc_env = os.environ.copy()
@@ -36,11 +16,10 @@ def run_batch_args(args: list[str], *, env: dict | None = None) -> subprocess.Co
     return subprocess.run(cmd, env=proc_env, capture_output=True, text=True)
 
 
-def test_cli_flags_mode_out_and_images(tmp_path: Path):
+def test_cli_flags_mode_out_and_images(tmp_path: Path, blank_pdf):
     """CLI flags should map to env and allow forcing marker + outdir + images."""
-    pdf = tmp_path / "c.pdf"
+    pdf = blank_pdf("c.pdf")
     outdir = tmp_path / "cli-out"
-    make_blank_pdf(pdf)
     # Force marker path with mock using CLI flags only
     res = run_batch_args(
         [str(pdf), "40", "--mode", "marker", "--mock", "--out", str(outdir), "--images"], env={}
@@ -49,10 +28,9 @@ def test_cli_flags_mode_out_and_images(tmp_path: Path):
     assert (outdir / "c.md").exists()
 
 
-def test_slice_backoff_with_mock_threshold(tmp_path: Path):
+def test_slice_backoff_with_mock_threshold(tmp_path: Path, blank_pdf):
     """Backoff should halve slice until threshold then succeed (with mock)."""
-    pdf = tmp_path / "d.pdf"
-    make_blank_pdf(pdf)
+    pdf = blank_pdf("d.pdf")
     # Start with large slice, fail slices > 10, expect backoff to <=10 and succeed
     res = run_batch_args(
         [str(pdf), "40"],
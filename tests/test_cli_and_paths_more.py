@@ -3,23 +3,6 @@ import subprocess
 import sys
 from pathlib import Path
 
-import pytest
-
-
-def ensure_pymupdf():
-    pytest.importorskip("fitz")
-
-
-def make_text_pdf(path: Path, text: str = "Hello") -> None:
-    ensure_pymupdf()
-    import fitz  # type: ignore
-
-    doc = fitz.open()
-    page = doc.new_page()
-    page.insert_text((72, 72), text, fontsize=12)
-    doc.save(path)
-    doc.close()
-
 
 def run_script(args: list[str], *, env: dict | None = None) -> subprocess.CompletedProcess:
     cmd = [sys.executable, "-m", "smart_pdf_md"] + args
@@ -50,11 +33,10 @@ def test_single_pass_marker_when_unopenable_pdf(tmp_path: Path):
     assert "MOCK MARKER OUTPUT" in md.read_text(encoding="utf-8")
 
 
-def test_first_nonzero_exitcode_selected(tmp_path: Path):
+def test_first_nonzero_exitcode_selected(tmp_path: Path, text_pdf):
     # Create one fast-path file and one marker-failing file; expect exit=2 from the failing file
-    good = tmp_path / "good.pdf"
+    text_pdf("good.pdf")
     bad = tmp_path / "bad2.pdf"
-    make_text_pdf(good, "Some Text")
     bad.write_bytes(b"%PDF-1.4\n% not actually valid content")  # unopenable -> single-pass
 
     res = run_script(
@@ -68,21 +50,41 @@ def test_first_nonzero_exitcode_selected(tmp_path: Path):
     assert res.returncode in (2, 3)
 
 
-def test_cli_min_chars_and_ratio_force_fast(tmp_path: Path):
+def test_cli_min_chars_and_ratio_force_fast(tmp_path: Path, blank_pdf):
     """CLI min-chars/min-ratio can force fast path on minimal-content PDFs."""
-    pdf = tmp_path / "blank.pdf"
+    # A valid, but effectively blank, PDF
+    pdf = blank_pdf("blank.pdf")
     md = tmp_path / "blank.md"
-    # Create a valid, but effectively blank, PDF
-    ensure_pymupdf()
-    import fitz  # type: ignore
-
-    doc = fitz.open()
-    doc.new_page()
-    doc.save(pdf)
-    doc.close()
     # Heuristic flags should push to fast path even with no text
     res = run_script(
         [str(pdf), "40", "--min-chars", "1", "--min-ratio", "0", "--mode", "auto"], env={}
     )
     assert res.returncode == 0
     assert md.exists()
+
+
+def test_folder_scan_recurses_and_matches_extension_case(tmp_path: Path):
+    """Folder scans find nested PDFs regardless of extension case and ignore other files."""
+    from smart_pdf_md.core import iter_input_files
+
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    top = tmp_path / "top.pdf"
+    deep = tmp_path / "a" / "b" / "deep.PDF"
+    top.write_bytes(b"%PDF-1.4")
+    deep.write_bytes(b"%PDF-1.4")
+    (tmp_path / "a" / "notes.txt").write_text("x", encoding="utf-8")
+    files = list(iter_input_files(tmp_path))
+    assert files == sorted([top, deep])
+
+
+def test_pattern_match_agrees_with_fnmatch():
+    """Compiled include/exclude patterns keep fnmatch semantics on path and name."""
+    from fnmatch import fnmatch
+
+    from smart_pdf_md.core import _pattern_match
+
+    patterns = ["**/Handbooks/*.pdf", "vendor-*.pdf", "[!x]?.pdf"]
+    for rel in ["docs/Handbooks/a.pdf", "x/vendor-1.pdf", "ab.pdf", "xb.pdf", "docs/c.pdf"]:
+        p = Path(rel)
+        expected = any(fnmatch(rel, pat) or fnmatch(p.name, pat) for pat in patterns)
+        assert _pattern_match(p, patterns) == expected, rel
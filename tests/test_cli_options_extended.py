@@ -85,3 +85,55 @@ def test_tables_mode_without_camelot(tmp_path: Path) -> None:
     res = run_cli([str(pdf), "5", "--tables", "--tables-mode", "lattice", "--mock"])
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
     assert (tmp_path / "a.md").exists()
+
+
+def test_resume_skips_existing_outputs(tmp_path: Path) -> None:
+    # An unreadable PDF would fail in --mock-fail mode; resume must skip it before any work
+    pdf = tmp_path / "r.pdf"
+    pdf.write_bytes(b"not real pdf")
+    out = tmp_path / "r.md"
+    out.write_text("previous run", encoding="utf-8")
+    res = run_cli([str(pdf), "5", "--mock", "--mock-fail", "--resume"])
+    assert res.returncode == 0, res.stdout + "\n" + res.stderr
+    assert "[SKIP ]" in res.stdout
+    assert out.read_text(encoding="utf-8") == "previous run"
+
+
+def test_resume_reconverts_stale_outputs(tmp_path: Path) -> None:
+    pdf = tmp_path / "s.pdf"
+    pdf.write_bytes(b"%PDF-1.4 invalid but present")
+    out = tmp_path / "s.md"
+    out.write_text("previous run", encoding="utf-8")
+    # The PDF changed after the previous output was written
+    st = out.stat()
+    os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    res = run_cli([str(pdf), "5", "-m", "marker", "--mock", "--resume"])
+    assert res.returncode == 0, res.stdout + "\n" + res.stderr
+    assert "[SKIP ]" not in res.stdout
+    assert "MOCK MARKER OUTPUT" in out.read_text(encoding="utf-8")
+
+
+def test_exclude_prunes_directory_subtrees(tmp_path: Path, monkeypatch) -> None:
+    from smart_pdf_md import core
+
+    for rel in ("keep/a.pdf", "trash/b.pdf", "trash/deep/c.pdf", "other/trash/d.pdf"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_bytes(b"%PDF-1.4")
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(Path(path).relative_to(tmp_path).as_posix())
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", recording_scandir)
+    monkeypatch.setattr(core, "INCLUDE", [])
+    monkeypatch.setattr(core, "EXCLUDE", ["trash/*", "*.tmp"])
+    files = core.iter_input_files(tmp_path)
+    assert [p.relative_to(tmp_path).as_posix() for p in files] == [
+        "keep/a.pdf",
+        "other/trash/d.pdf",
+    ]
+    assert "trash" not in scanned and "trash/deep" not in scanned
+    # Patterns that do not cover a whole subtree never prune
+    assert core._prune_regex(["*/deep", "*.pdf"]) is None
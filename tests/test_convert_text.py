@@ -0,0 +1,152 @@
+from pathlib import Path
+
+import pytest
+
+from smart_pdf_md import core
+
+
+def make_pdf(path: Path, pages: int) -> None:
+    pytest.importorskip("fitz")
+    import fitz  # type: ignore
+
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page number {i}", fontsize=12)
+    doc.save(path)
+    doc.close()
+
+
+def test_convert_text_parallel_matches_sequential(tmp_path: Path, monkeypatch) -> None:
+    """Pages extracted by TEXT_WORKERS processes are written in document order."""
+    pdf = tmp_path / "doc.pdf"
+    make_pdf(pdf, 9)
+    monkeypatch.setattr(core, "DRY_RUN", False)
+    monkeypatch.setattr(core, "OUTPUT_FORMAT", "md")
+    seq, par = tmp_path / "seq", tmp_path / "par"
+    seq.mkdir()
+    par.mkdir()
+    monkeypatch.setattr(core, "TEXT_WORKERS", 0)
+    assert core.convert_text(str(pdf), seq) == 0
+    monkeypatch.setattr(core, "TEXT_WORKERS", 2)
+    monkeypatch.setattr(core, "TEXT_PARALLEL_MIN_PAGES", 2)
+    assert core.convert_text(str(pdf), par) == 0
+    expected = (seq / "doc.md").read_bytes()
+    assert b"Page number 8" in expected
+    assert (par / "doc.md").read_bytes() == expected
+
+
+def test_convert_text_keeps_previous_output_on_failure(tmp_path: Path, monkeypatch) -> None:
+    pdf = tmp_path / "doc.pdf"
+    make_pdf(pdf, 3)
+    monkeypatch.setattr(core, "DRY_RUN", False)
+    monkeypatch.setattr(core, "OUTPUT_FORMAT", "md")
+    monkeypatch.setattr(core, "TEXT_WORKERS", 0)
+    (tmp_path / "doc.md").write_text("previous", encoding="utf-8")
+    real_page_text = core._page_text
+
+    def page_text(page):
+        if page.number == 2:
+            raise RuntimeError("extraction failed")
+        return real_page_text(page)
+
+    monkeypatch.setattr(core, "_page_text", page_text)
+    with pytest.raises(RuntimeError):
+        core.convert_text(str(pdf), tmp_path)
+    assert (tmp_path / "doc.md").read_text(encoding="utf-8") == "previous"
+    assert not (tmp_path / "doc.md.part").exists()
+    monkeypatch.setattr(core, "_page_text", real_page_text)
+    assert core.convert_text(str(pdf), tmp_path) == 0
+    assert "Page number 2" in (tmp_path / "doc.md").read_text(encoding="utf-8")
+
+
+def test_auto_textual_path_opens_pdf_once(tmp_path: Path, monkeypatch) -> None:
+    """process_one reuses the probed document for fast-path extraction."""
+    pdf = tmp_path / "doc.pdf"
+    make_pdf(pdf, 3)
+    for name, value in (("DRY_RUN", False), ("MODE", "auto"), ("ENGINE", None), ("OUTDIR", None)):
+        monkeypatch.setattr(core, name, value)
+    monkeypatch.setattr(core, "ENGINE_TEXTUAL", None)
+    monkeypatch.setattr(core, "RESUME", False)
+    opened: list[str] = []
+    real_open = core.try_open
+    monkeypatch.setattr(core, "try_open", lambda p: opened.append(p) or real_open(p))
+    probes: list[tuple[bool, int | None]] = []
+    assert core.process_one(pdf, 1, 1, 40, on_probe=probes.append) == 0
+    assert opened == [str(pdf)]
+    assert probes == [(True, 3)]
+    assert "Page number 2" in (tmp_path / "doc.md").read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("engine", ["pypdf", "pdfplumber"])
+def test_page_engines_parallel_match_sequential(tmp_path: Path, monkeypatch, engine) -> None:
+    pytest.importorskip(engine)
+    convert = getattr(core, f"convert_via_{engine}")
+    pdf = tmp_path / "doc.pdf"
+    make_pdf(pdf, 7)
+    monkeypatch.setattr(core, "OUTPUT_FORMAT", "md")
+    seq, par = tmp_path / "seq", tmp_path / "par"
+    seq.mkdir()
+    par.mkdir()
+    monkeypatch.setattr(core, "TEXT_WORKERS", 0)
+    assert convert(str(pdf), seq) == 0
+    monkeypatch.setattr(core, "TEXT_WORKERS", 3)
+    monkeypatch.setattr(core, "TEXT_PARALLEL_MIN_PAGES", 2)
+    assert convert(str(pdf), par) == 0
+    expected = (seq / "doc.md").read_text(encoding="utf-8")
+    assert "Page number 6" in expected
+    assert (par / "doc.md").read_text(encoding="utf-8") == expected
+
+
+def test_pdfminer_streams_same_text_as_extract_text(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("pdfminer.high_level")
+    from pdfminer.high_level import extract_text
+
+    pdf = tmp_path / "doc.pdf"
+    make_pdf(pdf, 3)
+    monkeypatch.setattr(core, "OUTPUT_FORMAT", "md")
+    assert core.convert_via_pdfminer(str(pdf), tmp_path) == 0
+    assert (tmp_path / "doc.md").read_text(encoding="utf-8") == extract_text(str(pdf))
+    assert not (tmp_path / "doc.md.part").exists()
+
+
+def test_parse_page_spec() -> None:
+    assert core._parse_page_spec("1-3,5, 9-", 10) == [0, 1, 2, 4, 8, 9]
+    assert core._parse_page_spec("-2,20", 10) == [0, 1]
+    with pytest.raises(ValueError):
+        core._parse_page_spec("4-2", 10)
+
+
+def test_layout_converts_only_selected_pages(tmp_path: Path, monkeypatch) -> None:
+    import sys
+    import types
+
+    calls: list[list[int] | None] = []
+    fake = types.ModuleType("pymupdf4llm")
+    fake.to_markdown = lambda _doc, pages=None: calls.append(pages) or "md"
+    monkeypatch.setitem(sys.modules, "pymupdf4llm", fake)
+    pdf = tmp_path / "doc.pdf"
+    make_pdf(pdf, 5)
+    monkeypatch.setattr(core, "LAYOUT_PAGES", "2-3")
+    assert core.convert_via_layout(str(pdf), tmp_path) == 0
+    monkeypatch.setattr(core, "LAYOUT_PAGES", "9")
+    assert core.convert_via_layout(str(pdf), tmp_path) == 0
+    monkeypatch.setattr(core, "LAYOUT_PAGES", "")
+    assert core.convert_via_layout(str(pdf), tmp_path) == 0
+    assert calls == [[1, 2], None]
+
+
+def test_write_pages_separators_and_failed_write(tmp_path: Path) -> None:
+    out = tmp_path / "o.md"
+    core._write_pages(out, ["a", "b"], sep=b"\n")
+    assert out.read_bytes() == b"a\nb"
+    core._write_text(out, "whole é")
+    assert out.read_text(encoding="utf-8") == "whole é"
+
+    def broken():
+        yield "partial"
+        raise RuntimeError("extraction failed")
+
+    with pytest.raises(RuntimeError):
+        core._write_pages(out, broken())
+    assert out.read_text(encoding="utf-8") == "whole é"
+    assert not (tmp_path / "o.md.part").exists()
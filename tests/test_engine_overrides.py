@@ -3,6 +3,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 
 def run_cli(args: list[str], *, env: dict | None = None) -> subprocess.CompletedProcess:
     cmd = [sys.executable, "-m", "smart_pdf_md"] + args
@@ -12,35 +14,14 @@ def run_cli(args: list[str], *, env: dict | None = None) -> subprocess.Completed
     return subprocess.run(cmd, env=proc_env, capture_output=True, text=True)
 
 
-def make_text_pdf(path: Path, text: str = "Hello") -> None:
-    import fitz  # type: ignore
-
-    doc = fitz.open()
-    page = doc.new_page()
-    page.insert_text((72, 72), text, fontsize=12)
-    doc.save(path)
-    doc.close()
-
-
-def make_blank_pdf(path: Path) -> None:
-    import fitz  # type: ignore
-
-    doc = fitz.open()
-    doc.new_page()
-    doc.save(path)
-    doc.close()
-
-
-def test_engine_textual_override_fast(tmp_path: Path) -> None:
-    pdf = tmp_path / "t.pdf"
-    make_text_pdf(pdf, "override test")
+def test_engine_textual_override_fast(text_pdf) -> None:
+    pdf = text_pdf("t.pdf")
     res = run_cli([str(pdf), "40"], env={"SMART_PDF_MD_ENGINE_TEXTUAL": "fast"})
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
 
 
-def test_engine_nontextual_override_marker_with_mock(tmp_path: Path) -> None:
-    pdf = tmp_path / "n.pdf"
-    make_blank_pdf(pdf)
+def test_engine_nontextual_override_marker_with_mock(blank_pdf) -> None:
+    pdf = blank_pdf("n.pdf")
     res = run_cli(
         [str(pdf), "40"],
         env={
@@ -49,3 +30,76 @@ def test_engine_nontextual_override_marker_with_mock(tmp_path: Path) -> None:
         },
     )
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
+
+
+def test_engine_outputs_served_from_content_cache(tmp_path: Path, monkeypatch) -> None:
+    from smart_pdf_md import core
+
+    calls: list[str] = []
+
+    def fake_engine(pdf: str, outdir: str) -> int:
+        calls.append(pdf)
+        (Path(outdir) / (Path(pdf).stem + ".md")).write_text("converted", encoding="utf-8")
+        return 0
+
+    monkeypatch.setitem(core._ENGINES, "pdfminer", fake_engine)
+    monkeypatch.setattr(core, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(core, "IMAGES", False)
+    monkeypatch.setattr(core, "TABLES", False)
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.mkdir()
+    b.mkdir()
+    (a / "x.pdf").write_bytes(b"%PDF-1.4 same bytes")
+    (b / "y.pdf").write_bytes(b"%PDF-1.4 same bytes")
+    assert core._run_engine_by_name("pdfminer", str(a / "x.pdf"), a, 5) == 0
+    assert core._run_engine_by_name("pdfminer", str(b / "y.pdf"), b, 5) == 0
+    assert calls == [str(a / "x.pdf")]
+    assert (b / "y.md").read_text(encoding="utf-8") == "converted"
+    # Other options (or other bytes) miss the cache
+    monkeypatch.setattr(core, "OUTPUT_FORMAT", "txt")
+    assert core._run_engine_by_name("pdfminer", str(b / "y.pdf"), b, 5) == 0
+    assert len(calls) == 2
+
+
+def test_content_cache_misses_when_ocr_dpi_changes(tmp_path: Path, monkeypatch) -> None:
+    from smart_pdf_md import core
+
+    calls: list[int] = []
+
+    def fake_ocr(pdf: str, outdir: str) -> int:
+        calls.append(core.OCR_DPI)
+        out = Path(outdir) / (Path(pdf).stem + ".md")
+        out.write_text(f"dpi {core.OCR_DPI}", encoding="utf-8")
+        return 0
+
+    monkeypatch.setitem(core._ENGINES, "easyocr", fake_ocr)
+    monkeypatch.setattr(core, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(core, "IMAGES", False)
+    monkeypatch.setattr(core, "TABLES", False)
+    pdf = tmp_path / "scan.pdf"
+    pdf.write_bytes(b"%PDF-1.4 scan")
+    monkeypatch.setattr(core, "OCR_DPI", 150)
+    assert core._run_engine_by_name("easyocr", str(pdf), tmp_path, 5) == 0
+    monkeypatch.setattr(core, "OCR_DPI", 300)
+    assert core._run_engine_by_name("easyocr", str(pdf), tmp_path, 5) == 0
+    assert calls == [150, 300]
+    assert (tmp_path / "scan.md").read_text(encoding="utf-8") == "dpi 300"
+    # Back at the first DPI the original output is served again
+    monkeypatch.setattr(core, "OCR_DPI", 150)
+    assert core._run_engine_by_name("easyocr", str(pdf), tmp_path, 5) == 0
+    assert calls == [150, 300]
+    assert (tmp_path / "scan.md").read_text(encoding="utf-8") == "dpi 150"
+
+
+def test_fingerprint_reads_each_pdf_once(tmp_path: Path, monkeypatch) -> None:
+    import hashlib
+
+    from smart_pdf_md import core
+
+    pdf = tmp_path / "f.pdf"
+    pdf.write_bytes(b"%PDF-1.4 fingerprint")
+    expected = hashlib.sha256(pdf.read_bytes()).hexdigest()
+    assert core._fingerprint(str(pdf)) == expected
+    monkeypatch.setattr(hashlib, "file_digest", lambda *_a: pytest.fail("hashed twice"))
+    assert core._fingerprint(str(pdf)) == expected
+    assert core._fingerprint(str(tmp_path / "missing.pdf")) is None
@@ -1,28 +1,21 @@
+import importlib
 import os
-import shutil
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
+# Import probes shared by every parametrization (each name is imported at most once)
+_HAVE: dict[str, bool] = {}
 
-def make_text_pdf(path: Path, text: str = "Hello Engines") -> None:
-    import fitz  # type: ignore
 
-    doc = fitz.open()
-    page = doc.new_page()
-    page.insert_text((72, 72), text, fontsize=12)
-    doc.save(path)
-    doc.close()
-
-
-def run_cli(args: list[str], *, env: dict | None = None) -> subprocess.CompletedProcess:
-    cmd = [sys.executable, "-m", "smart_pdf_md"] + args
-    proc_env = os.environ.copy()
-    if env:
-        proc_env.update(env)
-    return subprocess.run(cmd, env=proc_env, capture_output=True, text=True)
+def have(name: str) -> bool:
+    if name not in _HAVE:
+        try:
+            importlib.import_module(name)
+            _HAVE[name] = True
+        except Exception:
+            _HAVE[name] = False
+    return _HAVE[name]
 
 
 @pytest.mark.parametrize(
@@ -46,18 +39,23 @@ def run_cli(args: list[str], *, env: dict | None = None) -> subprocess.Completed
     ],
 )
 def test_engine_matrix_optional(
-    tmp_path: Path, engine: str, imports: list[str], executables: list[str], env_keys: list[str]
+    tmp_path: Path,
+    engine: str,
+    imports: list[str],
+    executables: list[str],
+    env_keys: list[str],
+    run_cli,
+    text_pdf,
+    on_path,
 ) -> None:
-    # Ensure base dependency for generating input
-    pytest.importorskip("fitz")
-
     # Skip when required imports are missing
-    for name in imports:
-        pytest.importorskip(name)
+    missing = [name for name in imports if not have(name)]
+    if missing:
+        pytest.skip(f"missing: {missing}")
 
     # Skip when required executables are missing (any one of the list is enough)
     if executables:
-        if not any(shutil.which(x) for x in executables):
+        if not on_path(*executables):
             pytest.skip(f"required executable(s) not available: {executables}")
 
     # Skip when required environment variables are not set
@@ -67,31 +65,19 @@ def test_engine_matrix_optional(
 
     # Special handling for borb/pdfrw: allow fallback to pypdf if primary missing
     if engine in {"borb", "pdfrw"}:
-        have_primary = (
-            shutil.which("borb") is not None
-            if engine == "borb"
-            else shutil.which("pdfrw") is not None
-        )
-        try:
-            __import__("pypdf")
-            have_pypdf = True
-        except Exception:  # pragma: no cover - simple availability gate
-            have_pypdf = False
-        if not have_primary and not have_pypdf:
+        have_primary = on_path(engine)
+        if not have_primary and not have("pypdf"):
             pytest.skip("neither primary package nor pypdf fallback available")
 
-    pdf = tmp_path / "e.pdf"
-    make_text_pdf(pdf, f"Engine {engine} Test")
+    pdf = text_pdf("e.pdf")
     res = run_cli([str(pdf), "40", "-e", engine])
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
     md = tmp_path / "e.md"
     assert md.exists()
 
 
-def test_marker_engine_with_mock(tmp_path: Path) -> None:
-    pytest.importorskip("fitz")
-    pdf = tmp_path / "m.pdf"
-    make_text_pdf(pdf, "Marker Mock Test")
+def test_marker_engine_with_mock(tmp_path: Path, run_cli, text_pdf) -> None:
+    pdf = text_pdf("m.pdf")
     res = run_cli([str(pdf), "40", "-e", "marker"], env={"SMART_PDF_MD_MARKER_MOCK": "1"})
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
     assert (tmp_path / "m.md").exists()
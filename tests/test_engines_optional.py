@@ -1,7 +1,3 @@
-import os
-import shutil
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
@@ -17,14 +13,6 @@ def make_text_pdf(path: Path, text: str = "Hello") -> None:
     doc.close()
 
 
-def run_cli(args: list[str], *, env: dict | None = None) -> subprocess.CompletedProcess:
-    cmd = [sys.executable, "-m", "smart_pdf_md"] + args
-    proc_env = os.environ.copy()
-    if env:
-        proc_env.update(env)
-    return subprocess.run(cmd, env=proc_env, capture_output=True, text=True)
-
-
 @pytest.mark.parametrize(
     "engine, import_name",
     [
@@ -34,40 +22,42 @@ def run_cli(args: list[str], *, env: dict | None = None) -> subprocess.Completed
         ("docling", "docling.document_converter"),
     ],
 )
-def test_python_engine_if_installed(tmp_path: Path, engine: str, import_name: str) -> None:
+def test_python_engine_if_installed(
+    tmp_path: Path, engine: str, import_name: str, run_cli, text_pdf
+) -> None:
     pytest.importorskip(import_name)
-    pdf = tmp_path / "e.pdf"
-    make_text_pdf(pdf, "Engine Test")
+    pdf = text_pdf("e.pdf")
     res = run_cli([str(pdf), "40", "-e", engine])
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
     md = tmp_path / "e.md"
     assert md.exists()
 
 
-def test_poppler_engine_if_available(tmp_path: Path) -> None:
-    if shutil.which("pdftohtml") is None:
+def test_poppler_engine_if_available(tmp_path: Path, run_cli, text_pdf, on_path) -> None:
+    if not on_path("pdftohtml"):
         pytest.skip("pdftohtml not available")
-    pytest.importorskip("markdownify")
-    pdf = tmp_path / "p.pdf"
-    make_text_pdf(pdf, "Poppler Test")
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        pytest.importorskip("markdownify")
+    pdf = text_pdf("p.pdf")
     res = run_cli([str(pdf), "40", "-e", "poppler"])  # writes .md
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
     md = tmp_path / "p.md"
     assert md.exists()
 
 
-def test_ocrmypdf_engine_if_available(tmp_path: Path) -> None:
-    if shutil.which("ocrmypdf") is None:
+def test_ocrmypdf_engine_if_available(tmp_path: Path, run_cli, text_pdf, on_path) -> None:
+    if not on_path("ocrmypdf"):
         pytest.skip("ocrmypdf not available")
-    pdf = tmp_path / "o.pdf"
-    make_text_pdf(pdf, "OCR Test")
+    pdf = text_pdf("o.pdf")
     res = run_cli([str(pdf), "40", "-e", "ocrmypdf"])  # fast path after OCR
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
     md = tmp_path / "o.md"
     assert md.exists()
 
 
-def test_tables_stream_if_installed(tmp_path: Path) -> None:
+def test_tables_stream_if_installed(tmp_path: Path, run_cli) -> None:
     camelot = pytest.importorskip("camelot")  # noqa: F841
     pdf = tmp_path / "t.pdf"
     make_text_pdf(pdf, "A,B\n1,2\n3,4")
@@ -76,26 +66,12 @@ def test_tables_stream_if_installed(tmp_path: Path) -> None:
     # Tables may or may not be detected reliably; just ensure no crash.
 
 
-def test_lattice_engine_alias_if_installed(tmp_path: Path) -> None:
+def test_lattice_engine_alias_if_installed(tmp_path: Path, run_cli, lattice_pdf, on_path) -> None:
     camelot = pytest.importorskip("camelot")  # noqa: F841
     # Ghostscript is required for lattice; skip if not present
-    if shutil.which("gs") is None and shutil.which("gswin64c") is None:
+    if not on_path("gs", "gswin64c"):
         pytest.skip("Ghostscript not available for lattice mode")
-    pdf = tmp_path / "l.pdf"
-    # Draw grid lines to help lattice detection
-    import fitz  # type: ignore
-
-    doc = fitz.open()
-    page = doc.new_page()
-    page.draw_line((72, 120), (300, 120))
-    page.draw_line((72, 160), (300, 160))
-    page.draw_line((72, 200), (300, 200))
-    page.draw_line((72, 120), (72, 200))
-    page.draw_line((186, 120), (186, 200))
-    page.draw_line((300, 120), (300, 200))
-    page.insert_text((80, 110), "H1  H2", fontsize=12)
-    doc.save(pdf)
-    doc.close()
+    pdf = lattice_pdf("l.pdf")
     res = run_cli([str(pdf), "40", "-e", "lattice", "--tables"])
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
     # Prefer that a tables file was generated; tolerate absence (layout-dependent)
@@ -104,8 +80,15 @@ def test_lattice_engine_alias_if_installed(tmp_path: Path) -> None:
         pytest.xfail("lattice tables not detected; environment-dependent")
 
 
-def test_engine_env_override_fast(tmp_path: Path) -> None:
-    pdf = tmp_path / "env.pdf"
-    make_text_pdf(pdf, "Env Engine Test")
+def test_engine_env_override_fast(tmp_path: Path, run_cli, text_pdf) -> None:
+    pdf = text_pdf("env.pdf")
     res = run_cli([str(pdf), "40"], env={"SMART_PDF_MD_ENGINE": "fast"})
     assert res.returncode == 0, res.stdout + "\n" + res.stderr
+
+
+def test_every_cli_engine_is_dispatchable() -> None:
+    from smart_pdf_md import cli, core
+
+    action = next(a for a in cli.build_parser()._actions if a.dest == "engine")
+    special = {"auto", "marker", "lattice"}
+    assert set(action.choices) - special <= set(core._ENGINES)
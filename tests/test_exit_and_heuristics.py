@@ -4,27 +4,6 @@ import sys
 from pathlib import Path
 
 
-def ensure_pymupdf():
-    try:
-        import importlib.util  # noqa: F401
-
-        if importlib.util.find_spec("fitz") is None:
-            raise ImportError
-    except Exception:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "pymupdf"])  # noqa: S603,S607
-
-
-def make_blank_pdf(path: Path, pages: int = 1) -> None:
-    ensure_pymupdf()
-    import fitz  # type: ignore
-
-    doc = fitz.open()
-    for _ in range(pages):
-        doc.new_page()
-    doc.save(path)
-    doc.close()
-
-
 def run_script(args: list[str], *, env: dict | None = None) -> subprocess.CompletedProcess:
     cmd = [sys.executable, "-m", "smart_pdf_md"] + args
     proc_env = os.environ.copy()
@@ -44,11 +23,10 @@ def test_nonexistent_input_exit1(tmp_path: Path):
     assert res.returncode == 1
 
 
-def test_heuristics_force_fast_on_blank_pdf(tmp_path: Path):
+def test_heuristics_force_fast_on_blank_pdf(tmp_path: Path, blank_pdf):
     """CLI/env heuristics can force fast path even on blank PDFs."""
-    pdf = tmp_path / "blank.pdf"
+    pdf = blank_pdf("blank.pdf")
     md = tmp_path / "blank.md"
-    make_blank_pdf(pdf)
     # Default heuristic would route to marker; lower the ratio to 0 to force "textual"
     res = run_script(
         [str(pdf), "40"],
@@ -61,10 +39,9 @@ def test_heuristics_force_fast_on_blank_pdf(tmp_path: Path):
     assert md.exists(), "Fast path should write an md even for blank (empty content)"
 
 
-def test_min_slice_failure_exit2(tmp_path: Path):
+def test_min_slice_failure_exit2(blank_pdf):
     """When mock enforces failure above threshold, min-slice failure yields exit code 2."""
-    pdf = tmp_path / "scan.pdf"
-    make_blank_pdf(pdf, pages=7)
+    pdf = blank_pdf("scan.pdf", pages=7)
     # With mock, fail any slice > 4; initial slice 5 triggers min-slice failure when cur=5
     res = run_script(
         [str(pdf), "5"],
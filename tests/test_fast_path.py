@@ -6,12 +6,8 @@ from pathlib import Path
 import pytest
 
 
-def ensure_pymupdf():
-    pytest.importorskip("fitz")
-
-
 def make_text_pdf(path: Path, text: str = "Hello from smart-pdf-md") -> None:
-    ensure_pymupdf()
+    pytest.importorskip("fitz")
     import fitz  # type: ignore
 
     doc = fitz.open()
@@ -64,3 +60,19 @@ def test_directory_fast_path(tmp_path: Path):
     assert md1.exists() and md2.exists(), "Markdown outputs missing"
     assert "Alpha" in md1.read_text(encoding="utf-8")
     assert "Charlie" in md2.read_text(encoding="utf-8")
+
+
+def test_root_entry_script_smoke(tmp_path: Path):
+    """`python smart-pdf-md.py` runs from a checkout without PYTHONPATH or installation."""
+    pdf = tmp_path / "root.pdf"
+    make_text_pdf(pdf, "Root script")
+    script = Path(__file__).resolve().parents[1] / "smart-pdf-md.py"
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    result = subprocess.run(
+        [sys.executable, str(script), str(pdf), "40", "-m", "fast"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, f"script failed: {result.stdout}\n{result.stderr}"
+    assert "Root script" in (tmp_path / "root.md").read_text(encoding="utf-8")
@@ -0,0 +1,65 @@
+import sys
+import types
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from smart_pdf_md import core
+
+TEI = b"""<?xml version="1.0" encoding="UTF-8"?>
+<TEI xmlns="http://www.tei-c.org/ns/1.0">
+  <teiHeader><fileDesc><titleStmt><title>T</title></titleStmt></fileDesc></teiHeader>
+  <text><body>
+    <div><head>Intro</head><p>First <ref type="bibr">[1]</ref> paragraph.</p></div>
+    <div><p>Second \xc3\xa9t\xc3\xa9 paragraph.</p></div>
+  </body></text>
+</TEI>
+"""
+
+
+class _Response:
+    status_code = 200
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size: int = 1):
+        for i in range(0, len(TEI), 7):
+            yield TEI[i : i + 7]
+
+
+def test_tei_paragraphs_match_findall(tmp_path: Path) -> None:
+    path = tmp_path / "x.tei.xml"
+    path.write_bytes(TEI)
+    ns = {"tei": "http://www.tei-c.org/ns/1.0"}
+    expected = ["".join(p.itertext()).strip() for p in ET.parse(path).findall(".//tei:p", ns)]
+    assert core._tei_paragraphs(ET.iterparse(path, events=("start", "end"))) == expected
+    assert expected[0] == "First [1] paragraph."
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.posts = 0
+
+    def post(self, *_args, **kwargs) -> _Response:
+        assert kwargs.get("stream") is True
+        self.posts += 1
+        return _Response()
+
+
+def test_grobid_streams_tei_and_writes_markdown(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "requests", types.ModuleType("requests"))
+    session = _Session()
+    monkeypatch.setattr(core, "_GROBID_SESSION", session)
+    monkeypatch.setenv("GROBID_URL", "http://grobid.invalid")
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    assert core.convert_via_grobid(str(pdf), tmp_path) == 0
+    assert (tmp_path / "paper.tei.xml").read_bytes() == TEI
+    md = (tmp_path / "paper.md").read_text(encoding="utf-8")
+    assert md == "First [1] paragraph.\n\nSecond été paragraph."
+    # A second PDF reuses the same keep-alive session
+    assert core.convert_via_grobid(str(pdf), tmp_path) == 0
+    assert session.posts == 2 and core._grobid_session() is session
@@ -0,0 +1,93 @@
+import pytest
+
+from smart_pdf_md import core
+
+
+class _Boom:
+    def __str__(self) -> str:  # pragma: no cover - must never be called
+        raise AssertionError("formatted a filtered message")
+
+
+def test_log_interpolates_lazily(capsys: pytest.CaptureFixture[str], monkeypatch) -> None:
+    monkeypatch.setattr(core, "LOG_LEVEL", 20)
+    monkeypatch.setattr(core, "LOG_JSON", False)
+    monkeypatch.setattr(core, "LOG_FILE", None)
+    core.log("[OK   ] pages %d-%d in %.2fs", args=(0, 4, 1.5))
+    core.log("[dbg  ] %s", args=(_Boom(),), level="DEBUG")
+    core.log("100% literal")
+    assert capsys.readouterr().out.splitlines() == ["[OK   ] pages 0-4 in 1.50s", "100% literal"]
+
+
+def test_log_json_mirrors_to_rotating_file(tmp_path, capsys, monkeypatch) -> None:
+    import json
+
+    log_file = tmp_path / "run.log"
+    monkeypatch.setattr(core, "LOG_LEVEL", 20)
+    monkeypatch.setattr(core, "LOG_JSON", True)
+    monkeypatch.setattr(core, "LOG_FILE", str(log_file))
+    monkeypatch.setattr(core, "LOG_FILE_MAX_BYTES", 200)
+    monkeypatch.setattr(core, "LOG_FILE_ROLLOVER_CHECK", 1)
+    try:
+        for i in range(5):
+            core.log("[WARN ] line %d", args=(i,), level="WARNING")
+    finally:
+        core.set_config(log_json=False, log_file="")
+        core.log("[info ] back to plain")
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[0])["level"] == "WARNING"
+    assert [json.loads(x)["message"] for x in lines[:5]] == [f"[WARN ] line {i}" for i in range(5)]
+    assert lines[-1] == "[info ] back to plain"
+    assert (tmp_path / "run.log.1").exists()
+    mirrored = (tmp_path / "run.log.1").read_text(encoding="utf-8")
+    mirrored += log_file.read_text(encoding="utf-8")
+    assert '"message": "[WARN ] line 4"' in mirrored
+
+
+def test_log_file_is_buffered_until_warning(tmp_path, monkeypatch) -> None:
+    log_file = tmp_path / "run.log"
+    monkeypatch.setattr(core, "LOG_LEVEL", 20)
+    monkeypatch.setattr(core, "LOG_JSON", False)
+    monkeypatch.setattr(core, "LOG_FILE", str(log_file))
+    try:
+        core.log("[PROG ] 10%")
+        assert not log_file.exists() or log_file.read_text(encoding="utf-8") == ""
+        core.log("[WARN ] slow page", level="WARNING")
+        assert log_file.read_text(encoding="utf-8").splitlines() == [
+            "[PROG ] 10%",
+            "[WARN ] slow page",
+        ]
+    finally:
+        core.set_config(log_file="")
+        core.log("[info ] done")
+
+
+def test_log_level_stays_positional(capsys: pytest.CaptureFixture[str], monkeypatch) -> None:
+    monkeypatch.setattr(core, "LOG_LEVEL", 30)
+    monkeypatch.setattr(core, "LOG_JSON", False)
+    monkeypatch.setattr(core, "LOG_FILE", None)
+    core.log("[info ] hidden", "INFO")
+    core.log("[WARN ] shown", "WARNING")
+    assert capsys.readouterr().out.splitlines() == ["[WARN ] shown"]
+
+
+def test_log_file_written_only_by_parent_with_jobs(tmp_path, text_pdf) -> None:
+    """Pool workers send LOG_FILE records to the parent instead of opening the file."""
+    import json
+
+    for name in ("a", "b", "c", "d"):
+        text_pdf(f"{name}.pdf")
+    log_file = tmp_path / "run.log"
+    snapshot = core.config_snapshot()
+    try:
+        core.set_config(mode="fast", log_file=str(log_file), log_json=True)
+        files = sorted(tmp_path.glob("*.pdf"))
+        assert core.process_many(files, 5, 2) == {1: 0, 2: 0, 3: 0, 4: 0}
+        core._flush_log()
+        records = [json.loads(x) for x in log_file.read_text(encoding="utf-8").splitlines()]
+    finally:
+        core.restore_config(snapshot)
+        core.log("[info ] done")
+    messages = [r["message"] for r in records]
+    assert messages[0] == "[pool ] jobs=2"
+    for name in ("a", "b", "c", "d"):
+        assert sum(m.startswith("[TEXT ]") and f"{name}.pdf" in m for m in messages) == 1
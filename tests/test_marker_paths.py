@@ -4,26 +4,6 @@ import sys
 from pathlib import Path
 
 
-def ensure_pymupdf():
-    try:
-        import importlib.util  # noqa: F401
-
-        if importlib.util.find_spec("fitz") is None:
-            raise ImportError
-    except Exception:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "pymupdf"])  # noqa: S603,S607
-
-
-def make_blank_pdf(path: Path) -> None:
-    ensure_pymupdf()
-    import fitz  # type: ignore
-
-    doc = fitz.open()
-    doc.new_page()  # no text content
-    doc.save(path)
-    doc.close()
-
-
 def run_batch(
     input_path: Path, *, env: dict | None = None, slice_pages: int = 40
 ) -> subprocess.CompletedProcess:
@@ -38,11 +18,10 @@ def run_batch(
     return subprocess.run(cmd, env=proc_env, capture_output=True, text=True)
 
 
-def test_auto_routes_to_marker_with_mock(tmp_path: Path):
+def test_auto_routes_to_marker_with_mock(tmp_path: Path, blank_pdf):
     """Auto routing should select marker for blank PDFs (with mock)."""
-    pdf = tmp_path / "scanned.pdf"
+    pdf = blank_pdf("scanned.pdf")
     md = tmp_path / "scanned.md"
-    make_blank_pdf(pdf)
 
     result = run_batch(pdf, env={"SMART_PDF_MD_MARKER_MOCK": "1"})
 
@@ -51,11 +30,10 @@ def test_auto_routes_to_marker_with_mock(tmp_path: Path):
     assert "MOCK MARKER OUTPUT" in md.read_text(encoding="utf-8")
 
 
-def test_forced_marker_mode_with_mock(tmp_path: Path):
+def test_forced_marker_mode_with_mock(tmp_path: Path, blank_pdf):
     """Forced marker mode via env should call marker path (with mock)."""
-    pdf = tmp_path / "forced.pdf"
+    pdf = blank_pdf("forced.pdf")
     md = tmp_path / "forced.md"
-    make_blank_pdf(pdf)
 
     result = run_batch(pdf, env={"SMART_PDF_MD_MODE": "marker", "SMART_PDF_MD_MARKER_MOCK": "1"})
 
@@ -0,0 +1,178 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+FAKE_MARKER = {
+    "marker/__init__.py": "",
+    "marker/config/__init__.py": "",
+    "marker/models.py": """
+        import os
+
+        def create_model_dict():
+            # Stray output on fd 1 (Python and native) must not break the protocol
+            print("loading models")
+            os.write(1, b"native chatter\\n")
+            with open(os.environ["FAKE_MARKER_LOADS"], "a", encoding="utf-8") as fh:
+                fh.write("load\\n")
+            return {}
+    """,
+    "marker/config/parser.py": """
+        from pathlib import Path
+
+        class _Converter:
+            def __init__(self, config, **_kw):
+                self.config = config
+
+            def __call__(self, pdf):
+                return self.config["page_range"]
+
+        class ConfigParser:
+            def __init__(self, cli_options):
+                self.opts = cli_options
+
+            def get_converter_cls(self):
+                return _Converter
+
+            def generate_config_dict(self):
+                return self.opts
+
+            def get_processors(self):
+                return None
+
+            def get_renderer(self):
+                return None
+
+            def get_llm_service(self):
+                return None
+
+            def get_output_folder(self, pdf):
+                return self.opts["output_dir"]
+
+            def get_base_filename(self, pdf):
+                return Path(pdf).stem
+    """,
+    "marker/output.py": """
+        from pathlib import Path
+
+        def save_output(rendered, folder, base):
+            out = Path(folder) / (base + ".md")
+            # Like Marker, each call replaces the file it writes
+            with out.open("w", encoding="utf-8") as fh:
+                fh.write(f"pages {rendered}\\n")
+    """,
+}
+
+
+def make_fake_marker(root: Path) -> Path:
+    for rel, src in FAKE_MARKER.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(src), encoding="utf-8")
+    return root
+
+
+def make_blank_pdf(path: Path, pages: int) -> None:
+    pytest.importorskip("fitz")
+    import fitz  # type: ignore
+
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page()
+    doc.save(path)
+    doc.close()
+
+
+def run_cli(args: list[str], *, extra_path: Path) -> subprocess.CompletedProcess:
+    cmd = [sys.executable, "-m", "smart_pdf_md"] + args
+    proc_env = os.environ.copy()
+    root = Path(__file__).resolve().parents[1]
+    proc_env["PYTHONPATH"] = os.pathsep.join(
+        [str(root / "src"), str(extra_path)]
+        + ([proc_env["PYTHONPATH"]] if proc_env.get("PYTHONPATH") else [])
+    )
+    proc_env["SMART_PDF_MD_MARKER_MOCK"] = "0"
+    proc_env["FAKE_MARKER_LOADS"] = str(extra_path / "loads.txt")
+    return subprocess.run(cmd, env=proc_env, capture_output=True, text=True)
+
+
+def test_marker_worker_loads_models_once(tmp_path: Path) -> None:
+    """All slices go through one worker process that loads models a single time."""
+    fake = make_fake_marker(tmp_path / "fake")
+    pdf = tmp_path / "scan.pdf"
+    make_blank_pdf(pdf, pages=12)
+    res = run_cli([str(pdf), "5", "-m", "marker", "--marker-worker"], extra_path=fake)
+    assert res.returncode == 0, res.stdout + "\n" + res.stderr
+    assert (fake / "loads.txt").read_text(encoding="utf-8").count("load") == 1
+    out = (tmp_path / "scan.md").read_text(encoding="utf-8")
+    assert [x for x in out.splitlines() if x] == ["pages 0-4", "pages 5-9", "pages 10-11"]
+
+
+def test_marker_worker_read_skips_non_json_lines() -> None:
+    import queue
+
+    from smart_pdf_md.marker_worker import MarkerWorker
+
+    worker = object.__new__(MarkerWorker)
+    worker._lines = queue.Queue()
+    for line in ("progress 50%\n", "[1, 2]\n", '{"ok": true}\n'):
+        worker._lines.put(line)
+    assert worker._read(timeout=5) == {"ok": True}
+
+
+def test_run_marker_relays_output_and_honors_timeout(monkeypatch) -> None:
+    from smart_pdf_md import core
+
+    lines: list[str] = []
+    monkeypatch.setattr(core, "log", lambda msg, level="INFO", args=(): lines.append(msg % args))
+    script = "print('10%\\r50%\\r100%'); print('done', flush=True)"
+    assert core._run_marker([sys.executable, "-c", script]) == 0
+    assert lines == ["[mark ] 100%", "[mark ] done"]
+    monkeypatch.setattr(core, "MARKER_TIMEOUT", 1)
+    assert core._run_marker([sys.executable, "-c", "import time; time.sleep(30)"]) == 124
+    assert lines[-1] == "[WARN ] marker timed out after 1s"
+
+
+def test_marker_worker_timeout_kills_and_respawns(tmp_path: Path, monkeypatch) -> None:
+    """A stuck worker request is killed (rc 124) and the next request gets a new worker."""
+    from smart_pdf_md import core
+
+    fake = make_fake_marker(tmp_path / "fake")
+    (fake / "marker/output.py").write_text(
+        "import time\n\ndef save_output(rendered, folder, base):\n    time.sleep(30)\n",
+        encoding="utf-8",
+    )
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(fake)
+    env["FAKE_MARKER_LOADS"] = str(fake / "loads.txt")
+    monkeypatch.setattr(core, "_marker_env", lambda: env)
+    monkeypatch.setattr(core, "MARKER_WORKER", True)
+    monkeypatch.setattr(core, "_MARKER_WORKER_PROC", None)
+    monkeypatch.setattr(core, "log", lambda *a, **_kw: None)
+    monkeypatch.setattr(core, "MARKER_TIMEOUT", core.MARKER_TIMEOUT)
+    core.set_config(marker_timeout=1)
+    assert core._marker_via_worker("a.pdf", tmp_path, "0-1") == 124
+    assert core._MARKER_WORKER_PROC is None
+    assert core._marker_via_worker("a.pdf", tmp_path, "0-1") == 124
+    assert (fake / "loads.txt").read_text(encoding="utf-8").count("load") == 2
+
+
+def test_run_marker_timeout_kills_grandchildren(tmp_path: Path, monkeypatch) -> None:
+    """A grandchild holding the output pipe does not stretch MARKER_TIMEOUT."""
+    import time
+
+    from smart_pdf_md import core
+
+    monkeypatch.setattr(core, "log", lambda *a, **_kw: None)
+    monkeypatch.setattr(core, "MARKER_TIMEOUT", 1)
+    script = (
+        "import subprocess, sys, time; "
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+        "time.sleep(30)"
+    )
+    t0 = time.monotonic()
+    assert core._run_marker([sys.executable, "-c", script]) == 124
+    assert time.monotonic() - t0 < 4
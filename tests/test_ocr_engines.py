@@ -0,0 +1,250 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+from smart_pdf_md import core
+
+
+def install_fake_doctr(monkeypatch, pages: list[str], calls: list[list[str]]) -> None:
+    class _Result:
+        def __init__(self, batch: list[str]) -> None:
+            self.batch = batch
+
+        def export(self) -> dict:
+            words = lambda text: [{"value": w} for w in text.split()]  # noqa: E731
+            return {"pages": [{"blocks": [{"lines": [{"words": words(p)}]}]} for p in self.batch]}
+
+    def predictor(pretrained: bool = False):
+        def model(batch: list[str]) -> _Result:
+            calls.append(list(batch))
+            return _Result(batch)
+
+        return model
+
+    io = types.ModuleType("doctr.io")
+    io.DocumentFile = types.SimpleNamespace(from_pdf=lambda _pdf: list(pages))
+    models = types.ModuleType("doctr.models")
+    models.ocr_predictor = predictor
+    monkeypatch.setitem(sys.modules, "doctr", types.ModuleType("doctr"))
+    monkeypatch.setitem(sys.modules, "doctr.io", io)
+    monkeypatch.setitem(sys.modules, "doctr.models", models)
+
+
+def test_doctr_batches_pages_in_order(tmp_path: Path, monkeypatch) -> None:
+    pages = [f"page {i} text" for i in range(5)]
+    calls: list[list[str]] = []
+    install_fake_doctr(monkeypatch, pages, calls)
+    monkeypatch.setattr(core, "DOCTR_BATCH", 2)
+    assert core.convert_via_doctr(str(tmp_path / "scan.pdf"), tmp_path) == 0
+    assert calls == [pages[0:2], pages[2:4], pages[4:5]]
+    assert (tmp_path / "scan.md").read_text(encoding="utf-8") == "\n".join(pages)
+
+
+def install_fake_easyocr(monkeypatch, pages: list[str], readers: list[object]) -> None:
+    class Reader:
+        def __init__(self, langs: list[str], gpu: bool = True) -> None:
+            readers.append(self)
+
+        def readtext(self, img, batch_size: int = 1) -> list[tuple]:
+            if not isinstance(img, str):
+                self.warmups = getattr(self, "warmups", 0) + 1  # warm-up array
+                return []
+            assert batch_size == core.EASYOCR_BATCH
+            return [(None, img, 0.9)]
+
+    pdf2image = types.ModuleType("pdf2image")
+    pdf2image.convert_from_path = lambda _pdf, **_kw: list(pages)
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(sys.modules, "PIL", types.ModuleType("PIL"))
+    monkeypatch.setitem(sys.modules, "PIL.Image", types.ModuleType("PIL.Image"))
+    sys.modules["PIL"].Image = sys.modules["PIL.Image"]
+    easyocr = types.ModuleType("easyocr")
+    easyocr.Reader = Reader
+    monkeypatch.setitem(sys.modules, "easyocr", easyocr)
+
+
+def test_easyocr_reader_built_once_per_process(tmp_path: Path, monkeypatch) -> None:
+    readers: list[object] = []
+    install_fake_easyocr(monkeypatch, ["line one", "line two"], readers)
+    monkeypatch.setattr(core, "_EASYOCR_READER", None)
+    monkeypatch.setattr(core, "EASYOCR_BATCH", 16)
+    for name in ("a", "b"):
+        assert core.convert_via_easyocr(str(tmp_path / f"{name}.pdf"), tmp_path) == 0
+    assert len(readers) == 1
+    assert getattr(readers[0], "warmups", 0) == (1 if importlib.util.find_spec("numpy") else 0)
+    assert (tmp_path / "b.md").read_text(encoding="utf-8") == "line one\nline two"
+
+
+def test_easyocr_pages_on_threads_keep_order(tmp_path: Path, monkeypatch) -> None:
+    pages = [f"page {i}" for i in range(7)]
+    install_fake_easyocr(monkeypatch, pages, [])
+    monkeypatch.setattr(core, "_EASYOCR_READER", None)
+    monkeypatch.setattr(core, "OCR_WORKERS", 3)
+    assert core._ocr_workers(len(pages)) == 3 and core._ocr_workers(1) == 1
+    torch_threads: list[int] = []
+    torch = types.ModuleType("torch")
+    torch.set_num_threads = torch_threads.append
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    monkeypatch.setattr(core, "_EASYOCR_TORCH_THREADS", None)
+    monkeypatch.setattr(core, "available_cpus", lambda: 8)
+    assert core.convert_via_easyocr(str(tmp_path / "scan.pdf"), tmp_path) == 0
+    assert (tmp_path / "scan.md").read_text(encoding="utf-8") == "\n".join(pages)
+    # Three concurrent pages share the eight CPUs; set once, not per file
+    assert core.convert_via_easyocr(str(tmp_path / "scan.pdf"), tmp_path) == 0
+    assert torch_threads == [2]
+
+
+def test_rendered_pages_cached_by_content(tmp_path: Path, monkeypatch) -> None:
+    class _Image:
+        def __init__(self, i: int) -> None:
+            self.i = i
+
+        def save(self, path) -> None:
+            Path(path).write_bytes(b"png %d" % self.i)
+
+    renders: list[str] = []
+
+    def convert_from_path(pdf: str, dpi: int = 200, thread_count: int = 1) -> list[_Image]:
+        assert dpi == core.OCR_DPI
+        renders.append(pdf)
+        return [_Image(0), _Image(1)]
+
+    monkeypatch.setattr(core, "CACHE_DIR", str(tmp_path / "cache"))
+    pdf = tmp_path / "scan.pdf"
+    pdf.write_bytes(b"%PDF-1.4 scanned")
+    first = core._render_pages(str(pdf), convert_from_path)
+    second = core._render_pages(str(pdf), convert_from_path)
+    assert [img.i for img in first] == [0, 1]
+    assert [p.read_bytes() for p in second] == [b"png 0", b"png 1"]
+    assert renders == [str(pdf)]
+    monkeypatch.setattr(core, "CACHE_DIR", None)
+    core._render_pages(str(pdf), convert_from_path)
+    assert len(renders) == 2
+
+
+def test_kraken_pages_run_concurrently_with_captured_output(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    import pytest
+
+    if sys.platform == "win32":
+        pytest.skip("fake kraken is a POSIX script")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    kraken = bin_dir / "kraken"
+    kraken.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "img, txt = sys.argv[2], sys.argv[3]\n"
+        "if img.endswith('p1.png'):\n"
+        "    sys.exit('boom on page 1')\n"
+        "open(txt, 'w').write('text ' + open(img).read())\n",
+        encoding="utf-8",
+    )
+    kraken.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+    core._ensure_exec.cache_clear()
+
+    class _Image:
+        def __init__(self, i: int) -> None:
+            self.i = i
+
+        def save(self, path) -> None:
+            Path(path).write_text(f"page{self.i}", encoding="utf-8")
+
+    pdf2image = types.ModuleType("pdf2image")
+    pdf2image.convert_from_path = lambda _pdf, **_kw: [_Image(i) for i in range(3)]
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(sys.modules, "PIL", types.ModuleType("PIL"))
+    sys.modules["PIL"].Image = types.ModuleType("PIL.Image")
+    monkeypatch.setattr(core, "CACHE_DIR", None)
+    monkeypatch.setattr(core, "OCR_WORKERS", 3)
+    warnings: list[str] = []
+    monkeypatch.setattr(
+        core,
+        "log",
+        lambda msg, level="INFO", args=(): warnings.append(msg % args) if level != "INFO" else None,
+    )
+    try:
+        assert core.convert_via_kraken(str(tmp_path / "scan.pdf"), tmp_path) == 0
+    finally:
+        core._ensure_exec.cache_clear()
+    assert (tmp_path / "scan.md").read_text(encoding="utf-8") == "text page0\n\ntext page2"
+    assert warnings == ["[WARN ] kraken page 1 rc=1 boom on page 1"]
+
+
+def test_kraken_batch_input_runs_one_process_per_worker(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    import pytest
+
+    if sys.platform == "win32":
+        pytest.skip("fake kraken is a POSIX script")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "calls.txt"
+    kraken = bin_dir / "kraken"
+    kraken.write_text(
+        f"#!{sys.executable}\n"
+        "import glob, os, sys\n"
+        "if sys.argv[1] == '--help':\n"
+        "    sys.exit(print('  -I, --batch-input TEXT'))\n"
+        f"open({str(calls)!r}, 'a').write(os.environ['OMP_THREAD_LIMIT'] + '\\n')\n"
+        "for img in glob.glob(sys.argv[2]):\n"
+        "    open(img[:-4] + sys.argv[4], 'w').write('text ' + open(img).read())\n",
+        encoding="utf-8",
+    )
+    kraken.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    core._ensure_exec.cache_clear()
+    core._kraken_batch_input.cache_clear()
+
+    class _Image:
+        def __init__(self, i: int) -> None:
+            self.i = i
+
+        def save(self, path) -> None:
+            Path(path).write_text(f"page{self.i}", encoding="utf-8")
+
+    pdf2image = types.ModuleType("pdf2image")
+    pdf2image.convert_from_path = lambda _pdf, **_kw: [_Image(i) for i in range(5)]
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(sys.modules, "PIL", types.ModuleType("PIL"))
+    sys.modules["PIL"].Image = types.ModuleType("PIL.Image")
+    monkeypatch.setattr(core, "CACHE_DIR", None)
+    monkeypatch.setattr(core, "OCR_WORKERS", 2)
+    try:
+        assert core.convert_via_kraken(str(tmp_path / "scan.pdf"), tmp_path) == 0
+    finally:
+        core._ensure_exec.cache_clear()
+        core._kraken_batch_input.cache_clear()
+    out = (tmp_path / "scan.md").read_text(encoding="utf-8")
+    assert out == "\n\n".join(f"text page{i}" for i in range(5))
+    assert calls.read_text(encoding="utf-8").splitlines() == ["1", "1"]
+
+
+def test_easyocr_input_converts_pil_pages_to_rgb_arrays(tmp_path: Path) -> None:
+    import pytest
+
+    np = pytest.importorskip("numpy")
+    image_mod = pytest.importorskip("PIL.Image")
+    gray = image_mod.new("L", (4, 3), color=7)
+    arr = core._easyocr_input(gray)
+    assert isinstance(arr, np.ndarray) and arr.shape == (3, 4, 3)
+    assert core._easyocr_input(tmp_path / "p0.png") == str(tmp_path / "p0.png")
+
+
+def test_kraken_batch_failure_drops_chunk(tmp_path: Path, monkeypatch) -> None:
+    """A kraken binary that cannot be started drops the chunk's pages, not the file."""
+    kraken = tmp_path / "kraken"
+    kraken.write_text("not executable", encoding="utf-8")
+    kraken.chmod(0o644)
+    warnings: list[str] = []
+    monkeypatch.setattr(core, "log", lambda msg, level="INFO", args=(): warnings.append(msg % args))
+    page = tmp_path / "cached.png"
+    page.write_bytes(b"png")
+    texts = core._kraken_batch(str(kraken), tmp_path / "chunk", [(3, page), (4, page)], {})
+    assert texts == [None, None]
+    assert len(warnings) == 1 and warnings[0].startswith("[WARN ] kraken pages 3-4 failed:")
@@ -0,0 +1,140 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def make_text_pdf(path: Path, text: str) -> None:
+    pytest.importorskip("fitz")
+    import fitz  # type: ignore
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), text, fontsize=12)
+    doc.save(path)
+    doc.close()
+
+
+def run_cli(args: list[str], *, env: dict | None = None) -> subprocess.CompletedProcess:
+    cmd = [sys.executable, "-m", "smart_pdf_md"] + args
+    proc_env = os.environ.copy()
+    root = Path(__file__).resolve().parents[1]
+    proc_env["PYTHONPATH"] = str(root / "src") + (
+        os.pathsep + proc_env.get("PYTHONPATH", "") if proc_env.get("PYTHONPATH") else ""
+    )
+    if env:
+        proc_env.update(env)
+    return subprocess.run(cmd, env=proc_env, capture_output=True, text=True)
+
+
+def test_jobs_pool_converts_all_files(tmp_path: Path) -> None:
+    """A multi-file batch with --jobs > 1 should convert every file via the pool."""
+    outdir = tmp_path / "out"
+    for name in ("a", "b", "c"):
+        make_text_pdf(tmp_path / f"{name}.pdf", f"Parallel {name}")
+    res = run_cli([str(tmp_path), "5", "-m", "fast", "-j", "2", "-o", str(outdir)])
+    assert res.returncode == 0, res.stdout + "\n" + res.stderr
+    assert "[pool ] jobs=2" in res.stdout
+    for name in ("a", "b", "c"):
+        assert f"Parallel {name}" in (outdir / f"{name}.md").read_text(encoding="utf-8")
+
+
+def test_jobs_forced_sequential_in_marker_mode(tmp_path: Path) -> None:
+    """Marker mode ignores --jobs and processes files one at a time."""
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.pdf").write_bytes(b"%PDF-1.4 invalid but present")
+    res = run_cli([str(tmp_path), "5", "-m", "marker", "--mock", "-j", "4"])
+    assert res.returncode == 0, res.stdout + "\n" + res.stderr
+    assert "[pool ]" not in res.stdout
+    assert (tmp_path / "a.md").exists() and (tmp_path / "b.md").exists()
+
+
+def test_sequential_auto_batch_with_probe_prefetch(tmp_path: Path) -> None:
+    """Mixed textual/blank batches route correctly when probes are prefetched."""
+    pytest.importorskip("fitz")
+    import fitz  # type: ignore
+
+    for name in ("a", "c"):
+        doc = fitz.open()
+        doc.new_page()
+        doc.save(tmp_path / f"{name}.pdf")
+        doc.close()
+    make_text_pdf(tmp_path / "b.pdf", "Textual page with enough characters")
+    res = run_cli([str(tmp_path), "5", "--mock", "-j", "1"])
+    assert res.returncode == 0, res.stdout + "\n" + res.stderr
+    assert res.stdout.count("NON-TEXTUAL -> marker_single") == 2
+    assert "TEXTUAL -> fast PyMuPDF" in res.stdout
+    assert "MOCK MARKER OUTPUT" in (tmp_path / "a.md").read_text(encoding="utf-8")
+    assert "Textual page" in (tmp_path / "b.md").read_text(encoding="utf-8")
+    assert "MOCK MARKER OUTPUT" in (tmp_path / "c.md").read_text(encoding="utf-8")
+
+
+def test_default_workers_capped(monkeypatch) -> None:
+    from smart_pdf_md import core
+
+    monkeypatch.setattr(core, "available_cpus", lambda: 32)
+    assert core.default_workers() == core.MAX_DEFAULT_WORKERS
+    monkeypatch.setattr(core, "available_cpus", lambda: 2)
+    assert core.default_workers() == 2
+
+
+def test_io_bound_engine_batch_overlaps_on_threads(tmp_path: Path, monkeypatch) -> None:
+    """Subprocess-bound forced engines run files concurrently on threads, not processes."""
+    import threading
+
+    from smart_pdf_md import core
+
+    barrier = threading.Barrier(2, timeout=10)
+
+    def fake_poppler(pdf: str, outdir: str) -> int:
+        barrier.wait()  # only returns if both files are in flight at once
+        return 0
+
+    monkeypatch.setitem(core._ENGINES, "poppler", fake_poppler)
+    monkeypatch.setattr(core, "ENGINE", "poppler")
+    monkeypatch.setattr(core, "TABLES", False)
+    files = []
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.pdf").write_bytes(b"%PDF-1.4\n")
+        files.append(tmp_path / f"{name}.pdf")
+    assert core._io_bound_batch()
+    assert core.process_many(files, 5, 2) == {1: 0, 2: 0}
+
+
+def test_ocrmypdf_batches_stay_on_processes(monkeypatch) -> None:
+    """ocrmypdf reads its output with PyMuPDF, which must not run on concurrent threads."""
+    from smart_pdf_md import core
+
+    monkeypatch.setattr(core, "TABLES", False)
+    for engine in ("ocrmypdf", "ocr"):
+        monkeypatch.setattr(core, "ENGINE", engine)
+        assert not core._io_bound_batch()
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        ([], 1),  # auto mode may route scans to Marker
+        (["-m", "fast"], 3),
+        (["-e", "pypdf"], 3),
+        (["-j", "2"], 2),  # explicit jobs are honored in auto mode
+        (["-m", "marker", "-j", "2"], 1),
+    ],
+)
+def test_default_jobs_follow_marker_reachability(tmp_path: Path, monkeypatch, args, expected):
+    from smart_pdf_md import cli, core
+
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.pdf").write_bytes(b"%PDF-1.4\n")
+    monkeypatch.setattr(core, "available_cpus", lambda: 4)
+    seen: list[int] = []
+    monkeypatch.setattr(cli, "_run_sequential", lambda files, _s: seen.append(1) or {})
+    monkeypatch.setattr(cli, "process_many", lambda files, _s, jobs: seen.append(jobs) or {})
+    snapshot = core.config_snapshot()
+    try:
+        assert cli.main([str(tmp_path), "5", *args]) == 0
+    finally:
+        core.restore_config(snapshot)
+    assert seen == [expected]
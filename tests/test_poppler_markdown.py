@@ -0,0 +1,38 @@
+import pytest
+
+from smart_pdf_md import core
+
+HTML = """<!DOCTYPE html><html><head><title>doc</title>
+<style type="text/css">p {margin:0}</style></head>
+<body bgcolor="#A0A0A0">
+<a name=1></a>First&#160;line<br/>
+<b>Bold</b> and <i>italic</i> <a href="https://example.org">link</a><br/>
+<hr/>
+<a name=2></a><h2>Heading</h2><p>Para   with
+  wrapped text</p><ul><li>one</li><li>two</li></ul>
+<script>ignored()</script>after
+</body></html>"""
+
+
+def test_html_to_markdown_pdftohtml_output() -> None:
+    pytest.importorskip("lxml")
+    assert core._html_to_markdown(HTML) == (
+        "First\xa0line  \n"
+        "**Bold** and *italic* [link](https://example.org)  \n"
+        "\n---\n\n"
+        "## Heading\n\n"
+        "Para with wrapped text\n\n"
+        "- one\n- two\n\n"
+        "after\n"
+    )
+
+
+def test_html2md_defaults_to_markdownify(monkeypatch: pytest.MonkeyPatch) -> None:
+    markdownify = pytest.importorskip("markdownify")
+    monkeypatch.setattr(core, "HTML2MD", "markdownify")
+    to_md = core._html2md_converter()
+    assert to_md.func is markdownify.markdownify
+    assert to_md("<p>a*b_c</p>").strip() == r"a\*b\_c"
+    monkeypatch.setattr(core, "HTML2MD", "lxml")
+    pytest.importorskip("lxml")
+    assert core._html2md_converter() is core._html_to_markdown
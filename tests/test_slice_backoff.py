@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import pytest
+
+from smart_pdf_md import core
+
+
+def test_slice_grows_back_after_successes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """After a failure halves the slice, a success streak restores the requested size."""
+    calls: list[tuple[int, int]] = []
+
+    def fake_slice(pdf: str, outdir: str, start: int, end: int) -> int:
+        calls.append((start, end))
+        return 1 if len(calls) == 1 else 0
+
+    monkeypatch.setattr(core, "marker_slice", fake_slice)
+    monkeypatch.setattr(core, "DRY_RUN", False)
+    rc = core.marker_convert("x.pdf", tmp_path, 20, total=60)
+    assert rc == 0
+    assert calls == [(0, 19), (0, 9), (10, 19), (20, 29), (30, 49), (50, 59)]
+
+
+def test_parallel_ranges_merge_in_page_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """MARKER_PAR ranges back off independently and their Markdown merges in order."""
+    calls: list[tuple[int, int]] = []
+
+    def fake_slice(pdf: str, outdir: str, start: int, end: int) -> int:
+        calls.append((start, end))
+        if end - start + 1 > 5 and start == 10:
+            return 1  # the middle range must halve
+        sub = Path(outdir) / "x"
+        sub.mkdir(exist_ok=True)
+        with (sub / "x.md").open("a", encoding="utf-8") as fh:
+            fh.write(f"[{start}-{end}]")
+        (sub / f"img{start}.png").write_bytes(b"png")
+        return 0
+
+    monkeypatch.setattr(core, "marker_slice", fake_slice)
+    monkeypatch.setattr(core, "DRY_RUN", False)
+    monkeypatch.setattr(core, "MARKER_WORKER", False)
+    monkeypatch.setattr(core, "MARKER_PAR", 3)
+    assert core.marker_convert(str(tmp_path / "x.pdf"), tmp_path, 10, total=27) == 0
+    assert sorted(calls) == [(0, 9), (10, 14), (10, 19), (15, 19), (20, 26)]
+    merged = (tmp_path / "x" / "x.md").read_text(encoding="utf-8")
+    assert merged == "[0-9]\n\n[10-14]\n\n[15-19]\n\n[20-26]"
+    assert (tmp_path / "x" / "img15.png").exists()
+    assert not (tmp_path / ".x.slices").exists()
+
+
+def test_serial_and_parallel_marker_output_identical(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """MARKER_PAR=1 and 2 write the same fresh files, replacing an earlier run's output."""
+
+    def fake_slice(pdf: str, outdir: str, start: int, end: int) -> int:
+        sub = Path(outdir) / "x"
+        sub.mkdir(exist_ok=True)
+        # Like Marker, each run replaces the file it writes
+        (sub / "x.md").write_text(f"[{start}-{end}]", encoding="utf-8")
+        return 0
+
+    monkeypatch.setattr(core, "marker_slice", fake_slice)
+    monkeypatch.setattr(core, "DRY_RUN", False)
+    monkeypatch.setattr(core, "MARKER_WORKER", False)
+    outputs = []
+    for par in (1, 2):
+        outdir = tmp_path / str(par)
+        (outdir / "x").mkdir(parents=True)
+        (outdir / "x" / "x.md").write_text("stale output", encoding="utf-8")
+        monkeypatch.setattr(core, "MARKER_PAR", par)
+        assert core.marker_convert(str(tmp_path / "x.pdf"), outdir, 10, total=27) == 0
+        outputs.append((outdir / "x" / "x.md").read_text(encoding="utf-8"))
+    assert outputs[0] == outputs[1] == "[0-9]\n\n[10-19]\n\n[20-26]"
+
+
+def test_parallel_ranges_stop_on_failed_range(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_slice(pdf: str, outdir: str, start: int, end: int) -> int:
+        if start >= 5:
+            return 1
+        (Path(outdir) / "x.md").write_text(f"[{start}-{end}]", encoding="utf-8")
+        return 0
+
+    monkeypatch.setattr(core, "marker_slice", fake_slice)
+    monkeypatch.setattr(core, "DRY_RUN", False)
+    monkeypatch.setattr(core, "MARKER_WORKER", False)
+    monkeypatch.setattr(core, "MARKER_PAR", 2)
+    assert core.marker_convert(str(tmp_path / "x.pdf"), tmp_path, 5, total=15) == 2
+    # The first range merged before the failure was seen; nothing is left behind
+    assert (tmp_path / "x.md").read_text(encoding="utf-8") == "[0-4]"
+    assert not (tmp_path / ".x.slices").exists()
+
+
+def test_parallel_progress_counts_every_page(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Concurrent ranges share one page counter without losing updates."""
+    progress: list[int] = []
+
+    def fake_slice(pdf: str, outdir: str, start: int, end: int) -> int:
+        (Path(outdir) / "x.md").write_text(f"[{start}-{end}]", encoding="utf-8")
+        return 0
+
+    def fake_log(msg: str, level: str = "INFO", args: tuple = ()) -> None:
+        if msg.startswith("[PROG ]"):
+            progress.append(args[2])
+
+    monkeypatch.setattr(core, "marker_slice", fake_slice)
+    monkeypatch.setattr(core, "log", fake_log)
+    monkeypatch.setattr(core, "DRY_RUN", False)
+    monkeypatch.setattr(core, "PROGRESS", True)
+    monkeypatch.setattr(core, "MARKER_WORKER", False)
+    monkeypatch.setattr(core, "MARKER_PAR", 4)
+    assert core.marker_convert(str(tmp_path / "x.pdf"), tmp_path, 5, total=200) == 0
+    assert sorted(progress) == list(range(5, 205, 5))
@@ -0,0 +1,49 @@
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from smart_pdf_md import core
+
+FAKE_CAMELOT = """
+    class Frame:
+        def __init__(self, page):
+            self.page = page
+
+        def to_markdown(self, index=False):
+            return f"| table on page {self.page} |"
+
+
+    class Table:
+        def __init__(self, page):
+            self.df = Frame(page)
+
+
+    def read_pdf(pdf, pages="all", flavor="stream"):
+        first, last = (int(x) for x in pages.split("-"))
+        return [Table(p) for p in range(first, last + 1) if p % 2]
+"""
+
+
+def test_tables_workers_keep_page_order(tmp_path: Path, monkeypatch) -> None:
+    """Page ranges run in separate processes and tables come back in page order."""
+    pytest.importorskip("fitz")
+    import fitz  # type: ignore
+
+    fake = tmp_path / "fake"
+    fake.mkdir()
+    (fake / "camelot.py").write_text(textwrap.dedent(FAKE_CAMELOT), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(fake))
+    pdf = tmp_path / "t.pdf"
+    doc = fitz.open()
+    for _ in range(7):
+        doc.new_page()
+    doc.save(pdf)
+    doc.close()
+    monkeypatch.setattr(core, "TABLES", True)
+    monkeypatch.setattr(core, "TABLES_WORKERS", 3)
+    core.extract_tables_to_md(str(pdf), tmp_path, flavor="stream")
+    md = (tmp_path / "t.tables.md").read_text(encoding="utf-8")
+    assert [line for line in md.splitlines() if line.startswith("|")] == [
+        f"| table on page {p} |" for p in (1, 3, 5, 7)
+    ]
@@ -0,0 +1,144 @@
+from pathlib import Path
+
+import pytest
+
+from smart_pdf_md import core
+
+
+def make_pdf(path: Path, texts: list[str]) -> None:
+    pytest.importorskip("fitz")
+    import fitz  # type: ignore
+
+    doc = fitz.open()
+    for text in texts:
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text, fontsize=12)
+    doc.save(path)
+    doc.close()
+
+
+def test_sample_page_indices_cover_ends() -> None:
+    assert core._sample_page_indices(5, 16) == [0, 1, 2, 3, 4]
+    assert core._sample_page_indices(100, 0) == list(range(100))
+    idx = core._sample_page_indices(1000, 16)
+    assert len(idx) == 16 and len(set(idx)) == 16
+    assert idx[0] == 0 and idx[-1] == 999
+
+
+def test_is_textual_sampled_matches_full_scan(tmp_path: Path) -> None:
+    """Sampling should agree with a full scan on uniformly textual/blank documents."""
+    textual = tmp_path / "t.pdf"
+    blank = tmp_path / "b.pdf"
+    make_pdf(textual, ["Page with plenty of searchable text"] * 40)
+    make_pdf(blank, [""] * 40)
+    for sample in (0, 4, 16):
+        assert core.is_textual(str(textual), 10, 0.2, sample=sample)
+        assert not core.is_textual(str(blank), 10, 0.2, sample=sample)
+
+
+def test_is_textual_zero_ratio_always_passes(tmp_path: Path) -> None:
+    pdf = tmp_path / "z.pdf"
+    make_pdf(pdf, [""])
+    assert core.is_textual(str(pdf), 10, 0.0)
+
+
+def test_probe_pdf_reports_page_count(tmp_path: Path) -> None:
+    pdf = tmp_path / "p.pdf"
+    make_pdf(pdf, [""] * 7)
+    assert core.probe_pdf(str(pdf), 10, 0.2) == (False, 7)
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+    assert core.probe_pdf(str(bad)) == (False, None)
+
+
+def test_probe_skips_open_without_pdf_header(tmp_path: Path, monkeypatch) -> None:
+    junk = tmp_path / "junk.pdf"
+    junk.write_bytes(b"\x89PNG\r\n" + b"\0" * 2048)
+    monkeypatch.setattr(core, "try_open", lambda _pdf: pytest.fail("opened a non-PDF"))
+    assert core.probe_pdf(str(junk)) == (False, None)
+    assert not core._has_pdf_header(str(tmp_path / "missing.pdf"))
+    prefixed = tmp_path / "prefixed.pdf"
+    prefixed.write_bytes(b"garbage\n%PDF-1.4\n")
+    assert core._has_pdf_header(str(prefixed))
+
+
+def test_probe_caches_page_count_for_marker(tmp_path: Path, monkeypatch) -> None:
+    """marker_convert reuses the probe's page count instead of reopening the PDF."""
+    pdf = tmp_path / "m.pdf"
+    make_pdf(pdf, [""] * 3)
+    core.probe_pdf(str(pdf))
+    monkeypatch.setattr(core, "try_open", lambda _pdf: pytest.fail("reopened PDF"))
+    monkeypatch.setattr(core, "DRY_RUN", False)
+    slices: list[tuple[int, int]] = []
+    monkeypatch.setattr(core, "marker_slice", lambda _p, _o, a, b: slices.append((a, b)) or 0)
+    assert core.marker_convert(str(pdf), tmp_path, 40) == 0
+    assert slices == [(0, 2)]
+
+
+def test_whitespace_table_matches_isspace() -> None:
+    sample = "a b\tc d e　f\n\r\x0bg\x1c"
+    assert len(sample.translate(core._WS_DELETE)) == sum(1 for c in sample if not c.isspace())
+
+
+class _FakePage:
+    def __init__(self, text: str, calls: list[int], idx: int) -> None:
+        self.text, self.calls, self.idx = text, calls, idx
+
+    def get_text(self, *_args, **_kwargs) -> list[tuple]:
+        self.calls.append(self.idx)
+        image = (0, 0, 10, 10, "<image>", 0, 1)
+        return [image, (0, 0, 10, 10, self.text, 1, 0)] if self.text else [image]
+
+
+class _FakeDoc:
+    def __init__(self, texts: list[str]) -> None:
+        self.calls: list[int] = []
+        self.pages = [_FakePage(t, self.calls, i) for i, t in enumerate(texts)]
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __getitem__(self, i: int) -> _FakePage:
+        return self.pages[i]
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize(
+    ("text", "expected", "extracted"),
+    [
+        ("x" * 50, True, 20),  # passes once 20 of 100 pages are textual
+        ("", False, 81),  # fails once 20 textual pages can no longer be reached
+    ],
+)
+def test_is_textual_stops_when_decided(tmp_path, monkeypatch, text, expected, extracted) -> None:
+    pdf = tmp_path / "fake.pdf"
+    pdf.write_bytes(b"%PDF-1.7\n")
+    doc = _FakeDoc([text] * 100)
+    monkeypatch.setattr(core, "try_open", lambda _pdf: doc)
+    assert core.is_textual(str(pdf), 10, 0.2, sample=0) is expected
+    assert len(doc.calls) == extracted
+
+
+def test_page_text_chars_ignores_image_blocks() -> None:
+    page = _FakePage("ab cd\nef", [], 0)
+    assert core._page_text_chars(page, 100) == 6
+    assert core._page_text_chars(_FakePage("", [], 0), 1) == 0
+
+
+def test_probe_verdict_cached_by_content(tmp_path: Path, monkeypatch) -> None:
+    """With a cache dir, a second probe of identical bytes skips the PyMuPDF open."""
+    pdf = tmp_path / "t.pdf"
+    make_pdf(pdf, ["Page with plenty of searchable text"] * 3)
+    monkeypatch.setattr(core, "CACHE_DIR", str(tmp_path / "cache"))
+    assert core.probe_pdf(str(pdf), 10, 0.2) == (True, 3)
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(pdf.read_bytes())
+    monkeypatch.setattr(core, "try_open", lambda _pdf: pytest.fail("reopened PDF"))
+    assert core.probe_pdf(str(copy), 10, 0.2) == (True, 3)
+    assert core._page_count(str(copy)) == 3
+    # Different thresholds are a different verdict
+    with pytest.raises(pytest.fail.Exception):
+        core.probe_pdf(str(copy), 500, 0.2)